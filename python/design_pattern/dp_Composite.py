@@ -15,14 +15,36 @@ Das Composite-Pattern ermöglicht es, Objekte in Baumstrukturen zu organisieren
 implementieren ein gemeinsames Interface, das es dem Client ermöglicht, mit beiden auf die gleiche Weise zu
 interagieren. Dadurch wird die Komplexität reduziert und die Wartbarkeit verbessert.
 
+Zwischengespeicherte Größen:
+Jeder Ordner merkt sich die Gesamtgröße und Dateianzahl seines Teilbaums. Über den Verweis auf den
+Eltern-Ordner wird jede Änderung (hinzufuegen, entfernen, neue Dateigröße) nur entlang des Pfades zur
+Wurzel nachgetragen (O(Tiefe)). Größenabfragen benötigen dadurch keinen rekursiven Durchlauf mehr (O(1)).
+
+Durchlaufen:
+durchlaufen() besucht einen Teilbaum mit einem eigenen Stapel statt mit Rekursion (Pre-Order, Post-Order oder
+Ebene für Ebene, optional mit maximaler Tiefe und Bedingung). Auch sehr tiefe Bäume erreichen so nicht das
+Rekursionslimit. anzeigen() nutzt diesen Durchlauf und schreibt die Zeilen blockweise in einen Ausgabe-Strom.
+
+Beobachter:
+Ein Ordner kann Beobachter registrieren, die bei jedem hinzufuegen, entfernen oder jeder neuen Dateigröße in
+seinem Teilbaum aufgerufen werden. dp_Composite_Index.py hält darüber Pfad- und Abfrage-Indizes aktuell.
+
 Nachteile:
 - Spezielle Eigenschaften der Baumelelemente sind nur erschwert zugänglich.
 - Baumelemente bieten einzelne geerbte Methoden möglicherweise nicht an.
+- entfernen() ist O(Anzahl Geschwister): kinder bleibt eine geordnete Liste, aus der list.remove das Element
+  heraussucht (in C, ohne Python-Vergleiche, da Elemente über ihre Identität gefunden werden).
 """
 
+import sys
+from collections import deque
+
 # Einfaches Composite Pattern Beispiel mit Dateisystem
 # In C# würde man hier ein Interface verwenden: public interface IDateiElement
 
+# Anzahl Zeilen, die anzeigen() sammelt, bevor sie mit einem einzigen write() ausgegeben werden
+ANZEIGE_PUFFER = 1000
+
 # Basis-Klasse für alle Dateisystem-Elemente (Interface-Ersatz in Python)
 # In C# wäre das: public interface IDateiElement oder public abstract class DateiElement
 class DateiElement:
@@ -30,16 +52,82 @@ class DateiElement:
     def __init__(self, name):
         # Name des Dateisystem-Elements speichern
         self.name = name
+        # Verweis auf den übergeordneten Ordner (wird von Ordner.hinzufuegen gesetzt)
+        self.eltern = None
     
     # Basis-Methode um Größe zu berechnen (muss überschrieben werden)
     def get_groesse(self):
         # Standard-Implementierung - wird von Kindklassen überschrieben
         return 0
     
-    # Basis-Methode um Element anzuzeigen (muss überschrieben werden)
-    def anzeigen(self, einrueckung=0):
-        # Standard-Implementierung mit Einrückung für Baumstruktur
-        print("  " * einrueckung + self.name)
+    # Basis-Methode um die Anzahl der Dateien zu berechnen (muss überschrieben werden)
+    def get_anzahl(self):
+        # Standard-Implementierung - wird von Kindklassen überschrieben
+        return 0
+    
+    # Basis-Methode für die Anzeige-Zeile eines Elements (wird von Kindklassen überschrieben)
+    def anzeige_text(self):
+        # Standard-Implementierung - nur der Name
+        return self.name
+    
+    # Durchläuft das Element und alle Nachfahren ohne Rekursion und liefert Paare (element, tiefe)
+    # reihenfolge: "pre" (Ordner vor Inhalt), "post" (Inhalt vor Ordner), "breite" (Ebene für Ebene)
+    # max_tiefe: tiefere Elemente werden nicht besucht; bedingung: nur passende Elemente werden geliefert
+    def durchlaufen(self, reihenfolge="pre", max_tiefe=None, bedingung=None, tiefe=0):
+        if reihenfolge == "breite":
+            # Warteschlange statt Stapel -> Ebene für Ebene
+            warteschlange = deque([(self, tiefe)])
+            while warteschlange:
+                element, element_tiefe = warteschlange.popleft()
+                if bedingung is None or bedingung(element):
+                    yield element, element_tiefe
+                if isinstance(element, Ordner) and (max_tiefe is None or element_tiefe < max_tiefe):
+                    warteschlange.extend((kind, element_tiefe + 1) for kind in element.kinder)
+            return
+        if reihenfolge not in ("pre", "post"):
+            raise ValueError(f"Unbekannte Reihenfolge: {reihenfolge}")
+        # Expliziter Stapel statt Rekursion -> keine Probleme mit dem Rekursionslimit bei tiefen Bäumen
+        # Der dritte Eintrag merkt sich bei "post", ob die Kinder schon auf den Stapel gelegt wurden
+        stapel = [(self, tiefe, False)]
+        while stapel:
+            element, element_tiefe, kinder_besucht = stapel.pop()
+            hat_kinder = isinstance(element, Ordner) and (max_tiefe is None or element_tiefe < max_tiefe)
+            if reihenfolge == "post" and hat_kinder and not kinder_besucht:
+                # Ordner erneut auflegen und erst nach seinen Kindern liefern
+                stapel.append((element, element_tiefe, True))
+                stapel.extend((kind, element_tiefe + 1, False) for kind in reversed(element.kinder))
+                continue
+            if bedingung is None or bedingung(element):
+                yield element, element_tiefe
+            if reihenfolge == "pre" and hat_kinder:
+                # Kinder rückwärts auflegen, damit sie in der richtigen Reihenfolge vom Stapel kommen
+                stapel.extend((kind, element_tiefe + 1, False) for kind in reversed(element.kinder))
+    
+    # Zeigt das Element mit allen Nachfahren an
+    # Alle Zeilen laufen durch einen Puffer und werden blockweise mit einem einzigen write() ausgegeben
+    def anzeigen(self, einrueckung=0, ausgabe=None, max_tiefe=None):
+        ausgabe = ausgabe or sys.stdout
+        if max_tiefe is not None:
+            max_tiefe += einrueckung
+        zeilen = []
+        for element, tiefe in self.durchlaufen("pre", max_tiefe, tiefe=einrueckung):
+            zeilen.append("  " * tiefe + element.anzeige_text())
+            if len(zeilen) >= ANZEIGE_PUFFER:
+                ausgabe.write("\n".join(zeilen) + "\n")
+                zeilen.clear()
+        if zeilen:
+            ausgabe.write("\n".join(zeilen) + "\n")
+    
+    # Berechnet die Größe ohne Zwischenspeicher und ohne Rekursion (Post-Order-Reduktion)
+    # Kinder werden vor ihrem Ordner besucht, daher liegen ihre Summen bereit, wenn der Ordner an der Reihe ist
+    def berechne_groesse(self):
+        summen = {}
+        for element, _ in self.durchlaufen("post"):
+            if isinstance(element, Ordner):
+                summen[element] = sum(summen.pop(kind) for kind in element.kinder)
+            else:
+                summen[element] = element.get_groesse()
+        return summen[self]
 
 # BLATT-Klasse: Datei (hat keine Kinder)
 # Implementiert das Blatt im Composite Pattern
@@ -48,66 +136,152 @@ class Datei(DateiElement):
     def __init__(self, name, groesse):
         # Ruft Basis-Konstruktor auf
         super().__init__(name)
-        # Dateigröße als Instanz-Variable speichern
-        self.groesse = groesse
+        # Dateigröße als Instanz-Variable speichern (Zugriff über die Property groesse)
+        self._groesse = groesse
+    
+    # Property für die Dateigröße - beim Ändern werden die Ordner darüber mitaktualisiert
+    @property
+    def groesse(self):
+        return self._groesse
+    
+    @groesse.setter
+    def groesse(self, wert):
+        # Differenz zur alten Größe an alle übergeordneten Ordner weitergeben (O(Tiefe))
+        differenz = wert - self._groesse
+        self._groesse = wert
+        if self.eltern is not None:
+            self.eltern._aenderung_melden(differenz, 0, "groesse", self)
     
     # Überschreibt get_groesse() - gibt die tatsächliche Dateigröße zurück
     def get_groesse(self):
         # Blatt: gibt einfach seine eigene Größe zurück
-        return self.groesse
+        return self._groesse
     
-    # Überschreibt anzeigen() - zeigt Datei mit Größe an
-    def anzeigen(self, einrueckung=0):
-        # Datei mit Größe und Einrückung anzeigen
-        print("  " * einrueckung + f"📄 {self.name} ({self.groesse} KB)")
+    # Überschreibt get_anzahl() - eine Datei zählt als 1
+    def get_anzahl(self):
+        return 1
+    
+    # Überschreibt anzeige_text() - zeigt Datei mit Größe an
+    def anzeige_text(self):
+        return f"📄 {self.name} ({self._groesse} KB)"
 
 # KNOTEN-Klasse: Ordner (kann Kinder haben - andere Ordner oder Dateien)
 # Implementiert den Composite im Composite Pattern
 class Ordner(DateiElement):
+    # Beobachter, die über Änderungen im Teilbaum informiert werden (z.B. ein BaumIndex)
+    # Als Klassen-Attribut ein leeres Tupel: Ordner ohne Beobachter belegen keinen zusätzlichen Speicher
+    beobachter = ()
+    
     # Konstruktor für Ordner-Objekte
     def __init__(self, name):
         # Ruft Basis-Konstruktor auf
         super().__init__(name)
-        # Liste für Kinder-Elemente (kann Dateien und andere Ordner enthalten)
+        # Liste der Kinder-Elemente (können Dateien und andere Ordner sein)
         self.kinder = []
+        # Zwischengespeicherte Gesamtgröße und Dateianzahl aller Kinder (werden inkrementell gepflegt)
+        self._groesse = 0
+        self._anzahl = 0
     
     # Methode um Kind-Element hinzuzufügen (Datei oder Ordner)
     def hinzufuegen(self, element):
+        # Ein Ordner darf nicht in sich selbst oder einen seiner Nachfahren - sonst entsteht ein Kreis,
+        # und _aenderung_melden liefe endlos im Kreis (Pfad zur Wurzel prüfen, O(Tiefe))
+        ordner = self
+        while ordner is not None:
+            if ordner is element:
+                raise ValueError(f"'{element.name}' kann nicht in sich selbst oder einen eigenen Unterordner "
+                                 "eingefügt werden")
+            ordner = ordner.eltern
+        # Element aus seinem bisherigen Ordner lösen (ein Element hat immer nur einen Eltern-Ordner)
+        if element.eltern is not None:
+            element.eltern.entfernen(element)
         # Element zur Kinder-Liste hinzufügen
         # Parameter: element kann sowohl Datei als auch Ordner sein (Polymorphismus)
         self.kinder.append(element)
+        element.eltern = self
+        # Größe und Anzahl des neuen Elements in diesem und allen übergeordneten Ordnern addieren
+        self._aenderung_melden(element.get_groesse(), element.get_anzahl(), "hinzugefuegt", element)
     
     # Methode um Kind-Element zu entfernen
     def entfernen(self, element):
-        # Element aus Kinder-Liste entfernen falls vorhanden
-        if element in self.kinder:
-            # Element aus Liste entfernen
+        # Element entfernen falls es ein Kind dieses Ordners ist (Prüfung über eltern statt Listensuche)
+        if element.eltern is self:
+            # Element aus der Liste entfernen - O(Anzahl Geschwister), da list.remove sucht und den Rest verschiebt
             self.kinder.remove(element)
+            element.eltern = None
+            # Größe und Anzahl des Elements in diesem und allen übergeordneten Ordnern abziehen
+            self._aenderung_melden(-element.get_groesse(), -element.get_anzahl(), "entfernt", element)
+    
+    # Registriert eine Funktion beobachter(ereignis, element, ordner), die bei jeder Änderung im Teilbaum
+    # aufgerufen wird - ereignis ist "hinzugefuegt", "entfernt" oder "groesse", ordner der direkt betroffene Ordner
+    def beobachter_hinzufuegen(self, beobachter):
+        # Eigene Liste erst beim ersten Beobachter anlegen
+        if not self.beobachter:
+            self.beobachter = []
+        self.beobachter.append(beobachter)
+    
+    # Meldet einen Beobachter wieder ab (ValueError wie bei list.remove, wenn er nicht registriert ist)
+    def beobachter_entfernen(self, beobachter):
+        # Ohne Beobachter ist beobachter noch das leere Klassen-Tupel, das kein remove() kennt
+        if beobachter not in self.beobachter:
+            raise ValueError("Beobachter ist nicht registriert")
+        self.beobachter.remove(beobachter)
     
-    # Überschreibt get_groesse() - berechnet Gesamtgröße aller Kinder
+    # Gibt eine Änderung von Größe/Anzahl an diesen Ordner und alle übergeordneten Ordner weiter
+    # Beobachter auf dem Weg zur Wurzel werden benachrichtigt, sobald ihr Ordner aktualisiert ist
+    def _aenderung_melden(self, differenz_groesse, differenz_anzahl, ereignis=None, element=None):
+        # Schleife statt Rekursion: nur die Ordner auf dem Pfad zur Wurzel werden angefasst (O(Tiefe))
+        ordner = self
+        while ordner is not None:
+            ordner._groesse += differenz_groesse
+            ordner._anzahl += differenz_anzahl
+            if ordner.beobachter and ereignis is not None:
+                for beobachter in ordner.beobachter:
+                    beobachter(ereignis, element, self)
+            ordner = ordner.eltern
+    
+    # Überschreibt get_groesse() - gibt die Gesamtgröße aller Kinder zurück
     def get_groesse(self):
-        # Knoten: summiert die Größe aller Kinder auf
-        gesamt_groesse = 0
-        
-        # Durch alle Kinder iterieren
-        for kind in self.kinder:
-            # Größe des Kindes zur Gesamtgröße addieren
-            # WICHTIG: Polymorphismus - egal ob Datei oder Ordner, beide haben get_groesse()
-            gesamt_groesse += kind.get_groesse()
-        
-        # Gesamtgröße zurückgeben
-        return gesamt_groesse
-    
-    # Überschreibt anzeigen() - zeigt Ordner und alle Kinder an
-    def anzeigen(self, einrueckung=0):
-        # Ordner-Namen mit Icon und Einrückung anzeigen
-        print("  " * einrueckung + f"📁 {self.name}/")
-        
-        # Alle Kinder-Elemente anzeigen
-        for kind in self.kinder:
-            # Rekursiver Aufruf mit erhöhter Einrückung
-            # WICHTIG: Polymorphismus - egal ob Datei oder Ordner, beide haben anzeigen()
-            kind.anzeigen(einrueckung + 1)
+        # Knoten: die Summe aller Kinder wird bei jeder Änderung mitgeführt,
+        # daher muss hier nicht mehr rekursiv über alle Kinder summiert werden (O(1))
+        # WICHTIG: Polymorphismus - egal ob Datei oder Ordner, beide haben get_groesse()
+        return self._groesse
+    
+    # Überschreibt get_anzahl() - gibt die Anzahl aller Dateien in diesem Ordner (rekursiv) zurück
+    def get_anzahl(self):
+        return self._anzahl
+    
+    # Überschreibt anzeige_text() - zeigt Ordner mit Icon an
+    # Die Kinder werden von anzeigen() über durchlaufen() besucht
+    # WICHTIG: Polymorphismus - egal ob Datei oder Ordner, beide haben anzeige_text()
+    def anzeige_text(self):
+        return f"📁 {self.name}/"
+
+# Basis für Ordner, die ihre Kinder erst beim ersten Zugriff auf kinder erzeugen
+# (LazyOrdner in dp_Composite_Scanner.py, GemappterOrdner in dp_Composite_Persistenz.py)
+class LazyBasisOrdner(Ordner):
+    # Konstruktor: geladen=True, wenn es nichts nachzuladen gibt
+    def __init__(self, name, geladen=False):
+        # Muss vor super().__init__ gesetzt sein, da dort kinder zugewiesen wird
+        self._geladen = geladen
+        super().__init__(name)
+    
+    # Property kinder - ruft beim ersten Zugriff _laden() auf
+    @property
+    def kinder(self):
+        if not self._geladen:
+            # Zuerst als geladen markieren, da _laden() über hinzufuegen selbst wieder auf kinder zugreifen kann
+            self._geladen = True
+            self._laden()
+        return self._kinder
+    
+    @kinder.setter
+    def kinder(self, wert):
+        self._kinder = wert
+    
+    # Erzeugt die Kinder (wird von Kindklassen überschrieben)
+    def _laden(self):
+        pass
 
 # Client-Code - arbeitet einheitlich mit Dateien und Ordnern
 # Demonstriert dass Client keinen Unterschied zwischen Blatt und Knoten kennen muss
@@ -141,7 +315,7 @@ def main():
     
     # Gesamte Struktur anzeigen
     print("Vollständige Dateisystem-Struktur:")
-    hauptordner.anzeigen()  # Rekursive Anzeige der gesamten Baumstruktur
+    hauptordner.anzeigen()  # Anzeige der gesamten Baumstruktur (iterativ, gepuffert)
     
     print()  # Leere Zeile
     
@@ -154,6 +328,16 @@ def main():
     print(f"Größe von '{bilder_ordner.name}': {bilder_ordner.get_groesse()} KB")
     print(f"Größe von '{media_ordner.name}': {media_ordner.get_groesse()} KB")
     print(f"Größe von '{hauptordner.name}': {hauptordner.get_groesse()} KB")
+    print(f"Anzahl Dateien in '{hauptordner.name}': {hauptordner.get_anzahl()}")
+    
+    print()  # Leere Zeile
+    
+    # Dateigröße ändern - alle übergeordneten Ordner werden automatisch aktualisiert
+    print("=== Dateigröße ändern ===")
+    print("bild.jpg wächst von 200 KB auf 250 KB...")
+    datei2.groesse = 250
+    print(f"Größe von '{bilder_ordner.name}': {bilder_ordner.get_groesse()} KB")
+    print(f"Größe von '{hauptordner.name}': {hauptordner.get_groesse()} KB")
     
     print()  # Leere Zeile
     
@@ -171,6 +355,17 @@ def main():
     
     print()  # Leere Zeile
     
+    # Durchlauf-Reihenfolgen demonstrieren
+    print("=== Durchlaufen ===")
+    print("Pre-Order: ", [element.name for element, _ in hauptordner.durchlaufen("pre")])
+    print("Post-Order:", [element.name for element, _ in hauptordner.durchlaufen("post")])
+    print("Breite:    ", [element.name for element, _ in hauptordner.durchlaufen("breite")])
+    print("Nur Ordner bis Tiefe 1:",
+          [element.name for element, _ in hauptordner.durchlaufen(max_tiefe=1, bedingung=lambda e: isinstance(e, Ordner))])
+    print(f"Größe per Post-Order-Reduktion: {hauptordner.berechne_groesse()} KB")
+    
+    print()  # Leere Zeile
+    
     # Vorteile des Composite Patterns erläutern
     print("=== Vorteile des Composite Patterns ===")
     print("1. Client behandelt Dateien und Ordner gleich")
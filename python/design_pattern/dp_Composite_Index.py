@@ -0,0 +1,299 @@
+"""
+Problemstellung:
+Ein Element in einem Ordner-Baum aus dp_Composite.py lässt sich bisher nur durch einen vollständigen Durchlauf
+finden. Auch Fragen wie "Welches sind die 10 größten Dateien?" oder "Welche Ordner sind größer als 1 GB?"
+erfordern jedes Mal einen Durchlauf über den ganzen Baum.
+
+Beispiele:
+Datei-Browser mit Adresszeile ("Meine Dokumente/Media/video.mp4").
+Speicherplatz-Analyse, die ständig die größten Dateien und Ordner anzeigt, während sich der Baum ändert.
+
+Kurze Erklärung:
+BaumIndex meldet sich als Beobachter am Wurzel-Ordner an. Jedes hinzufuegen, entfernen und jede neue Dateigröße
+im Teilbaum wird dadurch gemeldet und nur die betroffenen Einträge werden nachgetragen:
+- Pfad-Index: dict Pfad -> Element (Suche in O(1))
+- Endungs-Index: dict Endung -> Dateien
+- Größen-Indizes: nach Größe sortierte Listen aller Dateien und aller Ordner (bisect statt Sortieren).
+  Ändert sich eine Dateigröße, werden nur die Datei und ihre Ordner bis zur Wurzel umsortiert (O(Tiefe)).
+Abfragen lesen nur noch aus diesen Indizes, der Baum wird nie erneut durchlaufen.
+
+Nachteile:
+- Zusätzlicher Speicher für die Indizes und etwas Mehraufwand bei jeder Änderung.
+- Umbenennen (name zuweisen) wird nicht gemeldet - Element vorher entfernen und danach wieder hinzufügen.
+- Gleichnamige Geschwister teilen sich einen Pfad; der Pfad-Index verweist auf das zuletzt eingefügte.
+- Die sortierten Listen verschieben beim Einfügen Zeiger (memmove in C). Für viele Millionen Dateien ist
+  SortierteListe aus sortieralgorithmen/sortierte_liste.py die bessere Wahl.
+"""
+
+import heapq
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+
+from dp_Composite import Datei, Ordner
+
+# Trennzeichen zwischen den Namen eines Pfades
+TRENNER = "/"
+
+
+# Liefert die Endung einer Datei in Kleinbuchstaben ohne Punkt ("video.MP4" -> "mp4", ohne Endung -> "")
+def endung_von(name):
+    return os.path.splitext(name)[1][1:].lower()
+
+
+# Index über einen Ordner-Baum, der bei jeder Änderung inkrementell nachgeführt wird
+class BaumIndex:
+    # Konstruktor: baut den Index einmal vollständig auf und meldet sich als Beobachter an
+    def __init__(self, wurzel):
+        self.wurzel = wurzel
+        # Pfad -> Element und Element -> Pfad
+        self.pfade = {}
+        self._pfad_von = {}
+        # Endung -> {Datei: None} (dict als geordnete Menge)
+        self.endungen = {}
+        # Sortierte Listen mit Einträgen (groesse, id, element) - id macht gleich große Einträge eindeutig
+        self._dateien = []
+        self._ordner = []
+        # Element -> Größe, unter der es gerade in _dateien bzw. _ordner einsortiert ist
+        self._schluessel = {}
+        self._aufbauen()
+        wurzel.beobachter_hinzufuegen(self._ereignis)
+
+    # Meldet den Index wieder ab (danach wird er nicht mehr aktualisiert)
+    def schliessen(self):
+        self.wurzel.beobachter_entfernen(self._ereignis)
+
+    # === Aufbau und Pflege ===
+
+    # Erster Aufbau: alle Elemente registrieren und die Größen-Listen nur einmal sortieren
+    def _aufbauen(self):
+        self._registrieren(self.wurzel, self.wurzel.name)
+        for element, _ in self.wurzel.durchlaufen("pre"):
+            if element is not self.wurzel:
+                self._registrieren(element, self._pfad_von[element.eltern] + TRENNER + element.name)
+        self._dateien = sorted(self._dateien)
+        self._ordner = sorted(self._ordner)
+
+    # Trägt ein Element in Pfad- und Endungs-Index ein und hängt es unsortiert an die Größen-Liste an
+    def _registrieren(self, element, pfad):
+        self.pfade[pfad] = element
+        self._pfad_von[element] = pfad
+        groesse = element.get_groesse()
+        self._schluessel[element] = groesse
+        if isinstance(element, Ordner):
+            self._ordner.append((groesse, id(element), element))
+        else:
+            self.endungen.setdefault(endung_von(element.name), {})[element] = None
+            self._dateien.append((groesse, id(element), element))
+
+    # Wird vom Ordner bei jeder Änderung aufgerufen (siehe Ordner.beobachter_hinzufuegen)
+    def _ereignis(self, ereignis, element, ordner):
+        # Änderungen in Teilbäumen, die nicht (mehr) zum Index gehören, ignorieren
+        if ordner not in self._pfad_von:
+            return
+        if ereignis == "hinzugefuegt":
+            self._teilbaum_hinzufuegen(element)
+        elif ereignis == "entfernt":
+            self._teilbaum_entfernen(element)
+        elif ereignis == "groesse":
+            self._umsortieren(element)
+        # Die Größe aller Ordner vom betroffenen Ordner bis zur Wurzel hat sich geändert
+        while ordner is not None:
+            self._umsortieren(ordner)
+            if ordner is self.wurzel:
+                break
+            ordner = ordner.eltern
+
+    # Registriert ein neues Element samt Teilbaum (Pre-Order: Eltern-Pfad ist immer schon bekannt)
+    def _teilbaum_hinzufuegen(self, element):
+        for kind, _ in element.durchlaufen("pre"):
+            # Bereits bekannt (z.B. weil ein LazyOrdner beim Durchlaufen seine Kinder selbst gemeldet hat)
+            if kind in self._pfad_von:
+                continue
+            self._registrieren(kind, self._pfad_von[kind.eltern] + TRENNER + kind.name)
+            liste = self._ordner if isinstance(kind, Ordner) else self._dateien
+            # Gerade angehängten Eintrag an die sortierte Position verschieben
+            eintrag = liste.pop()
+            insort(liste, eintrag)
+
+    # Entfernt ein Element samt Teilbaum aus allen Indizes
+    def _teilbaum_entfernen(self, element):
+        for kind, _ in element.durchlaufen("pre"):
+            pfad = self._pfad_von.pop(kind, None)
+            if pfad is None:
+                continue
+            # Nur löschen, wenn der Pfad nicht inzwischen einem gleichnamigen Geschwister gehört
+            if self.pfade.get(pfad) is kind:
+                del self.pfade[pfad]
+            if isinstance(kind, Ordner):
+                self._aussortieren(self._ordner, kind)
+            else:
+                dateien = self.endungen[endung_von(kind.name)]
+                del dateien[kind]
+                if not dateien:
+                    del self.endungen[endung_von(kind.name)]
+                self._aussortieren(self._dateien, kind)
+
+    # Entfernt einen Eintrag per Bisektion aus einer sortierten Liste
+    def _aussortieren(self, liste, element):
+        groesse = self._schluessel.pop(element)
+        # (groesse, id) ist kleiner als jedes Tupel (groesse, id, element) -> bisect_left trifft genau den Eintrag
+        del liste[bisect_left(liste, (groesse, id(element)))]
+
+    # Sortiert ein Element neu ein, falls sich seine Größe geändert hat
+    def _umsortieren(self, element):
+        alt = self._schluessel.get(element)
+        neu = element.get_groesse()
+        if alt is None or alt == neu:
+            return
+        liste = self._ordner if isinstance(element, Ordner) else self._dateien
+        self._aussortieren(liste, element)
+        insort(liste, (neu, id(element), element))
+        self._schluessel[element] = neu
+
+    # === Abfragen ===
+
+    # Findet ein Element über seinen Pfad inklusive Wurzel-Name, z.B. "Meine Dokumente/Media/video.mp4"
+    def suchen(self, pfad):
+        return self.pfade.get(pfad.rstrip(TRENNER))
+
+    # Liefert den Pfad eines Elements (None, wenn es nicht im Baum liegt)
+    def pfad(self, element):
+        return self._pfad_von.get(element)
+
+    # Die n größten Dateien, größte zuerst
+    def groesste_dateien(self, n):
+        if n <= 0:
+            return []
+        return [element for _, _, element in reversed(self._dateien[-n:])]
+
+    # Alle Dateien mit einer Endung ("mp4" oder ".mp4", Groß-/Kleinschreibung egal)
+    def dateien_mit_endung(self, endung):
+        return list(self.endungen.get(endung.lstrip(".").lower(), ()))
+
+    # Alle Ordner (Teilbäume), deren Gesamtgröße schwelle übersteigt, größter zuerst
+    def ordner_ueber(self, schwelle):
+        # (schwelle, unendlich) liegt hinter allen Einträgen mit genau dieser Größe
+        start = bisect_right(self._ordner, (schwelle, float("inf")))
+        return [element for _, _, element in reversed(self._ordner[start:])]
+
+    # Anzahl der indizierten Elemente (Dateien und Ordner inklusive Wurzel)
+    def __len__(self):
+        return len(self._pfad_von)
+
+
+# Vergleichsbasis ohne Index: Pfad durch Absteigen über die Namen suchen (lineare Suche pro Ebene)
+def suchen_ohne_index(wurzel, pfad):
+    namen = pfad.split(TRENNER)
+    if namen[0] != wurzel.name:
+        return None
+    element = wurzel
+    for name in namen[1:]:
+        if not isinstance(element, Ordner):
+            return None
+        element = next((kind for kind in element.kinder if kind.name == name), None)
+        if element is None:
+            return None
+    return element
+
+
+# Vergleichsbasis ohne Index: größte Dateien per vollständigem Durchlauf
+def groesste_dateien_ohne_index(wurzel, n):
+    dateien = (element for element, _ in wurzel.durchlaufen() if isinstance(element, Datei))
+    return heapq.nlargest(n, dateien, key=lambda datei: datei.get_groesse())
+
+
+# Erzeugt einen gleichmäßigen Testbaum mit anzahl_dateien Dateien
+def erzeuge_baum(anzahl_dateien, dateien_pro_ordner=100, ordner_pro_ebene=10):
+    endungen = ["txt", "jpg", "mp4", "mp3", "pdf"]
+    wurzel = Ordner("Wurzel")
+    ordner_liste = [wurzel]
+    erzeugt = 0
+    index = 0
+    while erzeugt < anzahl_dateien:
+        ordner = ordner_liste[index]
+        index += 1
+        for i in range(ordner_pro_ebene):
+            unter = Ordner(f"ordner_{i}")
+            ordner.hinzufuegen(unter)
+            ordner_liste.append(unter)
+        for i in range(min(dateien_pro_ordner, anzahl_dateien - erzeugt)):
+            ordner.hinzufuegen(Datei(f"datei_{i}.{endungen[i % len(endungen)]}", random.randint(1, 100_000)))
+            erzeugt += 1
+    return wurzel
+
+
+# Demonstration mit dem Baum aus dp_Composite.py und kleiner Benchmark
+def main():
+    print("=== Baum-Index ===\n")
+    hauptordner = Ordner("Meine Dokumente")
+    bilder_ordner = Ordner("Bilder")
+    media_ordner = Ordner("Media")
+    hauptordner.hinzufuegen(Datei("dokument.txt", 50))
+    hauptordner.hinzufuegen(bilder_ordner)
+    hauptordner.hinzufuegen(media_ordner)
+    bilder_ordner.hinzufuegen(Datei("bild.jpg", 200))
+
+    # Index anlegen - ab hier wird er bei jeder Änderung automatisch nachgeführt
+    index = BaumIndex(hauptordner)
+    video = Datei("video.mp4", 1500)
+    media_ordner.hinzufuegen(video)
+    media_ordner.hinzufuegen(Datei("musik.mp3", 300))
+
+    print("Suche 'Meine Dokumente/Media/video.mp4':", index.suchen("Meine Dokumente/Media/video.mp4").anzeige_text())
+    print("2 größte Dateien:", [datei.name for datei in index.groesste_dateien(2)])
+    print("Dateien mit Endung .jpg:", [datei.name for datei in index.dateien_mit_endung(".jpg")])
+    print("Ordner über 1000 KB:", [ordner.name for ordner in index.ordner_ueber(1000)])
+
+    # Änderungen werden sofort im Index sichtbar
+    video.groesse = 100
+    media_ordner.entfernen(index.suchen("Meine Dokumente/Media/musik.mp3"))
+    print("\nNach Verkleinern von video.mp4 und Entfernen von musik.mp3:")
+    print("2 größte Dateien:", [datei.name for datei in index.groesste_dateien(2)])
+    print("Ordner über 1000 KB:", [ordner.name for ordner in index.ordner_ueber(1000)])
+    print("Suche 'Meine Dokumente/Media/musik.mp3':", index.suchen("Meine Dokumente/Media/musik.mp3"))
+
+    # Benchmark: Abfragen mit und ohne Index
+    anzahl = 100_000
+    print(f"\n=== Benchmark mit {anzahl} Dateien ===")
+    wurzel = erzeuge_baum(anzahl)
+    start = time.perf_counter()
+    index = BaumIndex(wurzel)
+    print(f"{'Index aufbauen':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+    pfade = random.sample(list(index.pfade), 1000)
+    start = time.perf_counter()
+    for pfad in pfade:
+        suchen_ohne_index(wurzel, pfad)
+    print(f"{'1000 x Pfad suchen ohne Index':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    start = time.perf_counter()
+    for pfad in pfade:
+        index.suchen(pfad)
+    print(f"{'1000 x Pfad suchen mit Index':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+    start = time.perf_counter()
+    erwartet = groesste_dateien_ohne_index(wurzel, 10)
+    print(f"{'10 größte Dateien ohne Index':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    start = time.perf_counter()
+    ergebnis = index.groesste_dateien(10)
+    print(f"{'10 größte Dateien mit Index':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    assert [datei.get_groesse() for datei in ergebnis] == [datei.get_groesse() for datei in erwartet]
+
+    # Pflege-Aufwand: Dateigrößen ändern, Dateien verschieben
+    dateien = index.dateien_mit_endung("mp4")
+    start = time.perf_counter()
+    for datei in random.sample(dateien, 1000):
+        datei.groesse = random.randint(1, 100_000)
+    print(f"{'1000 x Dateigröße ändern (mit Index)':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    ziel = index.suchen("Wurzel/ordner_0")
+    start = time.perf_counter()
+    for datei in random.sample(dateien, 1000):
+        ziel.hinzufuegen(datei)
+    print(f"{'1000 x Datei verschieben (mit Index)':<38} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    assert len(index) == len(BaumIndex(wurzel))
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
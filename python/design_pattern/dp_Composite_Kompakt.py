@@ -0,0 +1,339 @@
+"""
+Problemstellung:
+Jede Datei und jeder Ordner aus dp_Composite.py ist ein vollwertiges Python-Objekt mit eigenem __dict__,
+jeder Ordner hält zusätzlich eine Liste seiner Kinder. Bei Millionen Dateien kostet das mehrere Gigabyte.
+
+Beispiele:
+Speicherplatz-Analyse ganzer Laufwerke (dp_Composite_Scanner.py), Indizes von Backup-Systemen,
+Verzeichnisbäume in Build-Systemen.
+
+Kurze Erklärung:
+Der KompakterBaum speichert alle Knoten in parallelen Arrays (array.array) statt in Objekten:
+- eltern[i], erstes_kind[i], letztes_kind[i], naechstes[i], vorheriges[i]: Verweise als Index (-1 = keiner)
+  -> Kinder bilden eine doppelt verkettete Liste, dadurch sind hinzufuegen/entfernen O(1)
+- groesse[i]: Dateigröße bzw. zwischengespeicherte Gesamtgröße eines Ordners (wie in dp_Composite.py)
+- anzahl[i]: Anzahl Dateien im Teilbaum (bei Dateien 1)
+- ist_ordner[i]: 1 Byte pro Knoten
+- Namen liegen hintereinander in EINEM bytearray, pro Knoten nur Startposition und Länge
+
+Für den Client gibt es kleine Stellvertreter-Objekte (KompaktDatei, KompaktOrdner) mit __slots__, die nur
+(baum, index) enthalten und die gleiche Schnittstelle wie Datei/Ordner anbieten:
+get_groesse(), get_anzahl(), anzeigen(), hinzufuegen(), entfernen(), name, kinder.
+Sie werden nur bei Bedarf erzeugt und belegen danach keinen Speicher mehr.
+
+Nachteile:
+- Entfernte Knoten hinterlassen Lücken in den Arrays (der Speicher wird nicht zurückgegeben).
+- Namen können nicht nachträglich geändert werden (sie liegen fest im Namens-Puffer).
+- Zwei Stellvertreter desselben Knotens sind verschiedene Objekte (Vergleich über == statt is).
+"""
+
+import sys
+from array import array
+
+from dp_Composite import ANZEIGE_PUFFER
+
+# Index für "kein Knoten"
+KEIN = -1
+
+
+class KompakterBaum:
+    # Konstruktor: legt die leeren Arrays an
+    def __init__(self):
+        # Struktur des Baums als 32-Bit-Indizes (reicht für über 2 Milliarden Knoten)
+        self.eltern = array("i")
+        self.erstes_kind = array("i")
+        self.letztes_kind = array("i")
+        self.naechstes = array("i")
+        self.vorheriges = array("i")
+        # Größe (Datei) bzw. Gesamtgröße (Ordner) und Anzahl Dateien im Teilbaum
+        self.groesse = array("q")
+        self.anzahl = array("q")
+        # 1 = Ordner, 0 = Datei
+        self.ist_ordner = bytearray()
+        # Alle Namen UTF-8-kodiert hintereinander, pro Knoten Startposition und Länge
+        self.namen = bytearray()
+        self.name_start = array("q")
+        self.name_laenge = array("H")
+
+    # Legt einen neuen, noch nicht eingehängten Knoten an und gibt seinen Index zurück
+    def _neuer_knoten(self, name, groesse, ordner):
+        index = len(self.eltern)
+        kodiert = name.encode("utf-8")
+        self.name_start.append(len(self.namen))
+        self.name_laenge.append(len(kodiert))
+        self.namen += kodiert
+        for spalte in (self.eltern, self.erstes_kind, self.letztes_kind, self.naechstes, self.vorheriges):
+            spalte.append(KEIN)
+        self.groesse.append(groesse)
+        self.anzahl.append(0 if ordner else 1)
+        self.ist_ordner.append(1 if ordner else 0)
+        return index
+
+    # Erzeugt eine Datei (Blatt) und gibt ihren Stellvertreter zurück
+    def neue_datei(self, name, groesse):
+        return KompaktDatei(self, self._neuer_knoten(name, groesse, False))
+
+    # Erzeugt einen Ordner (Knoten) und gibt seinen Stellvertreter zurück
+    def neuer_ordner(self, name):
+        return KompaktOrdner(self, self._neuer_knoten(name, 0, True))
+
+    # Gibt für einen Index den passenden Stellvertreter zurück
+    def knoten(self, index):
+        return KompaktOrdner(self, index) if self.ist_ordner[index] else KompaktDatei(self, index)
+
+    # Liest den Namen eines Knotens aus dem Namens-Puffer
+    def name(self, index):
+        start = self.name_start[index]
+        return self.namen[start:start + self.name_laenge[index]].decode("utf-8")
+
+    # Liefert die Indizes aller Kinder eines Ordners
+    def kinder_indizes(self, index):
+        kind = self.erstes_kind[index]
+        while kind != KEIN:
+            yield kind
+            kind = self.naechstes[kind]
+
+    # Hängt Knoten kind als letztes Kind an Ordner ordner an (O(1) + O(Tiefe) für die Größen)
+    def einhaengen(self, ordner, kind):
+        # Ein Ordner darf nicht in sich selbst oder einen seiner Nachfahren, sonst liefe _aenderung_melden
+        # endlos im Kreis (wie Ordner.hinzufuegen in dp_Composite.py, O(Tiefe))
+        vorfahr = ordner
+        while vorfahr != KEIN:
+            if vorfahr == kind:
+                raise ValueError(f"'{self.name(kind)}' kann nicht in sich selbst oder einen eigenen Unterordner "
+                                 "eingefügt werden")
+            vorfahr = self.eltern[vorfahr]
+        # Aus dem bisherigen Ordner lösen (wie Ordner.hinzufuegen in dp_Composite.py)
+        if self.eltern[kind] != KEIN:
+            self.aushaengen(kind)
+        letztes = self.letztes_kind[ordner]
+        if letztes == KEIN:
+            self.erstes_kind[ordner] = kind
+        else:
+            self.naechstes[letztes] = kind
+        self.vorheriges[kind] = letztes
+        self.letztes_kind[ordner] = kind
+        self.eltern[kind] = ordner
+        self._aenderung_melden(ordner, self.groesse[kind], self.anzahl[kind])
+
+    # Löst Knoten kind aus seinem Ordner (O(1) + O(Tiefe) für die Größen)
+    def aushaengen(self, kind):
+        ordner = self.eltern[kind]
+        vorher, nachher = self.vorheriges[kind], self.naechstes[kind]
+        # Kind aus der doppelt verketteten Liste der Geschwister entfernen
+        if vorher == KEIN:
+            self.erstes_kind[ordner] = nachher
+        else:
+            self.naechstes[vorher] = nachher
+        if nachher == KEIN:
+            self.letztes_kind[ordner] = vorher
+        else:
+            self.vorheriges[nachher] = vorher
+        self.eltern[kind] = self.naechstes[kind] = self.vorheriges[kind] = KEIN
+        self._aenderung_melden(ordner, -self.groesse[kind], -self.anzahl[kind])
+
+    # Gibt eine Größenänderung an den Ordner und alle übergeordneten Ordner weiter
+    def _aenderung_melden(self, ordner, differenz_groesse, differenz_anzahl):
+        while ordner != KEIN:
+            self.groesse[ordner] += differenz_groesse
+            self.anzahl[ordner] += differenz_anzahl
+            ordner = self.eltern[ordner]
+
+    # Ändert die Größe einer Datei
+    def setze_groesse(self, datei, wert):
+        differenz = wert - self.groesse[datei]
+        self.groesse[datei] = wert
+        self._aenderung_melden(self.eltern[datei], differenz, 0)
+
+    # Zeigt den Teilbaum ab index an - iterativ, Ausgabe gesammelt in Blöcken zu je ANZEIGE_PUFFER Zeilen
+    # (wie DateiElement.anzeigen in dp_Composite.py)
+    def anzeigen(self, index, einrueckung=0, ausgabe=None):
+        ausgabe = ausgabe or sys.stdout
+        zeilen = []
+        stapel = [(index, einrueckung)]
+        while stapel:
+            knoten, tiefe = stapel.pop()
+            if self.ist_ordner[knoten]:
+                zeilen.append("  " * tiefe + f"📁 {self.name(knoten)}/")
+                # Kinder in umgekehrter Reihenfolge auf den Stapel, damit sie in Reihenfolge ausgegeben werden
+                kind = self.letztes_kind[knoten]
+                while kind != KEIN:
+                    stapel.append((kind, tiefe + 1))
+                    kind = self.vorheriges[kind]
+            else:
+                zeilen.append("  " * tiefe + f"📄 {self.name(knoten)} ({self.groesse[knoten]} KB)")
+            # Puffer regelmäßig leeren, damit auch riesige Bäume nicht komplett im Speicher landen
+            if len(zeilen) >= ANZEIGE_PUFFER:
+                ausgabe.write("\n".join(zeilen) + "\n")
+                zeilen.clear()
+        if zeilen:
+            ausgabe.write("\n".join(zeilen) + "\n")
+
+
+# Gemeinsame Basis der Stellvertreter (entspricht DateiElement aus dp_Composite.py)
+class KompaktElement:
+    # Nur zwei Verweise pro Stellvertreter, kein __dict__
+    __slots__ = ("baum", "index")
+
+    def __init__(self, baum, index):
+        self.baum = baum
+        self.index = index
+
+    # Name aus dem Namens-Puffer
+    @property
+    def name(self):
+        return self.baum.name(self.index)
+
+    # Übergeordneter Ordner (oder None)
+    @property
+    def eltern(self):
+        eltern = self.baum.eltern[self.index]
+        return None if eltern == KEIN else KompaktOrdner(self.baum, eltern)
+
+    # Größe aus dem Array (bei Ordnern zwischengespeichert, daher O(1))
+    def get_groesse(self):
+        return self.baum.groesse[self.index]
+
+    # Anzahl Dateien im Teilbaum
+    def get_anzahl(self):
+        return self.baum.anzahl[self.index]
+
+    # Anzeige über den iterativen Baum-Durchlauf
+    def anzeigen(self, einrueckung=0, ausgabe=None):
+        self.baum.anzeigen(self.index, einrueckung, ausgabe)
+
+    # Zwei Stellvertreter sind gleich, wenn sie auf denselben Knoten zeigen
+    def __eq__(self, other):
+        return isinstance(other, KompaktElement) and self.baum is other.baum and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.baum), self.index))
+
+
+# BLATT: Datei
+class KompaktDatei(KompaktElement):
+    __slots__ = ()
+
+    # Property groesse wie bei Datei - beim Setzen werden die Ordner darüber mitaktualisiert
+    @property
+    def groesse(self):
+        return self.baum.groesse[self.index]
+
+    @groesse.setter
+    def groesse(self, wert):
+        self.baum.setze_groesse(self.index, wert)
+
+
+# KNOTEN: Ordner
+class KompaktOrdner(KompaktElement):
+    __slots__ = ()
+
+    # Kinder als Stellvertreter (werden bei jedem Zugriff neu erzeugt)
+    @property
+    def kinder(self):
+        return [self.baum.knoten(kind) for kind in self.baum.kinder_indizes(self.index)]
+
+    # Element als letztes Kind hinzufügen
+    def hinzufuegen(self, element):
+        if element.baum is not self.baum:
+            raise ValueError("Element gehört zu einem anderen KompakterBaum")
+        self.baum.einhaengen(self.index, element.index)
+
+    # Element entfernen, falls es ein Kind dieses Ordners ist
+    def entfernen(self, element):
+        if element.baum is self.baum and self.baum.eltern[element.index] == self.index:
+            self.baum.aushaengen(element.index)
+
+
+# Baut denselben Beispielbaum wie main() in dp_Composite.py auf
+def main():
+    print("=== Composite Pattern - Kompakte Darstellung ===\n")
+    baum = KompakterBaum()
+
+    datei1 = baum.neue_datei("dokument.txt", 50)
+    datei2 = baum.neue_datei("bild.jpg", 200)
+    datei3 = baum.neue_datei("video.mp4", 1500)
+    datei4 = baum.neue_datei("musik.mp3", 300)
+
+    hauptordner = baum.neuer_ordner("Meine Dokumente")
+    bilder_ordner = baum.neuer_ordner("Bilder")
+    media_ordner = baum.neuer_ordner("Media")
+
+    bilder_ordner.hinzufuegen(datei2)
+    media_ordner.hinzufuegen(datei3)
+    media_ordner.hinzufuegen(datei4)
+    hauptordner.hinzufuegen(datei1)
+    hauptordner.hinzufuegen(bilder_ordner)
+    hauptordner.hinzufuegen(media_ordner)
+
+    hauptordner.anzeigen()
+    print(f"\nGröße von '{hauptordner.name}': {hauptordner.get_groesse()} KB")
+    media_ordner.entfernen(datei3)
+    print(f"Nach Entfernen von video.mp4: {hauptordner.get_groesse()} KB")
+
+    benchmark()
+
+
+# Vergleicht Speicherbedarf und Durchlaufzeit mit dem Objekt-Baum aus dp_Composite.py
+def benchmark(anzahl_dateien=None):
+    import gc
+    import io
+    import time
+    import tracemalloc
+
+    from dp_Composite import Datei, Ordner
+
+    anzahl_dateien = anzahl_dateien or (int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
+    dateien_pro_ordner = 100
+    print(f"\n=== Benchmark mit {anzahl_dateien} Dateien ===")
+
+    # Objekt-Baum aufbauen und Speicher messen
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    wurzel = Ordner("wurzel")
+    for o in range(anzahl_dateien // dateien_pro_ordner):
+        ordner = Ordner(f"ordner_{o}")
+        wurzel.hinzufuegen(ordner)
+        for d in range(dateien_pro_ordner):
+            ordner.hinzufuegen(Datei(f"datei_{d}.bin", d))
+    aufbau_objekte = time.perf_counter() - start
+    speicher_objekte = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Kompakten Baum aufbauen und Speicher messen
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    baum = KompakterBaum()
+    kompakt_wurzel = baum.neuer_ordner("wurzel")
+    for o in range(anzahl_dateien // dateien_pro_ordner):
+        ordner = baum.neuer_ordner(f"ordner_{o}")
+        kompakt_wurzel.hinzufuegen(ordner)
+        for d in range(dateien_pro_ordner):
+            ordner.hinzufuegen(baum.neue_datei(f"datei_{d}.bin", d))
+    aufbau_kompakt = time.perf_counter() - start
+    speicher_kompakt = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{'':<12} {'Speicher':>12} {'pro Datei':>12} {'Aufbau':>10} {'Anzeige':>10}")
+    for name, speicher, aufbau, element in (("Objekte", speicher_objekte, aufbau_objekte, wurzel),
+                                            ("Kompakt", speicher_kompakt, aufbau_kompakt, kompakt_wurzel)):
+        # Durchlauf: ganzen Baum in einen Puffer "anzeigen" (alte Ordner.anzeigen nutzt print -> umleiten)
+        puffer = io.StringIO()
+        start = time.perf_counter()
+        alt = sys.stdout
+        sys.stdout = puffer
+        try:
+            element.anzeigen()
+        finally:
+            sys.stdout = alt
+        anzeige = time.perf_counter() - start
+        print(f"{name:<12} {speicher / 1024 / 1024:9.1f} MB {speicher / anzahl_dateien:9.0f} B "
+              f"{aufbau:8.2f} s {anzeige:8.2f} s")
+    assert wurzel.get_groesse() == kompakt_wurzel.get_groesse()
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Problemstellung:
+Ein großer Ordner-Baum aus dp_Composite.py (z.B. aus dp_Composite_Scanner.py) muss bei jedem Programmstart
+neu aufgebaut werden - bei Millionen Dateien dauert das lange, obwohl oft nur die Gesamtgröße oder ein
+einzelner Teilbaum gebraucht wird.
+
+Beispiele:
+Speicherplatz-Analyse, die das Ergebnis des letzten Scans sofort wieder anzeigt.
+Backup-Programme, die den Stand des letzten Backups als Baum vorhalten.
+
+Kurze Erklärung:
+speichern() schreibt den Baum in ein kompaktes Binärformat:
+- Kopf: Kennung b"CTRE", Version, Anzahl Knoten, Position des Namens-Blocks
+- Knoten in Pre-Order als Datensätze fester Länge (struct): Typ, Name (Start/Länge im Namens-Block),
+  erstes Kind, nächstes Geschwister (als Knoten-Nummer, -1 = keins), Größe und Dateianzahl des Teilbaums
+- Namens-Block: alle Namen als UTF-8 direkt hintereinander
+Da jeder Datensatz gleich lang ist, liegt Knoten i an Position KOPF + i * DATENSATZ (Zugriff in O(1)).
+
+BaumDatei bildet die Datei per mmap in den Speicher ab, ohne sie einzulesen. wurzel() erzeugt nur den
+Wurzel-Ordner. Ein GemappterOrdner kennt seine Größe und Dateianzahl sofort aus seinem Datensatz;
+seine Kinder werden erst beim ersten Zugriff auf kinder als Objekte erzeugt (eine Ebene auf einmal).
+Das Betriebssystem lädt dabei nur die tatsächlich berührten Seiten der Datei.
+
+Nachteile:
+- Änderungen am geöffneten Baum wirken nur im Speicher; zum Sichern erneut speichern().
+- Die Datei muss geöffnet bleiben, solange noch nicht geladene Ordner verwendet werden.
+- Einmal erzeugte Knoten bleiben im Speicher (wie bei LazyOrdner in dp_Composite_Scanner.py).
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from dp_Composite import Datei, LazyBasisOrdner, Ordner
+
+# Kennung und Version des Dateiformats
+KENNUNG = b"CTRE"
+VERSION = 1
+
+# Kopf: Kennung, Version, Anzahl Knoten, Position des Namens-Blocks
+KOPF = struct.Struct("<4sHxxqq")
+
+# Datensatz pro Knoten: Typ, Namenslänge, erstes Kind, nächstes Geschwister, Größe, Anzahl, Namens-Start
+DATENSATZ = struct.Struct("<BxHiiqqq")
+
+# Knoten-Typen
+TYP_DATEI = 0
+TYP_ORDNER = 1
+
+# Index für "kein Knoten"
+KEIN = -1
+
+# Anzahl Datensätze, die beim Schreiben gesammelt und mit einem write() geschrieben werden
+SCHREIB_PUFFER = 10_000
+
+
+# Schreibt einen Datei/Ordner-Baum in das Binärformat
+def speichern(wurzel, pfad):
+    # Pre-Order-Nummern vergeben und Verweise (erstes Kind / nächstes Geschwister) eintragen
+    nummer = {}
+    letztes_kind = {}
+    erstes = []
+    naechstes = []
+    knoten = []
+    for element, _ in wurzel.durchlaufen("pre"):
+        i = len(knoten)
+        nummer[element] = i
+        knoten.append(element)
+        erstes.append(KEIN)
+        naechstes.append(KEIN)
+        if element is not wurzel:
+            eltern = nummer[element.eltern]
+            vorheriges = letztes_kind.get(eltern)
+            if vorheriges is None:
+                erstes[eltern] = i
+            else:
+                naechstes[vorheriges] = i
+            letztes_kind[eltern] = i
+
+    namen = [element.name.encode("utf-8") for element in knoten]
+    namens_start = KOPF.size + len(knoten) * DATENSATZ.size
+    with open(pfad, "wb") as datei:
+        datei.write(KOPF.pack(KENNUNG, VERSION, len(knoten), namens_start))
+        puffer = []
+        position = 0
+        for i, element in enumerate(knoten):
+            typ = TYP_ORDNER if isinstance(element, Ordner) else TYP_DATEI
+            puffer.append(DATENSATZ.pack(typ, len(namen[i]), erstes[i], naechstes[i],
+                                         element.get_groesse(), element.get_anzahl(), position))
+            position += len(namen[i])
+            if len(puffer) >= SCHREIB_PUFFER:
+                datei.write(b"".join(puffer))
+                puffer.clear()
+        datei.write(b"".join(puffer))
+        datei.write(b"".join(namen))
+    return len(knoten)
+
+
+# Geöffnete Baum-Datei: hält die mmap und liest einzelne Datensätze
+class BaumDatei:
+    # Konstruktor: Datei öffnen, abbilden und Kopf prüfen
+    def __init__(self, pfad):
+        with open(pfad, "rb") as datei:
+            self._mmap = mmap.mmap(datei.fileno(), 0, access=mmap.ACCESS_READ)
+        kennung, version, self.anzahl_knoten, self._namens_start = KOPF.unpack_from(self._mmap, 0)
+        if kennung != KENNUNG or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{pfad} ist keine Baum-Datei (Version {VERSION})")
+
+    # Liest den Datensatz von Knoten i
+    def datensatz(self, i):
+        return DATENSATZ.unpack_from(self._mmap, KOPF.size + i * DATENSATZ.size)
+
+    # Liest einen Namen aus dem Namens-Block
+    def name(self, start, laenge):
+        start += self._namens_start
+        return self._mmap[start:start + laenge].decode("utf-8")
+
+    # Erzeugt das Objekt für Knoten i (Datei vollständig, Ordner ohne Kinder)
+    def element(self, i):
+        typ, laenge, erstes, naechstes, groesse, anzahl, start = self.datensatz(i)
+        if typ == TYP_DATEI:
+            return Datei(self.name(start, laenge), groesse), naechstes
+        return GemappterOrdner(self.name(start, laenge), self, erstes, groesse, anzahl), naechstes
+
+    # Wurzel-Ordner (Knoten 0)
+    def wurzel(self):
+        return self.element(0)[0]
+
+    # Schließt die Abbildung (noch nicht geladene Ordner sind danach nicht mehr lesbar)
+    def schliessen(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliessen()
+
+
+# Ordner, dessen Kinder erst beim ersten Zugriff aus der Baum-Datei erzeugt werden
+class GemappterOrdner(LazyBasisOrdner):
+    # Konstruktor: Größe und Anzahl kommen direkt aus dem Datensatz (ohne erstes Kind gibt es nichts zu laden)
+    def __init__(self, name, datei, erstes_kind, groesse, anzahl):
+        self._datei = datei
+        self._erstes_kind = erstes_kind
+        super().__init__(name, geladen=erstes_kind == KEIN)
+        self._groesse = groesse
+        self._anzahl = anzahl
+
+    # Erzeugt genau eine Ebene; Größen sind schon bekannt, daher direkt einhängen statt hinzufuegen
+    def _laden(self):
+        i = self._erstes_kind
+        while i != KEIN:
+            element, i = self._datei.element(i)
+            element.eltern = self
+            self._kinder.append(element)
+
+
+# Baut einen Testbaum, speichert ihn und vergleicht Neuaufbau mit dem Öffnen per mmap
+def main():
+    from dp_Composite_Index import erzeuge_baum
+
+    print("=== Composite-Baum speichern und per mmap öffnen ===\n")
+    hauptordner = Ordner("Meine Dokumente")
+    media_ordner = Ordner("Media")
+    hauptordner.hinzufuegen(Datei("dokument.txt", 50))
+    hauptordner.hinzufuegen(media_ordner)
+    media_ordner.hinzufuegen(Datei("video.mp4", 1500))
+    media_ordner.hinzufuegen(Datei("musik.mp3", 300))
+
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        pfad = os.path.join(verzeichnis, "beispiel.baum")
+        speichern(hauptordner, pfad)
+        with BaumDatei(pfad) as datei:
+            wurzel = datei.wurzel()
+            print(f"Größe von '{wurzel.name}' ohne Laden der Kinder: {wurzel.get_groesse()} KB")
+            wurzel.anzeigen()
+
+        # Benchmark: Anzahl Dateien als Parameter, z.B. "python dp_Composite_Persistenz.py 1000000"
+        anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+        print(f"\n=== Benchmark mit {anzahl} Dateien ===")
+        start = time.perf_counter()
+        baum = erzeuge_baum(anzahl)
+        print(f"{'Baum im Speicher aufbauen':<36} {time.perf_counter() - start:8.3f} s")
+
+        pfad = os.path.join(verzeichnis, "gross.baum")
+        start = time.perf_counter()
+        knoten = speichern(baum, pfad)
+        print(f"{'speichern()':<36} {time.perf_counter() - start:8.3f} s  "
+              f"({knoten} Knoten, {os.path.getsize(pfad) / 1024 / 1024:.1f} MB)")
+
+        start = time.perf_counter()
+        with BaumDatei(pfad) as datei:
+            wurzel = datei.wurzel()
+            groesse = wurzel.get_groesse()
+            print(f"{'Öffnen + get_groesse() der Wurzel':<36} {(time.perf_counter() - start) * 1000:8.3f} ms")
+            assert groesse == baum.get_groesse() and wurzel.get_anzahl() == baum.get_anzahl()
+
+            # In einen Teilbaum absteigen: nur die Ebenen auf dem Weg werden erzeugt
+            start = time.perf_counter()
+            element = wurzel
+            while isinstance(element, Ordner) and element.kinder:
+                element = element.kinder[0]
+            print(f"{'Abstieg bis zum ersten Blatt':<36} {(time.perf_counter() - start) * 1000:8.3f} ms  "
+                  f"({element.name})")
+
+            # Zum Vergleich: alles laden
+            start = time.perf_counter()
+            geladen = sum(1 for _ in wurzel.durchlaufen())
+            print(f"{'Alle Knoten erzeugen':<36} {time.perf_counter() - start:8.3f} s  ({geladen} Knoten)")
+            assert geladen == knoten
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
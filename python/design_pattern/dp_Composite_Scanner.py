@@ -0,0 +1,219 @@
+"""
+Problemstellung:
+Die Datei/Ordner-Bäume aus dp_Composite.py werden bisher in main() von Hand aufgebaut. Um echten
+Speicherplatz-Verbrauch zu analysieren, soll der Baum aus einem realen Verzeichnis erzeugt werden -
+auch bei Verzeichnissen mit Millionen Dateien in annehmbarer Zeit.
+
+Beispiele:
+Eine Speicherplatz-Analyse ("Welcher Ordner belegt am meisten Platz?") wie du, ncdu oder WinDirStat.
+Ein Datei-Browser, der Unterordner erst beim Aufklappen einliest.
+
+Kurze Erklärung:
+- os.scandir liefert zu jedem Eintrag ein DirEntry-Objekt, das Typ (Datei/Ordner) und unter Linux/Windows
+  meist auch die Größe bereits aus dem Verzeichnis-Eintrag kennt. DirEntry.stat() speichert das Ergebnis,
+  daher ist kein zusätzlicher os.stat-Aufruf pro Datei nötig.
+- Parallel: Jedes Verzeichnis wird als eigene Aufgabe auf einem Thread-Pool eingelesen. Die Aufgabe liefert
+  die gefundenen Dateien und Unterordner zurück; der Haupt-Thread hängt sie in den Baum ein und gibt die
+  Unterordner als neue Aufgaben an den Pool. Nur der Haupt-Thread verändert den Baum (keine Sperren nötig,
+  da Ordner.hinzufuegen die zwischengespeicherten Größen aller Eltern-Ordner anpasst).
+  Dateisystem-Aufrufe geben den GIL frei, daher beschleunigen Threads hier tatsächlich.
+- Lazy: LazyOrdner liest seine Kinder erst beim ersten Zugriff auf kinder ein (z.B. beim Aufklappen).
+  get_groesse() lädt dagegen den ganzen Teilbaum, denn dafür werden alle Dateien benötigt.
+
+Nachteile:
+- Symbolische Links werden nicht verfolgt (sonst wären Endlosschleifen möglich).
+- Verzeichnisse ohne Leserechte werden übersprungen und zählen mit Größe 0.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from dp_Composite import Datei, LazyBasisOrdner, Ordner
+
+
+# Rechnet Bytes in KB um (aufgerundet wie bei "du", damit kleine Dateien nicht als 0 KB zählen)
+def bytes_zu_kb(anzahl_bytes):
+    return -(-anzahl_bytes // 1024)
+
+
+# Liest genau EIN Verzeichnis ein (ohne Unterordner) und gibt Dateien und (Name, Pfad) der Unterordner zurück
+# Diese Funktion verändert den Baum nicht und kann daher gefahrlos in einem Worker-Thread laufen
+def scanne_verzeichnis(pfad):
+    dateien = []
+    unterordner = []
+    try:
+        with os.scandir(pfad) as eintraege:
+            for eintrag in eintraege:
+                try:
+                    # is_dir() nutzt den Typ aus dem Verzeichnis-Eintrag (kein zusätzlicher Systemaufruf)
+                    if eintrag.is_dir(follow_symlinks=False):
+                        unterordner.append((eintrag.name, eintrag.path))
+                    elif eintrag.is_file(follow_symlinks=False):
+                        # DirEntry.stat() wird zwischengespeichert - unter Windows sogar ohne Systemaufruf
+                        groesse = eintrag.stat(follow_symlinks=False).st_size
+                        dateien.append(Datei(eintrag.name, bytes_zu_kb(groesse)))
+                except OSError:
+                    # Eintrag ist zwischenzeitlich verschwunden oder nicht lesbar
+                    continue
+    except OSError:
+        # Verzeichnis nicht lesbar (z.B. fehlende Rechte) -> als leer behandeln
+        pass
+    # Nach Namen sortieren, damit die Anzeige unabhängig von der Dateisystem-Reihenfolge ist
+    dateien.sort(key=lambda datei: datei.name)
+    unterordner.sort()
+    return dateien, unterordner
+
+
+# Hängt das Ergebnis von scanne_verzeichnis in einen Ordner ein (nur im Haupt-Thread aufrufen)
+# Gibt die neu erzeugten Unterordner zusammen mit ihrem Pfad zurück
+def einhaengen(ordner, dateien, unterordner, ordner_klasse=Ordner):
+    neue_ordner = []
+    for name, pfad in unterordner:
+        unter = ordner_klasse(name)
+        ordner.hinzufuegen(unter)
+        neue_ordner.append((unter, pfad))
+    for datei in dateien:
+        ordner.hinzufuegen(datei)
+    return neue_ordner
+
+
+# Baut den Baum seriell auf (Vergleichsbasis für den parallelen Scanner)
+def scanne_seriell(pfad):
+    wurzel = Ordner(os.path.basename(os.path.abspath(pfad)) or pfad)
+    # Expliziter Stapel statt Rekursion (sehr tiefe Verzeichnisse würden sonst das Rekursionslimit sprengen)
+    stapel = [(wurzel, pfad)]
+    while stapel:
+        ordner, ordner_pfad = stapel.pop()
+        dateien, unterordner = scanne_verzeichnis(ordner_pfad)
+        stapel.extend(einhaengen(ordner, dateien, unterordner))
+    return wurzel
+
+
+# Baut den Baum parallel auf: jedes Verzeichnis ist eine Aufgabe auf dem Thread-Pool
+def scanne_parallel(pfad, threads=None):
+    threads = threads or min(32, (os.cpu_count() or 1) * 4)
+    wurzel = Ordner(os.path.basename(os.path.abspath(pfad)) or pfad)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        # Laufende Aufgaben: Future -> Ordner, in den das Ergebnis eingehängt wird
+        laufend = {pool.submit(scanne_verzeichnis, pfad): wurzel}
+        while laufend:
+            fertig, _ = wait(laufend, return_when=FIRST_COMPLETED)
+            for future in fertig:
+                ordner = laufend.pop(future)
+                dateien, unterordner = future.result()
+                # Unterordner einhängen und als neue Aufgaben einreichen
+                for unter, unter_pfad in einhaengen(ordner, dateien, unterordner):
+                    laufend[pool.submit(scanne_verzeichnis, unter_pfad)] = unter
+    return wurzel
+
+
+# Ordner, der seine Kinder erst beim ersten Zugriff einliest
+class LazyOrdner(LazyBasisOrdner):
+    # Konstruktor: pfad ist das reale Verzeichnis hinter diesem Ordner (ohne pfad gibt es nichts zu laden)
+    def __init__(self, name, pfad=None):
+        # Wird gesetzt, sobald der ganze Teilbaum geladen ist (danach sind Größenabfragen wieder O(1))
+        self._vollstaendig = False
+        self.pfad = pfad
+        super().__init__(name, geladen=pfad is None)
+
+    # Erzeugt den Wurzel-Ordner für ein Verzeichnis
+    @classmethod
+    def fuer_pfad(cls, pfad):
+        return cls(os.path.basename(os.path.abspath(pfad)) or pfad, pfad)
+
+    # Liest genau eine Ebene ein (beim ersten Zugriff auf kinder); Unterordner sind wieder LazyOrdner
+    def _laden(self):
+        dateien, unterordner = scanne_verzeichnis(self.pfad)
+        for unter, unter_pfad in einhaengen(self, dateien, unterordner, ordner_klasse=LazyOrdner):
+            # Unterordner merken sich nur ihren Pfad und werden selbst erst bei Bedarf geladen
+            # (hinzufuegen hat den noch leeren Ordner über get_groesse bereits als vollständig markiert)
+            unter.pfad = unter_pfad
+            unter._geladen = False
+            unter._vollstaendig = False
+
+    # Lädt den ganzen Teilbaum (nötig, bevor die Gesamtgröße bekannt ist)
+    def vollstaendig_laden(self):
+        stapel = [self]
+        while stapel:
+            ordner = stapel.pop()
+            if ordner._vollstaendig:
+                continue
+            ordner._vollstaendig = True
+            stapel.extend(kind for kind in ordner.kinder if isinstance(kind, LazyOrdner))
+
+    # Überschreibt get_groesse() - Teilbaum laden, danach ist die zwischengespeicherte Größe korrekt
+    def get_groesse(self):
+        self.vollstaendig_laden()
+        return super().get_groesse()
+
+    # Überschreibt get_anzahl() - wie get_groesse()
+    def get_anzahl(self):
+        self.vollstaendig_laden()
+        return super().get_anzahl()
+
+
+# Erzeugt einen synthetischen Verzeichnisbaum mit anzahl_dateien Dateien für den Benchmark
+def erzeuge_testbaum(wurzel, anzahl_dateien, dateien_pro_ordner=100, ordner_pro_ebene=10):
+    ordner_pfade = [wurzel]
+    erzeugt = 0
+    index = 0
+    while erzeugt < anzahl_dateien:
+        pfad = ordner_pfade[index]
+        index += 1
+        # Unterordner anlegen (Breitensuche, dadurch entsteht ein gleichmäßiger Baum)
+        for i in range(ordner_pro_ebene):
+            unter = os.path.join(pfad, f"ordner_{i}")
+            os.mkdir(unter)
+            ordner_pfade.append(unter)
+        # Dateien mit unterschiedlicher Größe anlegen
+        for i in range(min(dateien_pro_ordner, anzahl_dateien - erzeugt)):
+            with open(os.path.join(pfad, f"datei_{i}.bin"), "wb") as datei:
+                datei.truncate((erzeugt % 64) * 1024)
+            erzeugt += 1
+
+
+# Benchmark: serieller Scan, paralleler Scan und Lazy-Modus auf einem synthetischen Baum
+def main():
+    import tempfile
+
+    # Anzahl Dateien als Parameter, z.B. "python dp_Composite_Scanner.py 1000000"
+    anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        print(f"Erzeuge Testbaum mit {anzahl} Dateien...")
+        erzeuge_testbaum(verzeichnis, anzahl)
+
+        start = time.perf_counter()
+        seriell = scanne_seriell(verzeichnis)
+        print(f"Seriell:  {time.perf_counter() - start:6.2f} s  ({seriell.get_anzahl()} Dateien, "
+              f"{seriell.get_groesse()} KB)")
+
+        start = time.perf_counter()
+        parallel = scanne_parallel(verzeichnis)
+        print(f"Parallel: {time.perf_counter() - start:6.2f} s  ({parallel.get_anzahl()} Dateien, "
+              f"{parallel.get_groesse()} KB)")
+
+        # Lazy: nur die oberste Ebene aufklappen
+        start = time.perf_counter()
+        lazy = LazyOrdner.fuer_pfad(verzeichnis)
+        anzahl_kinder = len(lazy.kinder)
+        print(f"Lazy (1 Ebene): {(time.perf_counter() - start) * 1000:6.2f} ms  ({anzahl_kinder} Kinder)")
+        start = time.perf_counter()
+        groesse = lazy.get_groesse()
+        print(f"Lazy (get_groesse lädt alles): {time.perf_counter() - start:6.2f} s  ({groesse} KB)")
+
+        # Kleiner Ausschnitt der Struktur anzeigen
+        print("\nAusschnitt:")
+        beispiel = parallel.kinder[0]
+        print(f"{beispiel.name}: {beispiel.get_groesse()} KB in {beispiel.get_anzahl()} Dateien")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    # Mit Pfad als Parameter wird ein echtes Verzeichnis gescannt, sonst läuft der Benchmark
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        baum = scanne_parallel(sys.argv[1])
+        print(f"{baum.name}: {baum.get_groesse()} KB in {baum.get_anzahl()} Dateien")
+    else:
+        main()
@@ -16,11 +16,64 @@ einer Sammlung bereit. Der Client kann so die Elemente einer Sammlung durchlaufe
 interne Struktur der Sammlung zu kennen. Der Iterator hält den aktuellen Zustand des Durchlaufs
 und bietet Methoden zum Vorwärtsbewegen und zum Abrufen des aktuellen Elements.
 
+In Python gehört das Iterator-Protokoll zur Sprache: __iter__() liefert einen Iterator, __next__() das nächste
+Element (am Ende StopIteration). Die Collections unterstützen es direkt ("for element in collection" läuft mit
+dem nativen Iterator von list/set/dict), die Iteratoren aus create_iterator() bieten zusätzlich has_next()/next().
+SetIterator und DictIterator laufen dabei direkt über die Menge bzw. das Dictionary statt über eine Kopie:
+Kommen während des Durchlaufs Elemente/Schlüssel hinzu oder fallen weg, meldet Python einen RuntimeError
+(bisher lief der Durchlauf über die beim Anlegen kopierten Elemente bzw. Schlüssel weiter).
+
 Nachteile:
 Der Iterator kann zusätzlichen Speicherbedarf verursachen, insbesondere bei großen Sammlungen.
+Eine for-Schleife über einen Iterator aus create_iterator() läuft direkt über den nativen Iterator. Innerhalb
+dieser Schleife darf daher nicht zusätzlich has_next() aufgerufen werden: das vorausgelesene Element würde
+die Schleife nicht mehr sehen.
 
 """
 
+import time
+
+# Markiert "kein Element vorausgelesen" (None kann ein gültiges Element sein)
+_LEER = object()
+
+# Gemeinsame Basis aller Iteratoren: Java-artige Schnittstelle (has_next/next) UND Python-Iterator-Protokoll
+# Intern wird ein nativer Python-Iterator verwendet; has_next() liest höchstens ein Element voraus
+class BasisIterator:
+    def __init__(self, iterator):
+        # Nativer Iterator der Sammlung und das vorausgelesene Element
+        self._iterator = iterator
+        self._voraus = _LEER
+
+    def __iter__(self):
+        # Ein Iterator ist selbst iterierbar (for element in collection.create_iterator())
+        # Ist nichts vorausgelesen, läuft die Schleife direkt über den nativen Iterator (kein Python-Aufruf pro
+        # Element) - außer eine Kindklasse überschreibt __next__ (z.B. FileIterator, der die Position mitführt)
+        if self._voraus is _LEER and type(self).__next__ is BasisIterator.__next__:
+            return self._iterator
+        return self
+
+    def __next__(self):
+        # Zuerst das von has_next() vorausgelesene Element liefern
+        if self._voraus is not _LEER:
+            item = self._voraus
+            self._voraus = _LEER
+            return item
+        return next(self._iterator)
+
+    def has_next(self):
+        # Prüft, ob noch weitere Elemente vorhanden sind (liest dafür ein Element voraus)
+        if self._voraus is _LEER:
+            self._voraus = next(self._iterator, _LEER)
+        return self._voraus is not _LEER
+
+    def next(self):
+        # Gibt das aktuelle Element zurück und geht zum nächsten weiter (None am Ende, wie bisher)
+        if self._voraus is not _LEER:
+            item = self._voraus
+            self._voraus = _LEER
+            return item
+        return next(self._iterator, None)
+
 # Einfache Collection auf Basis einer Liste
 class ListCollection:
     def __init__(self, items):
@@ -31,86 +84,124 @@ class ListCollection:
         # Gibt einen Iterator für diese Collection zurück
         return ListIterator(self)
 
-class ListIterator:
-    def __init__(self, collection):
-        # Speichert die Collection und den aktuellen Index
-        self.collection = collection
-        self.index = 0
+    def __iter__(self):
+        # for element in collection: nativer Listen-Iterator (kein Python-Aufruf pro Element)
+        return iter(self.items)
 
-    def has_next(self):
-        # Prüft, ob noch weitere Elemente vorhanden sind
-        return self.index < len(self.collection.items)
+    def __len__(self):
+        return len(self.items)
 
-    def next(self):
-        # Gibt das aktuelle Element zurück und geht zum nächsten weiter
-        if self.has_next():
-            item = self.collection.items[self.index]
-            self.index += 1
-            return item
-        else:
-            return None
+class ListIterator(BasisIterator):
+    def __init__(self, collection):
+        # Speichert die Collection und durchläuft die Liste mit dem nativen Listen-Iterator
+        super().__init__(iter(collection.items))
+        self.collection = collection
 
 # Collection auf Basis einer Menge (set)
 class SetCollection:
     def __init__(self, items):
         # Initialisiert die Collection mit einer Menge von Elementen
+        # (keine zusätzliche Kopie als Liste mehr - der Iterator durchläuft die Menge direkt)
         self.items = set(items)
-        self.items_list = list(self.items)  # Für den Iterator als Liste speichern
 
     def create_iterator(self):
         # Gibt einen Iterator für diese Collection zurück
         return SetIterator(self)
 
-class SetIterator:
-    def __init__(self, collection):
-        # Speichert die Collection und den aktuellen Index
-        self.collection = collection
-        self.index = 0
+    def __iter__(self):
+        return iter(self.items)
 
-    def has_next(self):
-        # Prüft, ob noch weitere Elemente vorhanden sind
-        return self.index < len(self.collection.items_list)
+    def __len__(self):
+        return len(self.items)
 
-    def next(self):
-        # Gibt das aktuelle Element zurück und geht zum nächsten weiter
-        if self.has_next():
-            item = self.collection.items_list[self.index]
-            self.index += 1
-            return item
-        else:
-            return None
+    # Früher ein Attribut (Kopie der Menge als Liste für den Iterator); nur noch lesend und als neue Kopie
+    @property
+    def items_list(self):
+        return list(self.items)
+
+class SetIterator(BasisIterator):
+    def __init__(self, collection):
+        # Achtung: wird die Menge während des Durchlaufs verändert, meldet Python einen RuntimeError
+        super().__init__(iter(collection.items))
+        self.collection = collection
 
 # Collection auf Basis eines Dictionaries
 class DictCollection:
     def __init__(self, items):
         # Initialisiert die Collection mit einem Dictionary
         self.items = dict(items)
-        self.keys = list(self.items.keys())  # Für den Iterator die Schlüssel speichern
 
     def create_iterator(self):
         # Gibt einen Iterator für diese Collection zurück
         return DictIterator(self)
 
-class DictIterator:
+    def __iter__(self):
+        # Liefert (Schlüssel, Wert)-Paare wie der DictIterator
+        return iter(self.items.items())
+
+    def __len__(self):
+        return len(self.items)
+
+    # Früher ein Attribut (Kopie der Schlüssel für den Iterator); nur noch lesend und als neue Kopie
+    @property
+    def keys(self):
+        return list(self.items)
+
+class DictIterator(BasisIterator):
     def __init__(self, collection):
-        # Speichert die Collection und den aktuellen Index
+        # Durchläuft die Schlüssel-Wert-Paare direkt, ohne die Schlüssel vorher in eine Liste zu kopieren
+        # Achtung (geändert): früher lief der Iterator über eine Kopie der Schlüssel. Wird das Dictionary
+        # jetzt während des Durchlaufs um Schlüssel erweitert oder verkleinert, meldet Python einen RuntimeError
+        # (geänderte Werte vorhandener Schlüssel sind erlaubt und werden sofort sichtbar)
+        super().__init__(iter(collection.items.items()))
         self.collection = collection
+
+# Bisherige Iteratoren mit Index und Listen-Kopie - nur noch als Vergleich für den Benchmark
+class IndexIterator:
+    def __init__(self, items):
+        self.items = list(items)
         self.index = 0
 
     def has_next(self):
-        # Prüft, ob noch weitere Elemente vorhanden sind
-        return self.index < len(self.collection.keys)
+        return self.index < len(self.items)
 
     def next(self):
-        # Gibt das aktuelle Element (Schlüssel-Wert-Paar) zurück und geht zum nächsten weiter
         if self.has_next():
-            key = self.collection.keys[self.index]
-            value = self.collection.items[key]
+            item = self.items[self.index]
             self.index += 1
-            return (key, value)
+            return item
         else:
             return None
 
+# Benchmark: Aufwand pro Element für die verschiedenen Arten des Durchlaufs
+def benchmark(anzahl=1_000_000):
+    print(f"\n=== Benchmark: {anzahl} Elemente (Zeit pro Element) ===")
+    for name, collection in (("ListCollection", ListCollection(list(range(anzahl)))),
+                             ("SetCollection", SetCollection(range(anzahl))),
+                             ("DictCollection", DictCollection(zip(range(anzahl), range(anzahl))))):
+        varianten = (
+            ("bisher: Kopie + has_next()/next()", lambda: IndexIterator(collection.items.items()
+                                                                        if isinstance(collection, DictCollection)
+                                                                        else collection.items)),
+            ("has_next()/next()", collection.create_iterator),
+            ("for ... in create_iterator()", collection.create_iterator),
+            ("for ... in collection", lambda: collection),
+        )
+        for variante, erzeugen in varianten:
+            start = time.perf_counter()
+            iterator = erzeugen()
+            gezaehlt = 0
+            if variante.startswith("for"):
+                for _ in iterator:
+                    gezaehlt += 1
+            else:
+                while iterator.has_next():
+                    iterator.next()
+                    gezaehlt += 1
+            dauer = time.perf_counter() - start
+            assert gezaehlt == anzahl
+            print(f"{name:<15} {variante:<36} {dauer / anzahl * 1e9:7.1f} ns")
+
 # Beispiel-Nutzung
 if __name__ == "__main__":
     print("ListCollection:")
@@ -129,4 +220,10 @@ if __name__ == "__main__":
     dict_collection = DictCollection({'a': 7, 'b': 8, 'c': 9})
     dict_iterator = dict_collection.create_iterator()
     while dict_iterator.has_next():
-        print(dict_iterator.next())
\ No newline at end of file
+        print(dict_iterator.next())
+
+    print("\nfor-Schleife über eine DictCollection:")
+    for key, value in dict_collection:
+        print(key, value)
+
+    benchmark()
@@ -0,0 +1,242 @@
+"""
+Problemstellung:
+Die Collections aus dp_Iterator.py liegen vollständig im Arbeitsspeicher. Eine mehrere Gigabyte große Datei
+(Logs, Messreihen, Export einer Datenbank) lässt sich so nicht durchlaufen - und selbst zeilenweises Lesen
+mit open() legt für jede Zeile sofort ein neues bytes/str-Objekt an, auch wenn die Zeile gleich wieder
+verworfen wird.
+
+Beispiele:
+Eine Log-Datei nach Fehlern durchsuchen, ein Binär-Export mit Datensätzen fester Länge auswerten,
+eine abgebrochene Verarbeitung an der letzten Position fortsetzen.
+
+Kurze Erklärung:
+FileCollection bildet die Datei per mmap in den Speicher ab; das Betriebssystem lädt nur die Seiten, die
+gerade gelesen werden. Der Iterator aus create_iterator() liefert jeden Datensatz als memoryview-Ausschnitt
+der Abbildung - es wird nichts kopiert, bis der Verbraucher bytes(satz) oder satz.tobytes() aufruft.
+- satz=None: Datensätze sind Zeilen (getrennt durch b"\\n", die Zeilenenden werden
+  blockweise mit re.finditer direkt in der Abbildung gesucht)
+- satz=struct.Struct(...) oder Format-String: Datensätze fester Länge; mit entpacken=True werden sie
+  direkt als Tupel geliefert (struct.iter_unpack)
+Der Iterator kennt nach jedem Datensatz seine position (Byte-Offset). Wird sie gespeichert, setzt
+FileCollection(pfad, start=position) die Verarbeitung genau dort fort.
+
+Nachteile:
+- schliessen() beendet alle noch laufenden Iteratoren. Hält der Aufrufer danach noch Ausschnitte, bleibt die
+  Abbildung bis zu deren Freigabe bestehen und wird erst dann vom Garbage Collector entfernt.
+- Jeder memoryview-Ausschnitt ist selbst ein Objekt (ca. 200 Bytes). Bei kurzen Zeilen, die ohnehin alle
+  gelesen werden, ist das Kopieren durch open() daher schneller; der Vorteil zeigt sich bei langen
+  Datensätzen, von denen nur ein Teil angesehen wird, und bei entpacken=True.
+- Wird die Datei während des Durchlaufs von einem anderen Prozess verändert, sieht der Iterator die Änderung
+  (oder es kommt bei einer verkürzten Datei zu einem Fehler).
+"""
+
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+import weakref
+from itertools import chain, repeat
+from operator import itemgetter, methodcaller, sub
+
+from dp_Iterator import _LEER, BasisIterator
+
+# Zeilenenden werden blockweise (je BLOCK Bytes) in C gesucht, nicht Zeile für Zeile
+BLOCK = 1 << 20
+_ZEILENUMBRUCH = re.compile(b"\n")
+_ENDE = methodcaller("end")
+
+
+# Collection über den Datensätzen einer Datei (Zeilen oder Datensätze fester Länge)
+class FileCollection:
+    def __init__(self, pfad, satz=None, start=0, entpacken=False):
+        if isinstance(satz, str):
+            satz = struct.Struct(satz)
+        # Datensätze fester Länge beginnen bei 0, size, 2*size, ... - ein anderer start träfe mitten in einen Satz
+        if satz is not None and start % satz.size:
+            raise ValueError(f"start ({start}) ist kein Vielfaches der Datensatzgröße ({satz.size})")
+        self.pfad = pfad
+        self.satz = satz
+        self.start = start
+        self.entpacken = entpacken
+        with open(pfad, "rb") as datei:
+            self.laenge = os.fstat(datei.fileno()).st_size
+            # Eine leere Datei kann nicht abgebildet werden
+            self._mmap = mmap.mmap(datei.fileno(), 0, access=mmap.ACCESS_READ) if self.laenge else None
+        self._sicht = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        # Laufende Generatoren und Iteratoren, die schliessen() beenden muss (sie halten Ausschnitte der Abbildung)
+        self._laufend = weakref.WeakSet()
+
+    def create_iterator(self):
+        # Gibt einen Iterator für diese Collection zurück
+        return FileIterator(self)
+
+    def __iter__(self):
+        # for satz in collection: nur die Datensätze, ohne Positionen (map hält selbst keinen Datensatz fest)
+        return map(itemgetter(1), self._saetze())
+
+    # Anzahl der Datensätze ab start (nur bei Datensätzen fester Länge bekannt, ohne die Datei zu lesen)
+    def __len__(self):
+        if self.satz is None:
+            raise TypeError("Die Anzahl der Zeilen ist erst nach dem Durchlaufen bekannt")
+        return (self.laenge - self.start) // self.satz.size
+
+    # Liefert Paare (Position hinter dem Datensatz, Datensatz)
+    def _saetze(self):
+        if self.satz is None:
+            saetze = self._zeilen()
+        else:
+            groesse = self.satz.size
+            ende = self.start + len(self) * groesse
+            positionen = range(self.start + groesse, ende + 1, groesse)
+            if self.entpacken:
+                # Blockweise entpacken: abbildung[a:b] kopiert den Block als bytes, damit hält iter_unpack keinen
+                # Verweis auf die Abbildung (die Tupel sind ohnehin Kopien); alles läuft in C
+                block = max(1, BLOCK // groesse) * groesse
+                abbildung = self._mmap if self._mmap is not None else b""
+                # Blockenden auf ende begrenzen: ein unvollständiger Rest am Dateiende gehört zu keinem Datensatz
+                block_enden = map(min, range(self.start + block, ende + block, block), repeat(ende))
+                bloecke = map(abbildung.__getitem__, map(slice, range(self.start, ende, block), block_enden))
+                return zip(positionen, chain.from_iterable(map(self.satz.iter_unpack, bloecke)))
+            sicht = self._sicht
+            saetze = ((position, sicht[position - groesse:position]) for position in positionen)
+        self._laufend.add(saetze)
+        return saetze
+
+    def _zeilen(self):
+        abbildung, sicht, laenge = self._mmap, self._sicht, self.laenge
+        position = self.start
+        while position < laenge:
+            # Positionen hinter allen Zeilenumbrüchen im nächsten Block (finditer/map/list laufen in C)
+            enden = list(map(_ENDE, _ZEILENUMBRUCH.finditer(abbildung, position, min(position + BLOCK, laenge))))
+            if not enden:
+                # Kein Zeilenumbruch im Block: sehr lange Zeile oder letzte Zeile ohne Zeilenumbruch
+                ende = abbildung.find(b"\n", position)
+                if ende == -1:
+                    yield laenge, sicht[position:laenge]
+                    return
+                enden = [ende + 1]
+            # Zeile = Ausschnitt von der vorherigen Position bis vor den Zeilenumbruch
+            anfaenge = chain((position,), enden)
+            yield from zip(enden, map(sicht.__getitem__, map(slice, anfaenge, map(sub, enden, repeat(1)))))
+            position = enden[-1]
+
+    # Beendet alle laufenden Iteratoren und gibt die Abbildung frei
+    def schliessen(self):
+        for laufend in list(self._laufend):
+            laufend.close()
+        self._sicht.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Der Aufrufer hält noch Ausschnitte: die Abbildung wird mit dem letzten davon freigegeben
+                pass
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliessen()
+
+
+class FileIterator(BasisIterator):
+    def __init__(self, collection):
+        super().__init__(collection._saetze())
+        self.collection = collection
+        # Byte-Offset hinter dem zuletzt gelieferten Datensatz (zum Fortsetzen speichern)
+        self.position = collection.start
+        collection._laufend.add(self)
+
+    # Verwirft den vorausgelesenen Datensatz und beendet den Durchlauf (wird von FileCollection.schliessen() aufgerufen)
+    def close(self):
+        self._voraus = _LEER
+        self._iterator = iter(())
+
+    def __next__(self):
+        self.position, satz = super().__next__()
+        return satz
+
+    def next(self):
+        paar = super().next()
+        if paar is None:
+            return None
+        self.position, satz = paar
+        return satz
+
+
+def main():
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        print("=== FileCollection: Zeilen ===")
+        pfad = os.path.join(verzeichnis, "log.txt")
+        with open(pfad, "w") as datei:
+            for i in range(10):
+                datei.write(f"{'FEHLER' if i % 4 == 0 else 'INFO'} Eintrag {i}\n")
+        with FileCollection(pfad) as log:
+            iterator = log.create_iterator()
+            # Erste 5 Zeilen verarbeiten, Position merken ("Programm bricht ab")
+            for _ in range(5):
+                zeile = iterator.next()
+                print(bytes(zeile).decode())
+            gespeichert = iterator.position
+        print(f"-- Abbruch, gespeicherte Position: Byte {gespeichert} --")
+        with FileCollection(pfad, start=gespeichert) as log:
+            iterator = log.create_iterator()
+            while iterator.has_next():
+                zeile = iterator.next()
+                print(bytes(zeile).decode())
+
+        print("\n=== FileCollection: Datensätze fester Länge ===")
+        messung = struct.Struct("<qd")
+        pfad = os.path.join(verzeichnis, "messwerte.bin")
+        with open(pfad, "wb") as datei:
+            datei.write(b"".join(messung.pack(i, 20 + i / 10) for i in range(5)))
+        with FileCollection(pfad, messung, entpacken=True) as messwerte:
+            print(f"{len(messwerte)} Datensätze:", list(messwerte))
+
+        # Benchmark: große Dateien durchlaufen, nur Datensätze mit "FEHLER" am Anfang werden gezählt
+        print("\n=== Benchmark ===")
+        for anzahl, laenge in ((2_000_000, 20), (100_000, 4000)):
+            pfad = os.path.join(verzeichnis, f"zeilen_{laenge}.txt")
+            with open(pfad, "w") as datei:
+                datei.writelines(f"{'FEHLER' if i % 1000 == 0 else 'INFO'};{i};".ljust(laenge, "x") + "\n"
+                                 for i in range(anzahl))
+            groesse = os.path.getsize(pfad) / 1024 / 1024
+            print(f"{anzahl} Zeilen zu {laenge} Bytes ({groesse:.0f} MB):")
+
+            start = time.perf_counter()
+            with open(pfad, "rb") as datei:
+                fehler = sum(1 for zeile in datei if zeile.startswith(b"FEHLER"))
+            print(f"  {'open() zeilenweise (kopiert jede Zeile)':<44} {time.perf_counter() - start:7.3f} s  ({fehler})")
+
+            start = time.perf_counter()
+            with FileCollection(pfad) as collection:
+                # Nur die ersten 6 Bytes jeder Zeile werden kopiert
+                fehler = sum(1 for zeile in collection if zeile[:6].tobytes() == b"FEHLER")
+            print(f"  {'FileCollection (memoryview)':<44} {time.perf_counter() - start:7.3f} s  ({fehler})")
+
+        anzahl = 2_000_000
+        print(f"{anzahl} Datensätze {messung.format} zu {messung.size} Bytes:")
+        pfad = os.path.join(verzeichnis, "gross.bin")
+        with open(pfad, "wb") as datei:
+            for block in range(0, anzahl, 100_000):
+                datei.write(b"".join(messung.pack(i, i * 0.5) for i in range(block, block + 100_000)))
+
+        start = time.perf_counter()
+        with open(pfad, "rb") as datei:
+            summe = 0.0
+            while daten := datei.read(messung.size):
+                summe += messung.unpack(daten)[1]
+        print(f"  {'read() + unpack pro Datensatz':<44} {time.perf_counter() - start:7.3f} s  (Summe {summe:.0f})")
+
+        start = time.perf_counter()
+        with FileCollection(pfad, messung, entpacken=True) as collection:
+            summe = sum(wert for _, wert in collection)
+        print(f"  {'FileCollection (entpacken=True)':<44} {time.perf_counter() - start:7.3f} s  (Summe {summe:.0f})")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Problemstellung:
+Mit create_iterator() wird jedes Element nacheinander auf einem einzigen Prozessorkern verarbeitet. Ist die
+Arbeit pro Element aufwendig (Bilder umrechnen, Hashes berechnen, Dokumente parsen), bleiben die übrigen Kerne
+ungenutzt. executor.map() aus concurrent.futures hilft nur bedingt: es liest die gesamte Quelle sofort ein und
+legt für jedes Element ein Future an - bei großen oder endlosen Quellen wächst der Speicher unbegrenzt.
+
+Beispiele:
+Alle Dateien eines Verzeichnisses hashen, Datensätze aus dp_Iterator_Datei.py parallel auswerten,
+Messwerte aus einem endlosen Strom mit einer teuren Funktion aufbereiten.
+
+Kurze Erklärung:
+ParallelIterator ist ein Iterator (has_next/next und for ... in) über den Ergebnissen von funktion(element).
+Die Elemente einer beliebigen Collection aus dp_Iterator.py (oder eines anderen Iterables) werden in Blöcken
+zu `block` Elementen an einen Thread- oder Prozess-Pool gegeben - ein Block pro Auftrag spart bei Prozessen
+das Verpacken (pickle) und Versenden jedes einzelnen Elements.
+Es sind höchstens `vorlauf` Blöcke gleichzeitig unterwegs; erst wenn ein Ergebnis abgeholt wird, wird der
+nächste Block aus der Quelle gelesen. Der Speicherbedarf ist damit durch block * vorlauf begrenzt.
+- geordnet=True: Ergebnisse in der Reihenfolge der Quelle (ein langsamer Block hält die folgenden auf)
+- geordnet=False: Ergebnisse in der Reihenfolge, in der die Blöcke fertig werden
+Threads lohnen sich, wenn funktion das GIL freigibt (Ein-/Ausgabe, hashlib, zlib, NumPy), Prozesse bei
+reinem Python-Code.
+
+Nachteile:
+- Bei Prozessen müssen funktion und Elemente per pickle übertragbar sein (keine lambdas).
+- Ausnahmen in funktion treten erst beim Abholen des betroffenen Ergebnisses auf (der Iterator schließt sich
+  dabei selbst).
+- Wird der Iterator nicht bis zum Ende gelesen, sollte schliessen() (oder with) die restlichen Aufträge
+  abbrechen und den Pool beenden.
+"""
+
+import hashlib
+import itertools
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from dp_Iterator import BasisIterator, ListCollection
+
+
+# Wird im Worker ausgeführt: verarbeitet einen ganzen Block (Funktion auf Modulebene, damit pickle sie findet)
+def _block_verarbeiten(funktion, block):
+    return list(map(funktion, block))
+
+
+# Iterator über funktion(element) für alle Elemente der Quelle, parallel in einem Thread- oder Prozess-Pool
+class ParallelIterator(BasisIterator):
+    def __init__(self, quelle, funktion, pool="thread", worker=None, block=64, vorlauf=None, geordnet=True):
+        # pool: "thread", "prozess" oder ein vorhandener Executor (wird dann nicht beendet)
+        # Prüfen, bevor ein Pool angelegt wird - sonst bliebe er bei einem Fehler ungenutzt zurück
+        if isinstance(pool, str) and pool not in ("thread", "prozess"):
+            raise ValueError(f"Unbekannter Pool: {pool!r} (erlaubt: 'thread', 'prozess' oder ein Executor)")
+        if block < 1:
+            raise ValueError(f"block muss mindestens 1 sein, nicht {block}")
+        if vorlauf is not None and vorlauf < 1:
+            raise ValueError(f"vorlauf muss mindestens 1 sein, nicht {vorlauf}")
+        if pool == "thread":
+            self._pool = ThreadPoolExecutor(worker)
+        elif pool == "prozess":
+            self._pool = ProcessPoolExecutor(worker)
+        else:
+            self._pool = pool
+        self._eigener_pool = self._pool is not pool
+        self.funktion = funktion
+        self.block = block
+        # Standard: zwei Blöcke je Worker, damit kein Worker auf Nachschub warten muss
+        self.vorlauf = vorlauf or 2 * (worker or os.cpu_count() or 1)
+        self.geordnet = geordnet
+        self._auftraege = deque() if geordnet else set()
+        # Blöcke aus der Quelle lesen, bis ein leerer Block kommt (Quelle: Collection oder beliebiges Iterable)
+        quelle = iter(quelle)
+        self._bloecke = iter(lambda: list(itertools.islice(quelle, block)), [])
+        ergebnisse = self._geordnet() if geordnet else self._ungeordnet()
+        super().__init__(itertools.chain.from_iterable(ergebnisse))
+
+    # Füllt die Auftragsliste auf vorlauf Blöcke auf
+    def _nachfuellen(self):
+        while len(self._auftraege) < self.vorlauf:
+            block = next(self._bloecke, None)
+            if block is None:
+                return
+            auftrag = self._pool.submit(_block_verarbeiten, self.funktion, block)
+            if self.geordnet:
+                self._auftraege.append(auftrag)
+            else:
+                self._auftraege.add(auftrag)
+
+    # Liefert die Ergebnisblöcke in der Reihenfolge der Quelle
+    # finally: auch wenn funktion (oder die Quelle) eine Ausnahme wirft, wird der eigene Pool beendet
+    def _geordnet(self):
+        try:
+            self._nachfuellen()
+            while self._auftraege:
+                ergebnis = self._auftraege.popleft().result()
+                self._nachfuellen()
+                yield ergebnis
+        finally:
+            self.schliessen()
+
+    # Liefert die Ergebnisblöcke, sobald sie fertig sind
+    def _ungeordnet(self):
+        try:
+            self._nachfuellen()
+            while self._auftraege:
+                fertig, self._auftraege = wait(self._auftraege, return_when=FIRST_COMPLETED)
+                self._nachfuellen()
+                for auftrag in fertig:
+                    yield auftrag.result()
+        finally:
+            self.schliessen()
+
+    # Bricht noch nicht begonnene Aufträge ab und beendet einen selbst angelegten Pool
+    def schliessen(self):
+        for auftrag in self._auftraege:
+            auftrag.cancel()
+        self._auftraege.clear()
+        if self._eigener_pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliessen()
+
+
+# === Beispiel-Funktionen (auf Modulebene, damit sie auch im Prozess-Pool funktionieren) ===
+
+# Reiner Python-Code: hält das GIL, skaliert nur mit Prozessen
+def quersummen_kette(zahl, runden=2000):
+    for _ in range(runden):
+        zahl = sum(map(int, str(zahl * 7919 + 1)))
+    return zahl
+
+
+# hashlib gibt bei großen Daten das GIL frei: skaliert auch mit Threads
+def hashen(zahl, groesse=256 * 1024, runden=4):
+    daten = zahl.to_bytes(8, "little") * (groesse // 8)
+    for _ in range(runden):
+        daten = hashlib.sha256(daten).digest() * (groesse // 32)
+    return hashlib.sha256(daten).hexdigest()[:8]
+
+
+def langsam_quadrieren(zahl):
+    # Unterschiedlich lange Bearbeitung, damit die ungeordnete Reihenfolge sichtbar wird
+    time.sleep(0.01 * (zahl % 3))
+    return zahl * zahl
+
+
+def main():
+    print("=== ParallelIterator über eine ListCollection ===")
+    zahlen = ListCollection(list(range(12)))
+    iterator = ParallelIterator(zahlen, langsam_quadrieren, worker=4, block=2)
+    ergebnisse = []
+    while iterator.has_next():
+        ergebnisse.append(iterator.next())
+    print("geordnet:  ", ergebnisse)
+    with ParallelIterator(zahlen, langsam_quadrieren, worker=4, block=2, geordnet=False) as iterator:
+        print("ungeordnet:", list(iterator))
+
+    # Endlose Quelle: funktioniert, weil nur vorlauf Blöcke im Voraus gelesen werden
+    with ParallelIterator(itertools.count(), quersummen_kette, worker=2, block=8) as iterator:
+        print("Endlose Quelle, erste 5:", list(itertools.islice(iterator, 5)))
+
+    print(f"\n=== Benchmark ({os.cpu_count()} Prozessorkerne) ===")
+    for name, funktion, anzahl in (("Python-Code (GIL)", quersummen_kette, 400),
+                                   ("hashlib (gibt GIL frei)", hashen, 400)):
+        elemente = ListCollection(list(range(anzahl)))
+        start = time.perf_counter()
+        erwartet = [funktion(element) for element in elemente]
+        print(f"{name:<24} {'sequentiell':<22} {time.perf_counter() - start:7.3f} s")
+        for pool in ("thread", "prozess"):
+            for geordnet in (True, False):
+                start = time.perf_counter()
+                with ParallelIterator(elemente, funktion, pool=pool, block=16, geordnet=geordnet) as iterator:
+                    ergebnisse = list(iterator)
+                dauer = time.perf_counter() - start
+                assert (ergebnisse if geordnet else sorted(ergebnisse)) == (erwartet if geordnet else sorted(erwartet))
+                reihenfolge = "geordnet" if geordnet else "ungeordnet"
+                print(f"{'':<24} {f'{pool}, {reihenfolge}':<22} {dauer:7.3f} s")
+
+    # Speicher: executor.map legt für jedes Element sofort ein Future an, ParallelIterator nur block * vorlauf
+    anzahl = 200_000
+    print(f"\n=== Speicher bei {anzahl} Elementen (Thread-Pool) ===")
+    for name in ("executor.map", "ParallelIterator"):
+        tracemalloc.start()
+        with ThreadPoolExecutor(4) as pool:
+            if name == "executor.map":
+                ergebnisse = pool.map(abs, range(anzahl))
+            else:
+                ergebnisse = ParallelIterator(range(anzahl), abs, pool=pool, block=256, vorlauf=8)
+            summe = sum(ergebnisse)
+        spitze = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<24} Spitze {spitze / 1024 / 1024:7.1f} MB  (Summe {summe})")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
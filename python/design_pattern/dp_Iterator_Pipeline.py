@@ -0,0 +1,181 @@
+"""
+Problemstellung:
+Mit den Iteratoren aus dp_Iterator.py werden Elemente einzeln abgeholt. Sollen sie umgewandelt, gefiltert
+oder in Blöcken weiterverarbeitet werden, entstehen schnell Zwischenlisten ([f(x) for x in ...] und danach
+[x for x in ... if ...]). Bei sehr großen Datenströmen (Dateien, Datenbank-Abfragen) passen diese
+Zwischenlisten nicht mehr in den Speicher.
+
+Beispiele:
+Log-Dateien: Zeilen lesen -> parsen -> nur Fehler behalten -> in Blöcken zu 1000 in eine Datenbank schreiben.
+Messreihen: gleitende Fenster über einen endlosen Strom von Sensorwerten.
+
+Kurze Erklärung:
+Pipeline verkettet Verarbeitungsschritte, ohne etwas zu berechnen. Jeder Schritt legt nur einen neuen
+Iterator um den vorherigen (map, filter, itertools.islice, ...). Erst wenn am Ende jemand iteriert, wandert
+jedes Element einzeln durch alle Schritte - zu jedem Zeitpunkt liegt nur ein Element (bzw. ein Block oder
+ein Fenster) im Speicher, egal wie lang der Strom ist.
+Wo möglich, werden die in C implementierten Bausteine (map, filter, itertools) verwendet; sie werden bei der
+Iteration direkt hintereinander aufgerufen, ohne Python-Code dazwischen.
+
+Verwendung:
+    Pipeline(ListCollection(...)).map(f).filter(p).batch(1000)    # jede Quelle mit __iter__
+
+Nachteile:
+- Eine Pipeline kann nur einmal durchlaufen werden (wie jeder Iterator).
+- Fehler treten erst beim Durchlaufen auf, nicht beim Aufbau der Pipeline.
+"""
+
+import functools
+import itertools
+import sys
+import time
+from array import array
+from collections import deque
+
+from dp_Iterator import DictCollection, ListCollection, SetCollection
+
+# resource gibt es nur unter Unix (für die Speicheranzeige im Benchmark)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# Verkettbare, verzögert ausgewertete Verarbeitungsschritte über einer beliebigen Quelle
+class Pipeline:
+    def __init__(self, quelle):
+        # Quelle: Collection aus dp_Iterator.py, Iterator aus create_iterator() oder beliebiges Iterable
+        self._iterator = iter(quelle)
+
+    # Datei als Quelle: liefert die Zeilen ohne Zeilenumbruch (die Datei wird nie ganz gelesen)
+    @classmethod
+    def aus_datei(cls, pfad, encoding="utf-8"):
+        def zeilen():
+            with open(pfad, encoding=encoding) as datei:
+                for zeile in datei:
+                    yield zeile.rstrip("\n")
+        return cls(zeilen())
+
+    def __iter__(self):
+        return self._iterator
+
+    # === Zwischenschritte (liefern eine neue Pipeline, berechnen noch nichts) ===
+
+    # Wendet funktion auf jedes Element an
+    def map(self, funktion):
+        return Pipeline(map(funktion, self._iterator))
+
+    # Behält nur Elemente, für die bedingung wahr ist
+    def filter(self, bedingung):
+        return Pipeline(filter(bedingung, self._iterator))
+
+    # Jedes Element wird zu mehreren Elementen (funktion liefert ein Iterable)
+    def flat_map(self, funktion):
+        return Pipeline(itertools.chain.from_iterable(map(funktion, self._iterator)))
+
+    # Nur die ersten n Elemente (danach wird die Quelle nicht weiter gelesen)
+    def take(self, n):
+        return Pipeline(itertools.islice(self._iterator, n))
+
+    # Fasst je groesse Elemente zu einem Block zusammen (der letzte Block kann kürzer sein)
+    # typecode: Blöcke als array.array statt als Liste (z.B. "d" für Zahlen, 8 Bytes pro Wert)
+    def batch(self, groesse, typecode=None):
+        if groesse < 1:
+            raise ValueError("groesse muss mindestens 1 sein")
+        quelle = self._iterator
+        if typecode is None:
+            # iter(funktion, ende): ruft funktion auf, bis sie ende liefert - ganz ohne Python-Schleife
+            bloecke = iter(lambda: list(itertools.islice(quelle, groesse)), [])
+        else:
+            bloecke = iter(lambda: array(typecode, itertools.islice(quelle, groesse)), array(typecode))
+        return Pipeline(bloecke)
+
+    # Gleitende Fenster aus je groesse aufeinanderfolgenden Elementen (als Tupel), alle schritt Elemente
+    def window(self, groesse, schritt=1):
+        # schritt=0 würde endlos dasselbe Fenster liefern
+        if groesse < 1 or schritt < 1:
+            raise ValueError("groesse und schritt müssen mindestens 1 sein")
+        return Pipeline(_fenster(self._iterator, groesse, schritt))
+
+    # === Abschluss (durchläuft die Pipeline) ===
+
+    # Sammelt alle Elemente in einer Liste (nur für kleine Ergebnisse!)
+    def collect(self):
+        return list(self._iterator)
+
+    # Fasst alle Elemente mit funktion zu einem Wert zusammen
+    def reduce(self, funktion, start):
+        return functools.reduce(funktion, self._iterator, start)
+
+    # Anzahl der Elemente (ohne sie zu speichern)
+    def count(self):
+        # deque mit maxlen=0 verbraucht den Iterator in C ohne etwas aufzuheben
+        zaehler = itertools.count()
+        deque(zip(self._iterator, zaehler), maxlen=0)
+        return next(zaehler)
+
+
+# Generator für window(): hält nur das aktuelle Fenster im Speicher
+def _fenster(iterator, groesse, schritt):
+    fenster = deque(itertools.islice(iterator, groesse), maxlen=groesse)
+    if len(fenster) < groesse:
+        return
+    yield tuple(fenster)
+    while True:
+        neu = list(itertools.islice(iterator, schritt))
+        # Unvollständiges letztes Fenster wird nicht geliefert
+        if len(neu) < schritt:
+            return
+        # Die ältesten Elemente fallen durch maxlen automatisch heraus
+        fenster.extend(neu)
+        yield tuple(fenster)
+
+
+# Maximaler Speicherverbrauch des Prozesses in MB (Linux: ru_maxrss in KB), ohne resource (Windows) nan
+def spitzen_speicher_mb():
+    if resource is None:
+        return float("nan")
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    print("=== Pipeline über die Collections aus dp_Iterator.py ===")
+    zahlen = ListCollection(list(range(1, 21)))
+    print("Quadrate der geraden Zahlen:", Pipeline(zahlen).filter(lambda x: x % 2 == 0).map(lambda x: x * x).collect())
+    print("Blöcke zu 6:", Pipeline(zahlen).batch(6).collect())
+    print("Fenster 3, Schritt 2:", Pipeline(zahlen).take(9).window(3, 2).collect())
+    woerter = SetCollection(["Iterator", "Pipeline"])
+    print("Buchstaben (flat_map):", sorted(Pipeline(woerter).flat_map(str.lower).collect()))
+    preise = DictCollection({"Apfel": 1.2, "Birne": 0.8, "Mango": 2.5})
+    print("Teurer als 1 Euro:", Pipeline(preise).filter(lambda paar: paar[1] > 1).map(lambda paar: paar[0]).collect())
+
+    # Speicher-Benchmark: Anzahl Elemente als Parameter, z.B. "python dp_Iterator_Pipeline.py 100000000"
+    anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    print("\n=== Benchmark: Spitzen-Speicher (Prozess) ===")
+    print(f"{'Start':<40} {spitzen_speicher_mb():8.1f} MB")
+    for n in (anzahl // 100, anzahl // 10, anzahl):
+        start = time.perf_counter()
+        summe = (Pipeline(range(n))
+                 .map(lambda x: x * 3)
+                 .filter(lambda x: x % 2 == 0)
+                 .window(4, 2)
+                 .map(sum)
+                 .batch(1000, "q")
+                 .map(sum)
+                 .reduce(int.__add__, 0))
+        dauer = time.perf_counter() - start
+        print(f"{f'Pipeline, {n:,} Elemente':<40} {spitzen_speicher_mb():8.1f} MB  ({dauer:6.2f} s, Summe {summe})")
+    # Zum Vergleich: dieselben Schritte mit Zwischenlisten (nur für den kleineren Umfang)
+    n = anzahl // 10
+    start = time.perf_counter()
+    verdreifacht = [x * 3 for x in range(n)]
+    gerade = [x for x in verdreifacht if x % 2 == 0]
+    fenster = [sum(gerade[i:i + 4]) for i in range(0, len(gerade) - 3, 2)]
+    erwartet = sum(fenster)
+    dauer = time.perf_counter() - start
+    print(f"{f'Zwischenlisten, {n:,} Elemente':<40} {spitzen_speicher_mb():8.1f} MB  ({dauer:6.2f} s, Summe {erwartet})")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
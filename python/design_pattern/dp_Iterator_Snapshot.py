@@ -0,0 +1,273 @@
+"""
+Problemstellung:
+Der ListIterator aus dp_Iterator.py läuft über die lebende Liste collection.items. Wird sie während des
+Durchlaufs verändert (von der Schleife selbst oder von einem anderen Thread), werden Elemente stillschweigend
+übersprungen oder doppelt geliefert. Vorher eine Kopie anzulegen (list(items)) ist sicher, kostet aber bei
+jedem Durchlauf O(n) Zeit und Speicher - auch wenn sich gar nichts ändert.
+
+Beispiele:
+Eine Liste von Beobachtern wird benachrichtigt, während sich Beobachter an- und abmelden.
+Ein Web-Server liefert eine Konfiguration aus, die im Hintergrund aktualisiert wird.
+
+Kurze Erklärung:
+Die Collections führen eine Versionsnummer, die bei jeder Änderung erhöht wird, und arbeiten nach dem
+Prinzip Copy-on-Write:
+- create_iterator() kopiert nichts. Der Iterator merkt sich nur die aktuelle interne Liste (bzw. das
+  Dictionary) und markiert sie als "geteilt" - O(1).
+- Die erste Änderung nach einem solchen Schnappschuss legt eine Kopie an und ändert nur die Kopie; der
+  Iterator läuft ungestört über den alten, unveränderten Stand weiter. Weitere Änderungen bis zum nächsten
+  Schnappschuss arbeiten wieder direkt auf der (nun eigenen) Kopie - O(1).
+Ein Schnappschuss kostet also höchstens eine Kopie pro Version, und nur wenn danach wirklich geschrieben wird.
+Mit create_iterator(fail_fast=True) läuft der Iterator stattdessen über die lebenden Daten und meldet eine
+Änderung sofort mit RuntimeError (wie Python bei dict/set und Java mit ConcurrentModificationException).
+Schreibzugriffe sind durch eine Sperre geschützt; Leser brauchen sie nur kurz beim Anlegen des Iterators.
+
+Nachteile:
+- Abwechselnd Schnappschuss und Änderung (viele Leser, viele Schreiber) führt zu einer Kopie pro Änderung.
+- Ein Iterator sieht Änderungen, die nach seinem Anlegen erfolgen, grundsätzlich nicht.
+"""
+
+import threading
+import time
+
+from dp_Iterator import BasisIterator, ListCollection
+
+
+# Liste: Elemente, Dictionary: (Schlüssel, Wert)-Paare wie bei der DictCollection
+def _elemente(daten):
+    return iter(daten.items()) if isinstance(daten, dict) else iter(daten)
+
+
+# Gemeinsame Basis: Versionsnummer, Sperre für Schreiber und Copy-on-Write der internen Daten
+class _VersionierteCollection:
+    def __init__(self, daten):
+        self._daten = daten
+        # Wird bei jeder Änderung erhöht
+        self.version = 0
+        # True, solange ein Schnappschuss-Iterator die aktuellen Daten verwendet
+        self._geteilt = False
+        self._sperre = threading.Lock()
+
+    # Liefert die Daten zum Ändern (vorher kopiert, falls ein Iterator sie noch verwendet)
+    # Muss mit gehaltener Sperre aufgerufen werden
+    def _schreibbar(self):
+        if self._geteilt:
+            self._daten = self._daten.copy()
+            self._geteilt = False
+        self.version += 1
+        return self._daten
+
+    # Gibt die aktuellen Daten für einen Schnappschuss frei (ab jetzt nicht mehr direkt verändert)
+    def _schnappschuss(self):
+        with self._sperre:
+            self._geteilt = True
+            return self._daten, self.version
+
+    def create_iterator(self, fail_fast=False):
+        # Gibt einen Iterator für diese Collection zurück
+        if fail_fast:
+            return FailFastIterator(self)
+        return SnapshotIterator(self)
+
+    def __iter__(self):
+        # for element in collection: nativer Iterator über den Schnappschuss (kein Python-Aufruf pro Element)
+        daten, _ = self._schnappschuss()
+        return _elemente(daten)
+
+    def __len__(self):
+        return len(self._daten)
+
+
+# Liste mit Versionsnummer und Copy-on-Write-Schnappschüssen
+class SnapshotListCollection(_VersionierteCollection):
+    def __init__(self, items=()):
+        super().__init__(list(items))
+
+    def __getitem__(self, index):
+        return self._daten[index]
+
+    def __setitem__(self, index, wert):
+        with self._sperre:
+            self._schreibbar()[index] = wert
+
+    def __delitem__(self, index):
+        with self._sperre:
+            del self._schreibbar()[index]
+
+    def append(self, wert):
+        with self._sperre:
+            self._schreibbar().append(wert)
+
+    def extend(self, werte):
+        with self._sperre:
+            self._schreibbar().extend(werte)
+
+    def insert(self, index, wert):
+        with self._sperre:
+            self._schreibbar().insert(index, wert)
+
+    def remove(self, wert):
+        with self._sperre:
+            self._schreibbar().remove(wert)
+
+
+# Dictionary mit Versionsnummer und Copy-on-Write-Schnappschüssen (Iteration liefert (Schlüssel, Wert)-Paare)
+class SnapshotDictCollection(_VersionierteCollection):
+    def __init__(self, items=()):
+        super().__init__(dict(items))
+
+    def __getitem__(self, schluessel):
+        return self._daten[schluessel]
+
+    def get(self, schluessel, standard=None):
+        return self._daten.get(schluessel, standard)
+
+    def __setitem__(self, schluessel, wert):
+        with self._sperre:
+            self._schreibbar()[schluessel] = wert
+
+    def __delitem__(self, schluessel):
+        with self._sperre:
+            del self._schreibbar()[schluessel]
+
+
+# Durchläuft den Stand beim Anlegen des Iterators (nativer Iterator über unveränderliche Daten)
+class SnapshotIterator(BasisIterator):
+    def __init__(self, collection):
+        daten, self.version = collection._schnappschuss()
+        super().__init__(_elemente(daten))
+        self.collection = collection
+
+
+# Durchläuft die lebenden Daten und bricht bei einer Änderung mit RuntimeError ab
+class FailFastIterator(BasisIterator):
+    def __init__(self, collection):
+        self.collection = collection
+        self.version = collection.version
+        super().__init__(self._pruefend())
+
+    def _pruefend(self):
+        collection, version = self.collection, self.version
+        for element in _elemente(collection._daten):
+            # Geprüft wird vor jedem Element - auch eine Änderung, die die Länge nicht ändert, fällt auf
+            if collection.version != version:
+                raise RuntimeError("Collection wurde während des Durchlaufs verändert")
+            yield element
+        # Auch nach dem letzten Element: eine Änderung, die die Liste verkürzt, beendet die Schleife sonst still
+        if collection.version != version:
+            raise RuntimeError("Collection wurde während des Durchlaufs verändert")
+
+
+# === Vergleichsvarianten für den Benchmark ===
+
+# Schnappschuss durch vollständige Kopie bei jedem Durchlauf (unter der Sperre)
+class KopierendeListe:
+    def __init__(self, items):
+        self._daten = list(items)
+        self._sperre = threading.Lock()
+
+    def __setitem__(self, index, wert):
+        with self._sperre:
+            self._daten[index] = wert
+
+    def __iter__(self):
+        with self._sperre:
+            return iter(list(self._daten))
+
+
+# Klassisches Copy-on-Write: jede Änderung kopiert, egal ob ein Iterator die Daten verwendet
+class ImmerKopierendeListe:
+    def __init__(self, items):
+        self._daten = list(items)
+        self._sperre = threading.Lock()
+
+    def __setitem__(self, index, wert):
+        with self._sperre:
+            daten = self._daten.copy()
+            daten[index] = wert
+            self._daten = daten
+
+    def __iter__(self):
+        return iter(self._daten)
+
+
+# Schreibdurchsatz, während leser Threads die Collection ununterbrochen durchlaufen
+def schreib_benchmark(collection, leser, dauer=1.0, lese_pause=0.0):
+    stopp = threading.Event()
+    durchlaeufe = [0] * leser
+
+    def lesen(nummer):
+        while not stopp.is_set():
+            for _ in collection:
+                pass
+            durchlaeufe[nummer] += 1
+            if lese_pause:
+                time.sleep(lese_pause)
+
+    threads = [threading.Thread(target=lesen, args=(nummer,)) for nummer in range(leser)]
+    for thread in threads:
+        thread.start()
+    groesse = len(collection._daten)
+    geschrieben = 0
+    ende = time.perf_counter() + dauer
+    while time.perf_counter() < ende:
+        for _ in range(100):
+            collection[geschrieben % groesse] = geschrieben
+            geschrieben += 1
+    stopp.set()
+    for thread in threads:
+        thread.join()
+    return geschrieben / dauer, sum(durchlaeufe)
+
+
+def main():
+    print("=== Änderung während des Durchlaufs ===")
+    bisher = ListCollection(list(range(10)))
+    iterator = bisher.create_iterator()
+    gesehen = []
+    while iterator.has_next():
+        element = iterator.next()
+        gesehen.append(element)
+        if element % 2 == 0:
+            bisher.items.remove(element)
+    print("ListCollection (lebende Liste):   ", gesehen, "- Elemente übersprungen")
+
+    liste = SnapshotListCollection(range(10))
+    iterator = liste.create_iterator()
+    gesehen = []
+    while iterator.has_next():
+        element = iterator.next()
+        gesehen.append(element)
+        if element % 2 == 0:
+            liste.remove(element)
+    print("SnapshotListCollection:           ", gesehen, f"- Stand von Version {iterator.version}")
+    print(f"Danach (Version {liste.version}):{'':<14}", list(liste))
+
+    try:
+        for element in liste.create_iterator(fail_fast=True):
+            liste[0] = element
+    except RuntimeError as fehler:
+        print("fail_fast=True:                   ", fehler)
+
+    konfiguration = SnapshotDictCollection({"host": "localhost", "port": 8080})
+    for schluessel, wert in konfiguration:
+        # Änderungen während des Durchlaufs sind erlaubt (ein normales dict meldet RuntimeError)
+        konfiguration[schluessel + "_alt"] = wert
+    print("SnapshotDictCollection:           ", dict(konfiguration))
+
+    # Benchmark: Schreibdurchsatz bei gleichzeitig lesenden Threads
+    groesse = 10_000
+    print(f"\n=== Benchmark: Schreiben (liste[i] = wert) bei {groesse} Elementen und lesenden Threads ===")
+    for leser, lese_pause in ((0, 0.0), (2, 0.01), (2, 0.0)):
+        beschreibung = "ohne Leser" if not leser else f"{leser} Leser" + (" mit Pause" if lese_pause else " ständig")
+        print(beschreibung + ":")
+        for name, klasse in (("Kopie bei jedem Durchlauf", KopierendeListe),
+                             ("Kopie bei jeder Änderung", ImmerKopierendeListe),
+                             ("Copy-on-Write mit Version", SnapshotListCollection)):
+            schreiben, lesen = schreib_benchmark(klasse(range(groesse)), leser, dauer=1.0, lese_pause=lese_pause)
+            print(f"  {name:<28} {schreiben:>12,.0f} Schreibzugriffe/s  {lesen:>7} Durchläufe")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
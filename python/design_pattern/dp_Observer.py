@@ -24,8 +24,15 @@ Nachteile:
 - Erhöhter Aufwand für die Implementierung, da das Subject die Beobachter verwalten muss.
 - Es werden alle Änderungen an den Beobachter weitergegeben, auch wennn diese nicht relevant sind.
 - Beim löschen eines Beobachters muss darauf geachtet werden, dass diese auch beim Subject entfernt werden.
+  Abhilfe: add_observer(observer, weak=True) - der Sensor hält dann nur eine schwache Referenz (weakref),
+  ein gelöschter Beobachter verschwindet automatisch aus dem Verzeichnis.
+- sensor.observers ist keine echte Liste mehr, sondern eine Sicht auf das Verzeichnis: append, remove,
+  del und Zuweisung wirken weiterhin auf den Sensor, jede Abfrage erstellt aber eine neue Liste (O(n)).
 """
 
+import weakref
+from collections.abc import MutableSequence
+
 # Beispiel OHNE Observer Pattern (Polling)
 class SimpleTemperatureSensor:
     def __init__(self):
@@ -56,21 +63,6 @@ class SimpleCooler:
         else:
             print("SimpleCooler: Kühlung ausgeschaltet.")
 
-# Beispiel-Nutzung ohne Observer
-print("=== Ohne Observer ===")
-sensor = SimpleTemperatureSensor()   # Erstellt einen Temperatursensor
-heater = SimpleHeater()              # Erstellt eine Heizung
-cooler = SimpleCooler()              # Erstellt eine Kühlung
-
-sensor.set_temperature(16)           # Setzt die Temperatur
-heater.check_and_heat(sensor)        # Heizung fragt aktiv nach der Temperatur
-cooler.check_and_cool(sensor)        # Kühlung fragt aktiv nach der Temperatur
-
-sensor.set_temperature(28)           # Setzt eine neue Temperatur
-heater.check_and_heat(sensor)        # Heizung fragt erneut nach der Temperatur
-cooler.check_and_cool(sensor)        # Kühlung fragt erneut nach der Temperatur
-
-print("\n=== Mit Observer ===")
 
 # Beispiel MIT Observer Pattern
 class Observer:
@@ -84,17 +76,45 @@ class Observer:
 # In Sprachen wie C# wird oft ein Interface oder eine Basisklasse für das Subject verwendet.
 class TemperatureSensor:
     def __init__(self):
-        # Initialisiert die Temperatur und die Liste der Beobachter
+        # Initialisiert die Temperatur und das Verzeichnis der Beobachter
         self.temperature = 20
-        self.observers = []
+        # dict statt Liste: behält die Anmelde-Reihenfolge, Hinzufügen und Entfernen sind aber O(1)
+        # Schlüssel ist id(observer), Wert der Beobachter selbst oder eine schwache Referenz auf ihn
+        self._registry = {}
+        # Unveränderliche Kopie für notify_observers (wird erst nach einer Änderung neu erstellt)
+        self._schnappschuss = None
+        # Gemeinsame Aufräum-Funktion aller schwachen Referenzen (wird beim ersten weak=True erzeugt)
+        self._aufraeumen = None
 
-    def add_observer(self, observer):
+    def add_observer(self, observer, weak=False):
         # Fügt einen neuen Beobachter hinzu
-        self.observers.append(observer)
-    
+        # weak=True: der Sensor hält den Beobachter nicht am Leben - wird er gelöscht, meldet er sich selbst ab
+        if weak:
+            if self._aufraeumen is None:
+                self._aufraeumen = _aufraeumen_fuer(self)
+            referenz = _SchwacheReferenz(observer, self._aufraeumen)
+            referenz.schluessel = id(observer)
+            self._registry[referenz.schluessel] = referenz
+        else:
+            self._registry[id(observer)] = observer
+        self._schnappschuss = None
+
+    @property
+    def observers(self):
+        # Angemeldete Beobachter in Anmelde-Reihenfolge als veränderbare Sicht auf das Verzeichnis:
+        # append/remove/del/Zuweisung wirken wie add_observer/remove_observer (siehe _BeobachterSicht)
+        return _BeobachterSicht(self)
+
+    @observers.setter
+    def observers(self, beobachter):
+        # sensor.observers = [...] ersetzt alle Beobachter
+        _BeobachterSicht(self)[:] = beobachter
+
     def remove_observer(self, observer):
-        # Entfernt einen Beobachter
-        self.observers.remove(observer)
+        # Entfernt einen Beobachter (O(1) statt Suche in einer Liste)
+        if self._registry.pop(id(observer), None) is None:
+            raise ValueError("Beobachter ist nicht angemeldet")
+        self._schnappschuss = None
 
     def set_temperature(self, value):
         # Setzt die Temperatur und benachrichtigt alle Beobachter
@@ -103,9 +123,120 @@ class TemperatureSensor:
 
     def notify_observers(self):
         # Benachrichtigt alle registrierten Beobachter über die neue Temperatur
-        for observer in self.observers:
+        # Es wird über einen Schnappschuss iteriert, daher dürfen sich Beobachter während update() an- und abmelden
+        # (Änderungen gelten ab der nächsten Benachrichtigung - ein gerade abgemeldeter Beobachter erhält
+        # den laufenden Wert eventuell noch, ein neu angemeldeter erst den nächsten)
+        if self._schnappschuss is None:
+            self._schnappschuss = tuple(self._registry.values())
+        for observer in self._schnappschuss:
+            if type(observer) is _SchwacheReferenz:
+                observer = observer()
+                if observer is None:
+                    continue
             observer.update(self.temperature)
 
+# Schwache Referenz, die sich ihren Schlüssel im Verzeichnis merkt (__slots__: kein eigenes __dict__)
+class _SchwacheReferenz(weakref.ref):
+    __slots__ = ("schluessel",)
+
+# Erzeugt die Aufräum-Funktion eines Sensors
+# Sie kennt den Sensor nur schwach, dadurch entsteht kein Referenz-Zyklus Sensor -> Referenz -> Funktion -> Sensor
+def _aufraeumen_fuer(sensor):
+    sensor_referenz = weakref.ref(sensor)
+
+    def aufraeumen(referenz):
+        sensor = sensor_referenz()
+        if sensor is not None and sensor._registry.get(referenz.schluessel) is referenz:
+            del sensor._registry[referenz.schluessel]
+            sensor._schnappschuss = None
+
+    return aufraeumen
+
+# Listen-kompatible Sicht auf das Verzeichnis eines Sensors (früher war observers eine echte Liste)
+# Lesen löst schwache Referenzen auf; jede Änderung wird direkt in sensor._registry geschrieben
+class _BeobachterSicht(MutableSequence):
+    __slots__ = ("_sensor",)
+
+    def __init__(self, sensor):
+        self._sensor = sensor
+
+    # Aktuelle Beobachter als Liste (gelöschte schwach referenzierte Beobachter fehlen)
+    def _liste(self):
+        beobachter = []
+        for observer in self._sensor._registry.values():
+            if type(observer) is _SchwacheReferenz:
+                observer = observer()
+                if observer is None:
+                    continue
+            beobachter.append(observer)
+        return beobachter
+
+    # Übernimmt beobachter als neuen Inhalt: entfallende werden mit remove_observer abgemeldet, neue mit
+    # add_observer angemeldet (Unterklassen pflegen dabei ihre Indizes), bestehende Einträge - auch schwache
+    # Referenzen - bleiben erhalten und werden nur umsortiert (O(n))
+    def _ersetzen(self, beobachter):
+        sensor = self._sensor
+        beobachter = list(beobachter)
+        behalten = {id(observer) for observer in beobachter}
+        for observer in self._liste():
+            if id(observer) not in behalten:
+                sensor.remove_observer(observer)
+        for observer in beobachter:
+            if id(observer) not in sensor._registry:
+                sensor.add_observer(observer)
+        registry = sensor._registry
+        sensor._registry = {id(observer): registry[id(observer)] for observer in beobachter}
+        sensor._schnappschuss = None
+
+    def __len__(self):
+        return len(self._liste())
+
+    def __getitem__(self, index):
+        return self._liste()[index]
+
+    def __iter__(self):
+        return iter(self._liste())
+
+    def __contains__(self, observer):
+        # O(1) über den Schlüssel im Verzeichnis
+        eintrag = self._sensor._registry.get(id(observer))
+        if type(eintrag) is _SchwacheReferenz:
+            eintrag = eintrag()
+        return eintrag is observer
+
+    def append(self, observer):
+        self._sensor.add_observer(observer)
+
+    def remove(self, observer):
+        self._sensor.remove_observer(observer)
+
+    def clear(self):
+        self._ersetzen(())
+
+    # Zugriffe über Positionen ändern die Reihenfolge und bauen das Verzeichnis daher neu auf
+    def __setitem__(self, index, observer):
+        beobachter = self._liste()
+        beobachter[index] = observer
+        self._ersetzen(beobachter)
+
+    def __delitem__(self, index):
+        beobachter = self._liste()
+        del beobachter[index]
+        self._ersetzen(beobachter)
+
+    def insert(self, index, observer):
+        beobachter = self._liste()
+        beobachter.insert(index, observer)
+        self._ersetzen(beobachter)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _BeobachterSicht)):
+            return self._liste() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._liste())
+
 class Heater(Observer):
     def update(self, temperature):
         # Reagiert auf Temperaturänderungen
@@ -122,13 +253,41 @@ class Cooler(Observer):
         else:
             print("Cooler: Kühlung ausgeschaltet.")
 
-# Beispiel-Nutzung mit Observer
-sensor2 = TemperatureSensor()    # Erstellt einen Temperatursensor
-heater2 = Heater()               # Erstellt eine Heizung als Observer
-cooler2 = Cooler()               # Erstellt eine Kühlung als Observer
+# Programm-Einstiegspunkt (damit die Klassen auch aus anderen Modulen importiert werden können)
+if __name__ == "__main__":
+    # Beispiel-Nutzung ohne Observer
+    print("=== Ohne Observer ===")
+    sensor = SimpleTemperatureSensor()   # Erstellt einen Temperatursensor
+    heater = SimpleHeater()              # Erstellt eine Heizung
+    cooler = SimpleCooler()              # Erstellt eine Kühlung
+
+    sensor.set_temperature(16)           # Setzt die Temperatur
+    heater.check_and_heat(sensor)        # Heizung fragt aktiv nach der Temperatur
+    cooler.check_and_cool(sensor)        # Kühlung fragt aktiv nach der Temperatur
+
+    sensor.set_temperature(28)           # Setzt eine neue Temperatur
+    heater.check_and_heat(sensor)        # Heizung fragt erneut nach der Temperatur
+    cooler.check_and_cool(sensor)        # Kühlung fragt erneut nach der Temperatur
+
+    print("\n=== Mit Observer ===")
+
+    # Beispiel-Nutzung mit Observer
+    sensor2 = TemperatureSensor()    # Erstellt einen Temperatursensor
+    heater2 = Heater()               # Erstellt eine Heizung als Observer
+    cooler2 = Cooler()               # Erstellt eine Kühlung als Observer
+
+    sensor2.add_observer(heater2)    # Registriert die Heizung beim Sensor
+    sensor2.add_observer(cooler2)    # Registriert die Kühlung beim Sensor
 
-sensor2.add_observer(heater2)    # Registriert die Heizung beim Sensor
-sensor2.add_observer(cooler2)    # Registriert die Kühlung beim Sensor
+    sensor2.set_temperature(16)      # Setzt die Temperatur, alle Observer werden automatisch benachrichtigt
+    sensor2.set_temperature(28)      # Setzt eine neue Temperatur, alle Observer werden automatisch benachrichtigt
 
-sensor2.set_temperature(16)      # Setzt die Temperatur, alle Observer werden automatisch benachrichtigt
-sensor2.set_temperature(28)      # Setzt eine neue Temperatur, alle Observer werden automatisch benachrichtigt
\ No newline at end of file
+    print("\n=== Schwache Referenzen ===")
+    sensor3 = TemperatureSensor()
+    heater3 = Heater()
+    sensor3.add_observer(heater3, weak=True)   # Sensor hält die Heizung nicht am Leben
+    sensor3.add_observer(Cooler())             # Starke Referenz wie bisher
+    print(f"Angemeldete Beobachter: {len(sensor3.observers)}")
+    del heater3                                # Heizung wird gelöscht und meldet sich dabei automatisch ab
+    print(f"Nach dem Löschen der Heizung: {len(sensor3.observers)}")
+    sensor3.set_temperature(30)
@@ -0,0 +1,227 @@
+"""
+Problemstellung:
+Heater und Cooler aus dp_Observer.py reagieren auf jeden einzelnen Messwert. Bei hochfrequenten Sensoren
+interessieren aber meist Kennzahlen über ein Zeitfenster (Minimum, Maximum, Mittelwert der letzten n Werte)
+oder eine ausgedünnte Zeitreihe für Diagramme. Jeden Wert in einer Liste zu sammeln und pro Messwert
+min()/max()/sum() über das Fenster zu rechnen kostet O(Fenstergröße) pro Messwert und ständig neuen Speicher.
+
+Beispiele:
+Anzeige "Minimum/Maximum der letzten Stunde", gleitender Durchschnitt gegen Messrauschen,
+Verlaufsdiagramm mit einem Punkt pro Minute bei 1000 Messwerten pro Sekunde.
+
+Kurze Erklärung:
+AggregationsObserver ist ein normaler Observer. Alle Daten liegen in vorab angelegten array.array-Puffern
+fester Größe (Ringpuffer), pro Messwert wird kein neuer Container angelegt:
+- Fenster: Ringpuffer mit den letzten `fenster` Werten.
+- Mittelwert: laufende Summe (+ neuer Wert, - herausfallender Wert) -> O(1). Damit sich Rundungsfehler
+  nicht aufsummieren, wird die Summe nach jedem vollen Umlauf einmal exakt neu berechnet (math.fsum).
+- Minimum/Maximum: monotone Warteschlangen (ebenfalls Ringpuffer aus Indizes). Die Warteschlange fürs
+  Maximum enthält nur Werte, die noch Maximum werden können (absteigend sortiert); ein neuer Wert verdrängt
+  alle kleineren vom Ende. Jeder Index wird höchstens einmal eingefügt und entfernt -> amortisiert O(1).
+- Verlauf (Downsampling): je `schritt` Werte werden zu einem Punkt (min, max, mittel) zusammengefasst
+  und in einem eigenen Ringpuffer mit `verlauf` Punkten abgelegt.
+auslesen() und verlauf_auslesen() liefern die Daten blockweise als array.array in zeitlicher Reihenfolge.
+
+Nachteile:
+- Fenster und Verlauf haben eine feste Größe; ältere Werte gehen verloren.
+- Das Fenster zählt Messwerte, nicht Sekunden (bei unregelmäßigen Messungen ggf. Zeitstempel mitführen).
+"""
+
+import math
+import random
+import time
+import tracemalloc
+from array import array
+from collections import deque
+
+from dp_Observer import Observer, TemperatureSensor
+
+
+# Monotone Warteschlange in einem festen Ringpuffer aus Indizes (für gleitendes Minimum bzw. Maximum)
+class _MonotoneSchlange:
+    __slots__ = ("indizes", "kapazitaet", "kopf", "ende", "maximum")
+
+    def __init__(self, kapazitaet, maximum):
+        self.indizes = array("q", bytes(8 * kapazitaet))
+        self.kapazitaet = kapazitaet
+        # kopf/ende zählen fortlaufend, die Position im Ring ist jeweils % kapazitaet
+        self.kopf = 0
+        self.ende = 0
+        self.maximum = maximum
+
+    # Fügt den Wert mit Index i hinzu und verdrängt alle Werte, die nie mehr Minimum/Maximum werden können
+    def hinzufuegen(self, i, wert, werte, fenster):
+        indizes, kapazitaet = self.indizes, self.kapazitaet
+        ende = self.ende
+        if self.maximum:
+            while ende > self.kopf and werte[indizes[(ende - 1) % kapazitaet] % fenster] <= wert:
+                ende -= 1
+        else:
+            while ende > self.kopf and werte[indizes[(ende - 1) % kapazitaet] % fenster] >= wert:
+                ende -= 1
+        indizes[ende % kapazitaet] = i
+        self.ende = ende + 1
+        # Index, der aus dem Fenster gefallen ist, vorne entfernen
+        if indizes[self.kopf % kapazitaet] <= i - fenster:
+            self.kopf += 1
+
+    # Index des aktuellen Minimums/Maximums
+    def vorne(self):
+        return self.indizes[self.kopf % self.kapazitaet]
+
+
+# Observer, der Messwerte in Ringpuffern sammelt und gleitende Kennzahlen in O(1) pro Messwert führt
+class AggregationsObserver(Observer):
+    def __init__(self, fenster=1000, schritt=100, verlauf=1000):
+        self.fenster = fenster
+        self.schritt = schritt
+        # Ringpuffer der letzten fenster Werte (bytes(...) legt ihn in einem Stück mit Nullen an)
+        self._werte = array("d", bytes(8 * fenster))
+        # Anzahl aller bisher empfangenen Werte (zugleich Index des nächsten Wertes)
+        self.anzahl = 0
+        self._summe = 0.0
+        self._min = _MonotoneSchlange(fenster + 1, maximum=False)
+        self._max = _MonotoneSchlange(fenster + 1, maximum=True)
+        # Laufender Block für den Verlauf
+        self._block_min = math.inf
+        self._block_max = -math.inf
+        self._block_summe = 0.0
+        self._block_anzahl = 0
+        # Ringpuffer des Verlaufs: ein Punkt (min, max, mittel) je schritt Werte
+        self._verlauf_kapazitaet = verlauf
+        self._verlauf_min = array("d", bytes(8 * verlauf))
+        self._verlauf_max = array("d", bytes(8 * verlauf))
+        self._verlauf_mittel = array("d", bytes(8 * verlauf))
+        self.verlauf_anzahl = 0
+
+    # Wird vom Sensor bei jedem Messwert aufgerufen - O(1) (amortisiert)
+    def update(self, temperature):
+        i = self.anzahl
+        fenster = self.fenster
+        position = i % fenster
+        werte = self._werte
+        # Laufende Summe: herausfallenden Wert abziehen (erst wenn das Fenster voll ist)
+        if i >= fenster:
+            self._summe -= werte[position]
+        werte[position] = temperature
+        self._summe += temperature
+        self.anzahl = i + 1
+        # Nach jedem vollen Umlauf Rundungsfehler der laufenden Summe beseitigen (O(fenster) / fenster = O(1))
+        if position == fenster - 1:
+            self._summe = math.fsum(werte)
+        self._min.hinzufuegen(i, temperature, werte, fenster)
+        self._max.hinzufuegen(i, temperature, werte, fenster)
+
+        # Verlauf: Block fortschreiben und nach schritt Werten als Punkt ablegen
+        if temperature < self._block_min:
+            self._block_min = temperature
+        if temperature > self._block_max:
+            self._block_max = temperature
+        self._block_summe += temperature
+        self._block_anzahl += 1
+        if self._block_anzahl == self.schritt:
+            punkt = self.verlauf_anzahl % self._verlauf_kapazitaet
+            self._verlauf_min[punkt] = self._block_min
+            self._verlauf_max[punkt] = self._block_max
+            self._verlauf_mittel[punkt] = self._block_summe / self._block_anzahl
+            self.verlauf_anzahl += 1
+            self._block_min = math.inf
+            self._block_max = -math.inf
+            self._block_summe = 0.0
+            self._block_anzahl = 0
+
+    # Mehrere Werte auf einmal (z.B. gepufferte Zustellung aus dp_Observer_Async.py)
+    def update_batch(self, werte):
+        for wert in werte:
+            self.update(wert)
+
+    # === Gleitende Kennzahlen über das Fenster (O(1)) ===
+
+    @property
+    def minimum(self):
+        return self._werte[self._min.vorne() % self.fenster] if self.anzahl else None
+
+    @property
+    def maximum(self):
+        return self._werte[self._max.vorne() % self.fenster] if self.anzahl else None
+
+    @property
+    def mittelwert(self):
+        return self._summe / min(self.anzahl, self.fenster) if self.anzahl else None
+
+    # === Blockweises Auslesen ===
+
+    # Gibt den Inhalt eines Ringpuffers in zeitlicher Reihenfolge als neues array zurück (zwei Slices, keine Schleife)
+    @staticmethod
+    def _ring_auslesen(ring, anzahl, kapazitaet):
+        if anzahl <= kapazitaet:
+            return ring[:anzahl]
+        start = anzahl % kapazitaet
+        return ring[start:] + ring[:start]
+
+    # Die letzten min(anzahl, fenster) Werte, ältester zuerst
+    def auslesen(self):
+        return self._ring_auslesen(self._werte, self.anzahl, self.fenster)
+
+    # Der ausgedünnte Verlauf als drei arrays (min, max, mittel), ältester Punkt zuerst
+    def verlauf_auslesen(self):
+        return tuple(self._ring_auslesen(ring, self.verlauf_anzahl, self._verlauf_kapazitaet)
+                     for ring in (self._verlauf_min, self._verlauf_max, self._verlauf_mittel))
+
+
+# Vergleichsbasis: Werte sammeln und die Kennzahlen bei jedem Messwert neu über das Fenster berechnen
+class NaiverAggregationsObserver(Observer):
+    def __init__(self, fenster=1000):
+        self.werte = deque(maxlen=fenster)
+
+    def update(self, temperature):
+        self.werte.append(temperature)
+        self.minimum = min(self.werte)
+        self.maximum = max(self.werte)
+        self.mittelwert = sum(self.werte) / len(self.werte)
+
+
+def main():
+    print("=== Aggregierender Beobachter ===")
+    sensor = TemperatureSensor()
+    statistik = AggregationsObserver(fenster=5, schritt=3, verlauf=4)
+    sensor.add_observer(statistik)
+    for wert in (20, 19, 16, 15, 17, 22, 28, 30, 21, 18):
+        sensor.set_temperature(wert)
+        print(f"Temperatur {wert:>2}: Fenster {statistik.auslesen().tolist()}  min {statistik.minimum}, "
+              f"max {statistik.maximum}, Mittel {statistik.mittelwert:.1f}")
+    minima, maxima, mittel = statistik.verlauf_auslesen()
+    print(f"Verlauf (je 3 Werte): min {minima.tolist()}, max {maxima.tolist()}, "
+          f"Mittel {[round(wert, 2) for wert in mittel]}")
+
+    # Benchmark: Zeit pro Messwert, naive Berechnung gegen Ringpuffer
+    fenster = 1000
+    werte = [20 + random.gauss(0, 3) for _ in range(1_000_000)]
+    print(f"\n=== Benchmark: Fenster {fenster} ===")
+    for name, observer, anzahl in (("Naiv (min/max/sum pro Wert)", NaiverAggregationsObserver(fenster), 100_000),
+                                   ("Ringpuffer + monotone Schlangen", AggregationsObserver(fenster), len(werte))):
+        sensor = TemperatureSensor()
+        sensor.add_observer(observer)
+        start = time.perf_counter()
+        for wert in werte[:anzahl]:
+            sensor.set_temperature(wert)
+        dauer = time.perf_counter() - start
+        print(f"{name:<34} {anzahl:>9} Werte  {dauer / anzahl * 1e6:7.2f} µs pro Wert")
+        letzte = werte[anzahl - fenster:anzahl]
+        assert observer.minimum == min(letzte) and observer.maximum == max(letzte)
+        assert math.isclose(observer.mittelwert, sum(letzte) / fenster)
+
+    # Speicher: nach dem Anlegen wächst der Beobachter nicht mehr
+    tracemalloc.start()
+    observer = AggregationsObserver(fenster)
+    vorher = tracemalloc.get_traced_memory()[0]
+    for wert in werte:
+        observer.update(wert)
+    nachher = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Speicher-Zuwachs nach {len(werte)} Werten: {nachher - vorher} Bytes")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
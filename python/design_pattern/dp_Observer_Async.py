@@ -0,0 +1,412 @@
+"""
+Problemstellung:
+TemperatureSensor.set_temperature aus dp_Observer.py ruft notify_observers synchron auf: update() jedes
+Beobachters läuft im Thread des Aufrufers. Ein einziger langsamer Beobachter (z.B. eine Heizung, die erst ein
+Relais schalten muss) hält damit den Sensor und alle übrigen Beobachter auf.
+
+Beispiele:
+Ein Sensor liefert tausende Messwerte pro Sekunde, eine Anzeige aktualisiert sich aber nur 30 mal pro Sekunde.
+Ein Protokoll-Beobachter soll JEDEN Messwert erhalten, darf den Sensor aber nicht unbegrenzt aufhalten.
+
+Kurze Erklärung:
+AsyncTemperatureSensor legt den neuen Wert nur ab und weckt einen Verteiler (Dispatcher). Zugestellt wird auf
+Worker-Threads (ThreadDispatcher) oder in einer asyncio-Ereignisschleife (AsyncioDispatcher).
+- Zusammenfassen (Standard): Jeder Beobachter bekommt immer nur den NEUESTEN Wert. Kommen während einer
+  Zustellung weitere Werte an, erhält er danach genau einen Aufruf mit dem letzten Wert. set_temperature
+  ist dadurch O(1), unabhängig von der Anzahl der Beobachter.
+- Puffern (add_observer(..., puffer=n)): Der Beobachter bekommt jeden Wert, höchstens n Werte warten.
+  Ist der Puffer voll, wird entweder der älteste Wert verworfen (bei_voll="verwerfen") oder set_temperature
+  wartet, bis der Beobachter aufgeholt hat (bei_voll="warten" = Gegendruck / Backpressure).
+  Hat der Beobachter eine Methode update_batch(werte), bekommt er alle wartenden Werte in einem Aufruf.
+- Ein Beobachter wird nie von zwei Threads gleichzeitig aufgerufen; ein langsamer Beobachter belegt höchstens
+  einen Worker, die anderen Beobachter werden weiter beliefert.
+
+Nachteile:
+- update() läuft nicht mehr im Thread des Aufrufers - Beobachter müssen threadsicher sein.
+- Zusammengefasste Zwischenwerte kommen beim Beobachter nie an.
+- Sind alle Worker mit langsamen Beobachtern belegt, warten die übrigen (mehr Worker einstellen).
+- Beim AsyncioDispatcher blockiert ein langsamer synchroner update() die ganze Ereignisschleife;
+  update() sollte dort eine Coroutine sein. bei_voll="warten" nur aufrufen, wenn set_temperature nicht
+  selbst in der Ereignisschleife läuft.
+"""
+
+import asyncio
+import inspect
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+from dp_Observer import Observer, TemperatureSensor
+
+# Anzahl Worker-Threads des ThreadDispatchers (Standard)
+STANDARD_WORKER = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Zustellungs-Zustand eines Beobachters
+class Abonnement:
+    # __slots__: bei 10.000 Beobachtern spart das deutlich Speicher
+    __slots__ = ("observer", "puffer", "bei_voll", "version", "laeuft", "entfernt")
+
+    def __init__(self, observer, puffer, bei_voll, version):
+        self.observer = observer
+        # None = nur den neuesten Wert zustellen, sonst Warteschlange mit höchstens puffer Werten
+        self.puffer = None if puffer is None else deque(maxlen=puffer)
+        self.bei_voll = bei_voll
+        # Version des zuletzt zugestellten Wertes (beim Zusammenfassen)
+        self.version = version
+        # True, solange das Abonnement in einer Warteschlange liegt oder beliefert wird
+        self.laeuft = False
+        self.entfernt = False
+
+
+# Sensor, der seine Beobachter asynchron über einen Dispatcher benachrichtigt
+class AsyncTemperatureSensor(TemperatureSensor):
+    def __init__(self, dispatcher=None):
+        super().__init__()
+        # Wird bei jedem neuen Wert erhöht (zeigt an, ob ein Beobachter schon aktuell ist)
+        self.version = 0
+        # Beobachter -> Abonnement (dict: Hinzufügen und Entfernen in O(1))
+        self.abonnements = {}
+        # Nur die Abonnements mit Puffer, denn nur diese müssen bei jedem Wert angefasst werden
+        self._gepuffert = {}
+        # Eine Sperre für den ganzen Zustand, die Bedingung weckt wartende Sender und warten_bis_zugestellt()
+        self._bedingung = threading.Condition()
+        # True, solange ein Wecksignal unterwegs ist (weitere Werte lösen kein zweites aus)
+        self._geweckt = False
+        # Anzahl Abonnements, die gerade beliefert werden
+        self._aktiv = 0
+        # Statistik: verworfene Werte (volle Puffer) und Ausnahmen in update()
+        self.verworfen = 0
+        self.fehler = 0
+        self.dispatcher = dispatcher or ThreadDispatcher()
+        self.dispatcher.starten(self)
+
+    # Registriert einen Beobachter; puffer=None fasst zusammen, puffer=n stellt jeden Wert zu
+    def add_observer(self, observer, puffer=None, bei_voll="verwerfen"):
+        if bei_voll not in ("verwerfen", "warten"):
+            raise ValueError(f"Unbekanntes Verhalten bei vollem Puffer: {bei_voll}")
+        with self._bedingung:
+            super().add_observer(observer)
+            abonnement = Abonnement(observer, puffer, bei_voll, self.version)
+            self.abonnements[observer] = abonnement
+            if puffer is not None:
+                self._gepuffert[observer] = abonnement
+
+    # Entfernt einen Beobachter; eine laufende Zustellung wird noch beendet
+    def remove_observer(self, observer):
+        with self._bedingung:
+            super().remove_observer(observer)
+            abonnement = self.abonnements.pop(observer)
+            self._gepuffert.pop(observer, None)
+            abonnement.entfernt = True
+            # Eventuell wartende Sender freigeben
+            self._bedingung.notify_all()
+
+    # Setzt die Temperatur - kehrt sofort zurück (außer bei vollem Puffer mit bei_voll="warten")
+    def set_temperature(self, value):
+        with self._bedingung:
+            # Gegendruck: warten, bis alle "warten"-Puffer wieder Platz haben
+            self._bedingung.wait_for(self._platz_in_puffern)
+            self.temperature = value
+            self.version += 1
+            for abonnement in self._gepuffert.values():
+                if len(abonnement.puffer) == abonnement.puffer.maxlen:
+                    # deque mit maxlen verwirft den ältesten Wert beim append selbst
+                    self.verworfen += 1
+                abonnement.puffer.append(value)
+            self.notify_observers()
+
+    # Weckt den Dispatcher (nur einmal pro Schub von Werten)
+    def notify_observers(self):
+        with self._bedingung:
+            if self._geweckt:
+                return
+            self._geweckt = True
+        self.dispatcher.wecken()
+
+    # Wartet, bis alle bisherigen Werte zugestellt sind (z.B. für Tests und Benchmarks)
+    def warten_bis_zugestellt(self, timeout=None):
+        with self._bedingung:
+            return self._bedingung.wait_for(lambda: not self._geweckt and self._aktiv == 0, timeout)
+
+    # Beendet den Dispatcher
+    def schliessen(self):
+        self.dispatcher.stoppen()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliessen()
+
+    # === Hilfsmethoden für die Dispatcher (laufen unter der Sperre) ===
+
+    def _platz_in_puffern(self):
+        return all(abonnement.bei_voll != "warten" or len(abonnement.puffer) < abonnement.puffer.maxlen
+                   for abonnement in self._gepuffert.values())
+
+    def _hat_neues(self, abonnement):
+        if abonnement.puffer is not None:
+            return bool(abonnement.puffer)
+        return abonnement.version != self.version
+
+    # Wird vom Dispatcher nach dem Wecken aufgerufen: liefert alle Abonnements, die beliefert werden müssen
+    def _faellige_abonnements(self):
+        with self._bedingung:
+            self._geweckt = False
+            faellig = [abonnement for abonnement in self.abonnements.values()
+                       if not abonnement.laeuft and self._hat_neues(abonnement)]
+            for abonnement in faellig:
+                abonnement.laeuft = True
+            self._aktiv += len(faellig)
+            if not faellig:
+                self._bedingung.notify_all()
+            return faellig
+
+    # Holt die zuzustellenden Werte eines Abonnements ab; None = nichts Neues, Abonnement ist fertig
+    def _abholen(self, abonnement):
+        with self._bedingung:
+            werte = None
+            if abonnement.entfernt:
+                pass
+            elif abonnement.puffer is not None:
+                if abonnement.puffer:
+                    werte = list(abonnement.puffer)
+                    abonnement.puffer.clear()
+                    # Sender, die auf Platz warten, wecken
+                    self._bedingung.notify_all()
+            elif abonnement.version != self.version:
+                abonnement.version = self.version
+                werte = [self.temperature]
+            if werte is None:
+                abonnement.laeuft = False
+                self._aktiv -= 1
+                if self._aktiv == 0:
+                    self._bedingung.notify_all()
+            return werte
+
+    # Ruft update bzw. update_batch auf; Ausnahmen eines Beobachters stören die anderen nicht
+    # Gibt zurückgelieferte Coroutinen zurück (für den AsyncioDispatcher)
+    def _zustellen(self, abonnement, werte):
+        observer = abonnement.observer
+        ergebnisse = []
+        try:
+            if len(werte) > 1 and hasattr(observer, "update_batch"):
+                ergebnisse.append(observer.update_batch(werte))
+            else:
+                for wert in werte:
+                    ergebnisse.append(observer.update(wert))
+        except Exception:
+            with self._bedingung:
+                self.fehler += 1
+        return [ergebnis for ergebnis in ergebnisse if inspect.isawaitable(ergebnis)]
+
+
+# Stellt auf einem Pool von Worker-Threads zu
+class ThreadDispatcher:
+    def __init__(self, worker=STANDARD_WORKER):
+        self.worker = worker
+        # Warteschlange der Abonnements, die beliefert werden sollen
+        self._warteschlange = queue.SimpleQueue()
+        self._signal = threading.Event()
+        self._stopp = False
+        self._threads = []
+
+    # Startet Koordinator- und Worker-Threads (daemon: sie halten das Programm nicht am Leben)
+    def starten(self, sensor):
+        self.sensor = sensor
+        self._threads = [threading.Thread(target=self._koordinieren, daemon=True)]
+        self._threads += [threading.Thread(target=self._arbeiten, daemon=True) for _ in range(self.worker)]
+        for thread in self._threads:
+            thread.start()
+
+    def wecken(self):
+        self._signal.set()
+
+    # Koordinator: verteilt nach jedem Wecken die fälligen Abonnements auf die Worker
+    def _koordinieren(self):
+        while True:
+            self._signal.wait()
+            self._signal.clear()
+            if self._stopp:
+                break
+            for abonnement in self.sensor._faellige_abonnements():
+                self._warteschlange.put(abonnement)
+
+    # Worker: stellt EINEN Schub zu und reiht das Abonnement danach wieder hinten ein
+    # (so kommt ein Beobachter mit ständig neuen Werten nicht vor allen anderen dran)
+    def _arbeiten(self):
+        while True:
+            abonnement = self._warteschlange.get()
+            if abonnement is None:
+                break
+            werte = self.sensor._abholen(abonnement)
+            if werte is not None:
+                self.sensor._zustellen(abonnement, werte)
+                self._warteschlange.put(abonnement)
+
+    def stoppen(self):
+        self._stopp = True
+        self._signal.set()
+        for _ in range(self.worker):
+            self._warteschlange.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+# Stellt in einer asyncio-Ereignisschleife zu; update() darf eine Coroutine sein
+class AsyncioDispatcher:
+    def __init__(self, loop):
+        self.loop = loop
+        self._aufgaben = set()
+
+    def starten(self, sensor):
+        self.sensor = sensor
+
+    # Darf aus jedem Thread aufgerufen werden
+    def wecken(self):
+        self.loop.call_soon_threadsafe(self._verteilen)
+
+    def _verteilen(self):
+        for abonnement in self.sensor._faellige_abonnements():
+            aufgabe = self.loop.create_task(self._beliefern(abonnement))
+            # Referenz halten, sonst kann die Aufgabe vorzeitig aufgeräumt werden
+            self._aufgaben.add(aufgabe)
+            aufgabe.add_done_callback(self._aufgaben.discard)
+
+    async def _beliefern(self, abonnement):
+        while True:
+            werte = self.sensor._abholen(abonnement)
+            if werte is None:
+                return
+            for coroutine in self.sensor._zustellen(abonnement, werte):
+                try:
+                    await coroutine
+                except Exception:
+                    with self.sensor._bedingung:
+                        self.sensor.fehler += 1
+            # Anderen Beobachtern den Vortritt lassen
+            await asyncio.sleep(0)
+
+    def stoppen(self):
+        pass
+
+
+# Beobachter für den Benchmark: zählt Aufrufe und merkt sich den letzten Wert
+class ZaehlenderObserver(Observer):
+    def __init__(self, dauer=0.0):
+        self.aufrufe = 0
+        self.letzter = None
+        self.dauer = dauer
+
+    def update(self, temperature):
+        if self.dauer:
+            time.sleep(self.dauer)
+        self.aufrufe += 1
+        self.letzter = temperature
+
+
+# Sammelt jeden Wert, nimmt ganze Schübe über update_batch entgegen
+class ProtokollObserver(Observer):
+    def __init__(self):
+        self.werte = []
+
+    def update(self, temperature):
+        self.werte.append(temperature)
+
+    def update_batch(self, werte):
+        self.werte.extend(werte)
+
+
+# Beobachter mit Coroutine für den AsyncioDispatcher
+class AsyncObserver(Observer):
+    def __init__(self):
+        self.aufrufe = 0
+        self.letzter = None
+
+    async def update(self, temperature):
+        await asyncio.sleep(0)
+        self.aufrufe += 1
+        self.letzter = temperature
+
+
+def main():
+    print("=== Asynchrone Zustellung ===\n")
+    with AsyncTemperatureSensor(ThreadDispatcher(worker=2)) as sensor:
+        langsam = ZaehlenderObserver(dauer=0.05)
+        schnell = ZaehlenderObserver()
+        protokoll = ProtokollObserver()
+        sensor.add_observer(langsam)
+        sensor.add_observer(schnell)
+        sensor.add_observer(protokoll, puffer=1000, bei_voll="warten")
+        # Alle 2 ms ein neuer Wert; gemessen wird der längste set_temperature-Aufruf
+        laengster = 0.0
+        for wert in range(100):
+            start = time.perf_counter()
+            sensor.set_temperature(wert)
+            laengster = max(laengster, time.perf_counter() - start)
+            time.sleep(0.002)
+        print(f"Längster set_temperature-Aufruf trotz langsamem Beobachter (50 ms): {laengster * 1000:.3f} ms")
+        sensor.warten_bis_zugestellt()
+        print(f"Langsamer Beobachter: {langsam.aufrufe} Aufrufe, letzter Wert {langsam.letzter}")
+        print(f"Schneller Beobachter: {schnell.aufrufe} Aufrufe, letzter Wert {schnell.letzter}")
+        print(f"Protokoll (gepuffert): {len(protokoll.werte)} Werte, lückenlos: {protokoll.werte == list(range(100))}")
+
+    # Benchmark: 10.000 Beobachter, viele Werte in kurzer Zeit
+    anzahl_beobachter = 10_000
+    anzahl_werte = 200
+    print(f"\n=== Benchmark: {anzahl_beobachter} Beobachter, {anzahl_werte} Werte ===")
+
+    synchron = TemperatureSensor()
+    beobachter = [ZaehlenderObserver() for _ in range(anzahl_beobachter)]
+    for observer in beobachter:
+        synchron.add_observer(observer)
+    start = time.perf_counter()
+    for wert in range(anzahl_werte):
+        synchron.set_temperature(wert)
+    dauer = time.perf_counter() - start
+    print(f"{'Synchron (dp_Observer)':<26} Sender {dauer * 1000:9.2f} ms, "
+          f"{sum(o.aufrufe for o in beobachter):>8} update()-Aufrufe")
+
+    for name, erzeuge in (("ThreadDispatcher", lambda loop: ThreadDispatcher()),
+                          ("AsyncioDispatcher", lambda loop: AsyncioDispatcher(loop))):
+        # Ereignisschleife in einem eigenen Thread, damit der Sender (Haupt-Thread) nicht blockiert
+        loop = asyncio.new_event_loop()
+        schleife = threading.Thread(target=loop.run_forever, daemon=True)
+        schleife.start()
+        with AsyncTemperatureSensor(erzeuge(loop)) as sensor:
+            klasse = AsyncObserver if name == "AsyncioDispatcher" else ZaehlenderObserver
+            beobachter = [klasse() for _ in range(anzahl_beobachter)]
+            for observer in beobachter:
+                sensor.add_observer(observer)
+            start = time.perf_counter()
+            for wert in range(anzahl_werte):
+                sensor.set_temperature(wert)
+            sender = time.perf_counter() - start
+            sensor.warten_bis_zugestellt()
+            gesamt = time.perf_counter() - start
+            assert all(o.letzter == anzahl_werte - 1 for o in beobachter)
+            print(f"{name:<26} Sender {sender * 1000:9.2f} ms, {sum(o.aufrufe for o in beobachter):>8} "
+                  f"update()-Aufrufe, alle aktuell nach {gesamt * 1000:9.2f} ms")
+        loop.call_soon_threadsafe(loop.stop)
+        schleife.join()
+        loop.close()
+
+    # Hohe Rate: wie viele Werte pro Sekunde nimmt der Sensor an?
+    with AsyncTemperatureSensor() as sensor:
+        for observer in [ZaehlenderObserver() for _ in range(anzahl_beobachter)]:
+            sensor.add_observer(observer)
+        anzahl = 100_000
+        start = time.perf_counter()
+        for wert in range(anzahl):
+            sensor.set_temperature(wert)
+        dauer = time.perf_counter() - start
+        sensor.warten_bis_zugestellt()
+        print(f"\n{anzahl} Werte an {anzahl_beobachter} Beobachter: {anzahl / dauer:,.0f} Werte/s beim Sender")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
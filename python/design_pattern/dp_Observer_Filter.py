@@ -0,0 +1,307 @@
+"""
+Problemstellung:
+In dp_Observer.py bekommt jeder Beobachter jede Änderung, auch wenn sie für ihn nicht relevant ist (siehe
+Nachteile dort): Die Heizung interessiert sich nur für Temperaturen unter 18 Grad, die Kühlung nur für
+Temperaturen über 25 Grad. Bei vielen Beobachtern kostet jeder Messwert n update()-Aufrufe, von denen fast
+alle nichts tun.
+
+Beispiele:
+Alarmregeln ("melde, wenn der Wert 80 überschreitet"), Kurs-Alarme an der Börse, Grenzwerte in der
+Gebäudetechnik - tausende Regeln, aber pro Messwert sind nur wenige betroffen.
+
+Kurze Erklärung:
+Beobachter melden beim FilterTemperatureSensor an, welcher Bereich [untergrenze, obergrenze) sie interessiert.
+- modus="wechsel" (Standard): update() nur, wenn die Temperatur den Bereich betritt oder verlässt.
+  Dafür liegen alle Bereichsgrenzen in EINER sortierten Liste. Von alt nach neu wechseln genau die
+  Beobachter, deren Grenze zwischen alt und neu liegt -> Bisektion findet sie in O(log n + Treffer).
+- modus="innerhalb": update() bei jeder Änderung, solange die Temperatur im Bereich liegt.
+  Ein Intervall-Baum beantwortet "welche Bereiche enthalten den Wert?" in O(log n + Treffer).
+- bedingung=funktion: beliebige Bedingung statt Bereich; sie kann nicht indiziert werden und wird bei jeder
+  Änderung geprüft (nur für wenige Beobachter gedacht).
+Ohne Bereich und Bedingung verhält sich ein Beobachter wie bisher. Ändert sich der Wert nicht, wird
+niemand benachrichtigt.
+
+Nachteile:
+- Der Intervall-Baum wird nach dem Hinzufügen/Entfernen von Beobachtern beim nächsten Wert neu aufgebaut
+  (O(n log n)); häufiges An- und Abmelden zwischen einzelnen Werten ist dafür teuer.
+- Die Reihenfolge der Benachrichtigungen entspricht nicht mehr der Reihenfolge der Anmeldung.
+"""
+
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+
+from dp_Observer import Cooler, Heater, Observer, TemperatureSensor
+
+UNENDLICH = float("inf")
+
+
+# Anmeldung eines Beobachters mit Bereich oder Bedingung
+class Interesse:
+    __slots__ = ("observer", "untergrenze", "obergrenze", "bedingung", "modus", "nummer")
+
+    def __init__(self, observer, untergrenze, obergrenze, bedingung, modus, nummer):
+        self.observer = observer
+        self.untergrenze = untergrenze
+        self.obergrenze = obergrenze
+        self.bedingung = bedingung
+        self.modus = modus
+        # Eindeutige Nummer: macht Einträge mit gleicher Grenze in den sortierten Listen unterscheidbar
+        self.nummer = nummer
+
+    # Liegt der Wert im Bereich bzw. erfüllt er die Bedingung?
+    def passt(self, wert):
+        if self.bedingung is not None:
+            return bool(self.bedingung(wert))
+        return self.untergrenze <= wert < self.obergrenze
+
+
+# Intervall-Baum (zentriert): jeder Knoten speichert die Bereiche, die seinen Mittelpunkt enthalten
+class IntervallBaum:
+    __slots__ = ("mitte", "nach_start", "nach_ende", "links", "rechts")
+
+    def __init__(self, interessen):
+        # Mittelpunkt: Start des mittleren Bereichs (nach Start sortiert) -> Baumtiefe O(log n)
+        # Dieser Bereich enthält seine Mitte selbst, daher wird jeder Teilbaum echt kleiner
+        mittlerer = sorted(interessen, key=lambda i: i.untergrenze)[len(interessen) // 2]
+        if mittlerer.untergrenze != -UNENDLICH:
+            self.mitte = mittlerer.untergrenze
+        else:
+            self.mitte = mittlerer.obergrenze - 1 if mittlerer.obergrenze != UNENDLICH else 0
+        links, rechts, hier = [], [], []
+        for interesse in interessen:
+            if interesse.obergrenze <= self.mitte:
+                links.append(interesse)
+            elif interesse.untergrenze > self.mitte:
+                rechts.append(interesse)
+            else:
+                hier.append(interesse)
+        # Zwei Sortierungen der Bereiche am Knoten: aufsteigend nach Start, absteigend nach Ende
+        self.nach_start = sorted(hier, key=lambda i: i.untergrenze)
+        self.nach_ende = sorted(hier, key=lambda i: i.obergrenze, reverse=True)
+        self.links = IntervallBaum(links) if links else None
+        self.rechts = IntervallBaum(rechts) if rechts else None
+
+    # Liefert alle Bereiche, die wert enthalten (ohne Rekursion)
+    def enthalten(self, wert):
+        knoten = self
+        while knoten is not None:
+            if wert < knoten.mitte:
+                # Alle Bereiche am Knoten enden hinter der Mitte - nur der Start ist zu prüfen
+                for interesse in knoten.nach_start:
+                    if interesse.untergrenze > wert:
+                        break
+                    yield interesse
+                knoten = knoten.links
+            elif wert > knoten.mitte:
+                # Alle Bereiche am Knoten beginnen vor der Mitte - nur das Ende ist zu prüfen
+                for interesse in knoten.nach_ende:
+                    if interesse.obergrenze <= wert:
+                        break
+                    yield interesse
+                knoten = knoten.rechts
+            else:
+                yield from knoten.nach_start
+                return
+
+
+# Sensor, der nur die Beobachter benachrichtigt, deren Bereich betroffen ist
+class FilterTemperatureSensor(TemperatureSensor):
+    def __init__(self):
+        super().__init__()
+        # Beobachter -> Interesse
+        self.interessen = {}
+        # modus="wechsel": sortierte Liste aller endlichen Grenzen als (grenze, nummer, interesse)
+        self._grenzen = []
+        # modus="innerhalb": Interessen mit Bereich und der daraus gebaute Intervall-Baum
+        self._innerhalb = {}
+        self._baum = None
+        self._baum_veraltet = False
+        # Interessen mit Bedingung (werden immer geprüft) und Beobachter ohne Filter
+        self._bedingungen = {}
+        self._ungefiltert = {}
+        self._nummern = count()
+        # Statistik: Anzahl der geprüften Interessen (zeigt den Nutzen des Index)
+        self.besucht = 0
+
+    # Registriert einen Beobachter; untergrenze/obergrenze None = unbeschränkt
+    def add_observer(self, observer, untergrenze=None, obergrenze=None, bedingung=None, modus="wechsel"):
+        if modus not in ("wechsel", "innerhalb"):
+            raise ValueError(f"Unbekannter Modus: {modus}")
+        if untergrenze is not None and obergrenze is not None and untergrenze >= obergrenze:
+            raise ValueError("untergrenze muss kleiner als obergrenze sein")
+        # Erneute Anmeldung ersetzt das bisherige Interesse (sonst blieben seine Einträge in den Indizes stehen)
+        if observer in self.interessen or observer in self._ungefiltert:
+            self.remove_observer(observer)
+        super().add_observer(observer)
+        if untergrenze is None and obergrenze is None and bedingung is None:
+            self._ungefiltert[observer] = None
+            return
+        interesse = Interesse(observer, -UNENDLICH if untergrenze is None else untergrenze,
+                              UNENDLICH if obergrenze is None else obergrenze,
+                              bedingung, modus, next(self._nummern))
+        self.interessen[observer] = interesse
+        if bedingung is not None:
+            self._bedingungen[observer] = interesse
+        elif modus == "innerhalb":
+            self._innerhalb[observer] = interesse
+            self._baum_veraltet = True
+        else:
+            for grenze in self._endliche_grenzen(interesse):
+                insort(self._grenzen, (grenze, interesse.nummer, interesse))
+
+    # Entfernt einen Beobachter
+    def remove_observer(self, observer):
+        super().remove_observer(observer)
+        if self._ungefiltert.pop(observer, 0) is None:
+            return
+        interesse = self.interessen.pop(observer)
+        if self._bedingungen.pop(observer, None) is not None:
+            return
+        if self._innerhalb.pop(observer, None) is not None:
+            self._baum_veraltet = True
+            return
+        for grenze in self._endliche_grenzen(interesse):
+            # (grenze, nummer) ist kleiner als (grenze, nummer, interesse) -> bisect_left trifft genau den Eintrag
+            del self._grenzen[bisect_left(self._grenzen, (grenze, interesse.nummer))]
+
+    @staticmethod
+    def _endliche_grenzen(interesse):
+        return [g for g in (interesse.untergrenze, interesse.obergrenze) if abs(g) != UNENDLICH]
+
+    # Setzt die Temperatur - unveränderte Werte lösen keine Benachrichtigung aus
+    def set_temperature(self, value):
+        if value == self.temperature:
+            return
+        alt = self.temperature
+        self.temperature = value
+        self.notify_observers(alt)
+
+    # Benachrichtigt nur die betroffenen Beobachter
+    def notify_observers(self, alt=None):
+        neu = self.temperature
+        betroffen = list(self._ungefiltert)
+
+        # Bereichswechsel: genau die Grenzen g mit min(alt, neu) < g <= max(alt, neu) wurden überschritten
+        if alt is not None and self._grenzen:
+            von, bis = min(alt, neu), max(alt, neu)
+            start = bisect_right(self._grenzen, (von, UNENDLICH))
+            ende = bisect_right(self._grenzen, (bis, UNENDLICH))
+            self.besucht += ende - start
+            for _, _, interesse in self._grenzen[start:ende]:
+                # Wurden beide Grenzen übersprungen, liegt der Wert wieder außerhalb -> kein Wechsel
+                if interesse.passt(alt) != interesse.passt(neu):
+                    betroffen.append(interesse.observer)
+
+        # Bereiche, die den neuen Wert enthalten
+        if self._innerhalb:
+            if self._baum_veraltet:
+                self._baum = IntervallBaum(list(self._innerhalb.values()))
+                self._baum_veraltet = False
+            for interesse in self._baum.enthalten(neu):
+                self.besucht += 1
+                betroffen.append(interesse.observer)
+
+        # Bedingungen lassen sich nicht indizieren und werden einzeln geprüft
+        for interesse in self._bedingungen.values():
+            self.besucht += 1
+            if interesse.modus == "innerhalb":
+                if interesse.passt(neu):
+                    betroffen.append(interesse.observer)
+            elif alt is None or interesse.passt(alt) != interesse.passt(neu):
+                betroffen.append(interesse.observer)
+
+        for observer in betroffen:
+            observer.update(neu)
+
+
+# Beobachter für den Benchmark: prüft seinen Bereich selbst (so wie Heater/Cooler in dp_Observer.py)
+class SchwellwertObserver(Observer):
+    def __init__(self, untergrenze, obergrenze, start=20):
+        self.untergrenze = untergrenze
+        self.obergrenze = obergrenze
+        # Zustand zur Anfangstemperatur des Sensors
+        self.drinnen = untergrenze <= start < obergrenze
+        self.wechsel = 0
+
+    def update(self, temperature):
+        drinnen = self.untergrenze <= temperature < self.obergrenze
+        if drinnen != self.drinnen:
+            self.drinnen = drinnen
+            self.wechsel += 1
+
+
+# Zählt nur die Aufrufe
+class ZaehlenderObserver(Observer):
+    def __init__(self):
+        self.aufrufe = 0
+
+    def update(self, temperature):
+        self.aufrufe += 1
+
+
+def main():
+    print("=== Gefilterte Benachrichtigung ===")
+    sensor = FilterTemperatureSensor()
+    # Heizung nur beim Über- bzw. Unterschreiten von 18 Grad, Kühlung bei 25 Grad
+    sensor.add_observer(Heater(), obergrenze=18)
+    sensor.add_observer(Cooler(), untergrenze=25)
+    for wert in (20, 19, 16, 15, 17, 22, 28, 28, 30, 21):
+        print(f"Temperatur {wert}:")
+        sensor.set_temperature(wert)
+
+    # Benchmark: viele Beobachter mit schmalen Bereichen, Temperatur ändert sich in kleinen Schritten
+    anzahl_beobachter = 50_000
+    anzahl_werte = 1_000
+    print(f"\n=== Benchmark: {anzahl_beobachter} Beobachter, {anzahl_werte} Werte ===")
+    bereiche = []
+    for _ in range(anzahl_beobachter):
+        untergrenze = random.uniform(-20, 60)
+        bereiche.append((untergrenze, untergrenze + random.uniform(0.5, 5)))
+    werte = []
+    wert = 20.0
+    for _ in range(anzahl_werte):
+        wert += random.uniform(-0.5, 0.5)
+        werte.append(round(wert, 1))
+
+    # Vergleich 1: Bereichswechsel - jeder Beobachter prüft selbst vs. Grenzen-Index
+    ergebnisse = []
+    for name in ("Alle benachrichtigen", "Grenzen-Index (wechsel)"):
+        beobachter = [SchwellwertObserver(u, o) for u, o in bereiche]
+        sensor = TemperatureSensor() if name == "Alle benachrichtigen" else FilterTemperatureSensor()
+        for observer in beobachter:
+            if isinstance(sensor, FilterTemperatureSensor):
+                sensor.add_observer(observer, observer.untergrenze, observer.obergrenze)
+            else:
+                sensor.add_observer(observer)
+        start = time.perf_counter()
+        for wert in werte:
+            sensor.set_temperature(wert)
+        dauer = time.perf_counter() - start
+        ergebnisse.append([observer.wechsel for observer in beobachter])
+        besucht = getattr(sensor, "besucht", anzahl_beobachter * anzahl_werte)
+        print(f"{name:<28} {dauer * 1000:10.2f} ms  ({besucht} Beobachter geprüft)")
+    assert ergebnisse[0] == ergebnisse[1]
+
+    # Vergleich 2: Benachrichtigung innerhalb des Bereichs über den Intervall-Baum
+    sensor = FilterTemperatureSensor()
+    beobachter = [ZaehlenderObserver() for _ in bereiche]
+    for observer, (untergrenze, obergrenze) in zip(beobachter, bereiche):
+        sensor.add_observer(observer, untergrenze, obergrenze, modus="innerhalb")
+    start = time.perf_counter()
+    for wert in werte:
+        sensor.set_temperature(wert)
+    dauer = time.perf_counter() - start
+    print(f"{'Intervall-Baum (innerhalb)':<28} {dauer * 1000:10.2f} ms  ({sensor.besucht} Beobachter geprüft, "
+          f"inkl. Aufbau)")
+    # Gegenprobe: jeder Beobachter wurde genau für die geänderten Werte in seinem Bereich aufgerufen
+    geaendert = [wert for vorher, wert in zip([20] + werte, werte) if wert != vorher]
+    stichprobe = random.sample(range(anzahl_beobachter), 100)
+    assert all(beobachter[i].aufrufe == sum(bereiche[i][0] <= wert < bereiche[i][1] for wert in geaendert)
+               for i in stichprobe)
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
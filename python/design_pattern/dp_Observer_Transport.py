@@ -0,0 +1,345 @@
+"""
+Problemstellung:
+TemperatureSensor und Observer aus dp_Observer.py funktionieren nur innerhalb eines Prozesses. Laufen Sensor
+und Verbraucher (Heizung, Protokoll, Anzeige) in getrennten Prozessen, müssen die update()-Aufrufe über eine
+Prozessgrenze transportiert werden - und zwar schnell genug für tausende Messwerte pro Sekunde.
+
+Beispiele:
+Ein Messprozess liest die Hardware aus, mehrere Auswerte-Prozesse (Regelung, Datenbank, Web-Anzeige)
+verarbeiten die Werte. Ein abgestürzter Verbraucher darf den Sensor nicht mitreißen.
+
+Kurze Erklärung:
+- SocketVerteiler ist ein gewöhnlicher Observer am Sensor. update() kodiert den Messwert als Datensatz
+  fester Länge (struct: laufende Nummer, Zeitstempel in ns, Temperatur = 24 Bytes) in einen Puffer.
+  Ist der Puffer voll (batch Datensätze), wird er in die Warteschlange jedes verbundenen Abonnenten gelegt
+  (Fan-out). Jeder Abonnent hat einen eigenen Sende-Thread, der alle aufgelaufenen Blöcke mit einem
+  sendall() über einen Unix-Domain-Socket schickt - der Sensor wartet nie auf einen Socket.
+- RemoteTemperatureSensor ist im Verbraucher-Prozess ein normaler TemperatureSensor. Er liest ganze Blöcke
+  vom Socket, zerlegt sie mit struct.iter_unpack und ruft für jeden Messwert set_temperature() auf -
+  lokale Beobachter (z.B. Heater) merken keinen Unterschied.
+- Da alle Datensätze gleich lang sind, braucht der Datenstrom keine weiteren Trennzeichen; ein Datensatz,
+  der über zwei recv()-Blöcke verteilt ist, wird einfach mit dem Rest des nächsten Blocks zusammengesetzt.
+
+Nachteile:
+- Größere Batches erhöhen den Durchsatz, aber auch die Wartezeit eines Messwerts im Puffer (flush() leert
+  ihn sofort, max_wartezeit begrenzt die Wartezeit beim nächsten Messwert).
+- Kommt ein Abonnent nicht hinterher, wartet der Sensor erst, wenn rueckstand Blöcke für ihn ungesendet sind -
+  für alle solchen Abonnenten gemeinsam höchstens sende_timeout Sekunden. Danach (oder wenn ein einzelnes
+  Senden länger als sende_timeout dauert) wird der Abonnent getrennt; er verliert die weiteren Werte, die
+  übrigen Abonnenten sind nicht betroffen.
+- Ein Thread pro Abonnent: für einige Dutzend Verbraucher gedacht, nicht für tausende.
+- Unix-Domain-Sockets gibt es nur unter Linux/macOS (unter Windows erst ab Windows 10 und nicht in allen
+  Python-Versionen).
+"""
+
+import multiprocessing
+import os
+import queue
+import socket
+import stat
+import statistics
+import struct
+import tempfile
+import threading
+import time
+
+from dp_Observer import Heater, Observer, TemperatureSensor
+
+# Datensatz pro Messwert: laufende Nummer, Zeitstempel (time.monotonic_ns, systemweit gleich), Temperatur
+DATENSATZ = struct.Struct("<Qqd")
+
+# Größe des Empfangspuffers
+EMPFANGS_PUFFER = 256 * 1024
+
+
+# Entfernt die Socket-Datei unter pfad; liegt dort eine andere Datei, bleibt sie unangetastet
+def _socket_entfernen(pfad, fehler_wenn_andere_datei=False):
+    try:
+        modus = os.lstat(pfad).st_mode
+    except FileNotFoundError:
+        return
+    if stat.S_ISSOCK(modus):
+        os.unlink(pfad)
+    elif fehler_wenn_andere_datei:
+        raise FileExistsError(f"{pfad} existiert bereits und ist kein Socket")
+
+
+# Verbindung zu einem Abonnenten mit eigener Warteschlange und eigenem Sende-Thread
+class _Abonnent:
+    __slots__ = ("verbindung", "warteschlange", "thread")
+
+    def __init__(self, verbindung, rueckstand):
+        self.verbindung = verbindung
+        # Höchstens rueckstand ungesendete Blöcke - danach wartet flush() (begrenzt durch sende_timeout)
+        self.warteschlange = queue.Queue(rueckstand)
+        self.thread = None
+
+
+# Observer, der jeden Messwert an Abonnenten in anderen Prozessen verteilt
+class SocketVerteiler(Observer):
+    def __init__(self, pfad, batch=64, max_wartezeit=None, sende_timeout=1.0, rueckstand=256):
+        self.pfad = pfad
+        self.batch = batch
+        # Höchstens so lange (in Sekunden) wartet ein Messwert im Puffer, geprüft beim nächsten Messwert
+        self.max_wartezeit = max_wartezeit
+        # Höchstens so lange (in Sekunden) darf das Senden an einen Abonnenten dauern, sonst wird er getrennt;
+        # ebenso lange wartet flush() insgesamt auf volle Warteschlangen
+        self.sende_timeout = sende_timeout
+        # Anzahl Blöcke, die pro Abonnent ungesendet warten dürfen
+        self.rueckstand = rueckstand
+        # Vorab angelegter Puffer für batch Datensätze - pack_into schreibt direkt hinein (keine Zwischenobjekte)
+        self._puffer = bytearray(batch * DATENSATZ.size)
+        self._anzahl = 0
+        self._erster = 0
+        self._nummer = 0
+        # Menge statt Liste: Abmelden aus den Sende-Threads mit discard (auch wenn schliessen() schneller war)
+        self._abonnenten = set()
+        self._geschlossen = False
+        self._sperre = threading.Lock()
+        self._neuer_abonnent = threading.Condition(self._sperre)
+        # Alte Socket-Datei eines abgestürzten Laufs entfernen - aber nur, wenn dort wirklich ein Socket liegt
+        _socket_entfernen(pfad, fehler_wenn_andere_datei=True)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(pfad)
+        self._server.listen()
+        threading.Thread(target=self._annehmen, daemon=True).start()
+
+    # Nimmt im Hintergrund neue Abonnenten an und startet für jeden einen Sende-Thread
+    def _annehmen(self):
+        while True:
+            try:
+                verbindung, _ = self._server.accept()
+            except OSError:
+                # Server wurde geschlossen
+                return
+            verbindung.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, EMPFANGS_PUFFER)
+            verbindung.settimeout(self.sende_timeout)
+            abonnent = _Abonnent(verbindung, self.rueckstand)
+            with self._sperre:
+                if self._geschlossen:
+                    verbindung.close()
+                    return
+                abonnent.thread = threading.Thread(target=self._senden, args=(abonnent,), daemon=True)
+                abonnent.thread.start()
+                self._abonnenten.add(abonnent)
+                self._neuer_abonnent.notify_all()
+
+    # Sende-Thread eines Abonnenten: schickt alle aufgelaufenen Blöcke mit einem sendall()
+    # None in der Warteschlange beendet den Thread, nachdem alles davor gesendet wurde
+    def _senden(self, abonnent):
+        warteschlange = abonnent.warteschlange
+        while True:
+            bloecke = [warteschlange.get()]
+            while bloecke[-1] is not None and not warteschlange.empty():
+                bloecke.append(warteschlange.get_nowait())
+            ende = bloecke[-1] is None
+            if ende:
+                bloecke.pop()
+            try:
+                if bloecke:
+                    abonnent.verbindung.sendall(b"".join(bloecke))
+            except OSError:
+                # Verbindung beendet oder Abonnent hängt länger als sende_timeout hinterher (socket.timeout):
+                # trennen - ein halb gesendeter Block wäre für ihn ohnehin nicht mehr lesbar
+                self._trennen(abonnent)
+                return
+            if ende:
+                abonnent.verbindung.close()
+                return
+
+    # Trennt einen Abonnenten (aus jedem Thread aufrufbar)
+    def _trennen(self, abonnent):
+        with self._sperre:
+            self._abonnenten.discard(abonnent)
+        abonnent.verbindung.close()
+
+    # Wartet, bis mindestens anzahl Abonnenten verbunden sind
+    def warten_auf_abonnenten(self, anzahl, timeout=None):
+        with self._sperre:
+            return self._neuer_abonnent.wait_for(lambda: len(self._abonnenten) >= anzahl, timeout)
+
+    # Wird vom Sensor bei jedem Messwert aufgerufen
+    def update(self, temperature):
+        jetzt = time.monotonic_ns()
+        if self._anzahl == 0:
+            self._erster = jetzt
+        DATENSATZ.pack_into(self._puffer, self._anzahl * DATENSATZ.size, self._nummer, jetzt, temperature)
+        self._nummer += 1
+        self._anzahl += 1
+        if self._anzahl == self.batch or (self.max_wartezeit is not None
+                                          and jetzt - self._erster >= self.max_wartezeit * 1e9):
+            self.flush()
+
+    # Übergibt alle gepufferten Datensätze den Sende-Threads der Abonnenten (wartet nicht auf das Senden)
+    def flush(self):
+        if not self._anzahl:
+            return
+        # Eine Kopie des Puffers für alle Abonnenten - der Puffer selbst wird sofort wiederverwendet
+        daten = bytes(memoryview(self._puffer)[:self._anzahl * DATENSATZ.size])
+        self._anzahl = 0
+        with self._sperre:
+            abonnenten = list(self._abonnenten)
+        self._verteilen(abonnenten, daten)
+
+    # Legt daten in die Warteschlangen der Abonnenten
+    # Volle Warteschlangen teilen sich EINE Frist von sende_timeout - der Sensor wartet also insgesamt höchstens
+    # sende_timeout, egal wie viele Abonnenten hinterherhängen; wer danach noch voll ist, wird getrennt
+    def _verteilen(self, abonnenten, daten):
+        frist = None
+        for abonnent in abonnenten:
+            try:
+                abonnent.warteschlange.put_nowait(daten)
+            except queue.Full:
+                if frist is None:
+                    frist = time.monotonic() + self.sende_timeout
+                try:
+                    abonnent.warteschlange.put(daten, timeout=max(0.0, frist - time.monotonic()))
+                except queue.Full:
+                    self._trennen(abonnent)
+
+    # Leert den Puffer, sendet allen Abonnenten den Rest und beendet die Verbindungen
+    # (Abonnenten sehen danach das Ende des Datenstroms)
+    def schliessen(self):
+        self.flush()
+        with self._sperre:
+            self._geschlossen = True
+            abonnenten = list(self._abonnenten)
+            self._abonnenten.clear()
+        self._server.close()
+        self._verteilen(abonnenten, None)
+        # Jeder Sende-Thread endet spätestens sende_timeout nach seinem letzten Fortschritt
+        for abonnent in abonnenten:
+            abonnent.thread.join()
+        _socket_entfernen(self.pfad)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliessen()
+
+
+# Sensor im Verbraucher-Prozess: bekommt seine Werte über den Socket statt von der Hardware
+class RemoteTemperatureSensor(TemperatureSensor):
+    def __init__(self, pfad, timeout=5.0):
+        super().__init__()
+        # Nummer und Zeitstempel des zuletzt empfangenen Messwerts (z.B. für Latenz-Messungen)
+        self.nummer = None
+        self.zeitstempel = None
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Der Verteiler startet eventuell erst nach dem Verbraucher - bis zum Timeout erneut versuchen
+        ende = time.monotonic() + timeout
+        while True:
+            try:
+                self._socket.connect(pfad)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > ende:
+                    raise
+                time.sleep(0.01)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, EMPFANGS_PUFFER)
+
+    # Empfängt Messwerte bis zum Ende des Datenstroms und gibt die Anzahl zurück
+    def empfangen(self):
+        puffer = bytearray(EMPFANGS_PUFFER)
+        anzahl = 0
+        # Bytes eines unvollständigen Datensatzes vom Ende des letzten Blocks
+        rest = 0
+        with memoryview(puffer) as sicht:
+            while True:
+                gelesen = self._socket.recv_into(sicht[rest:])
+                if not gelesen:
+                    break
+                gueltig = rest + gelesen
+                ganze = gueltig - gueltig % DATENSATZ.size
+                for self.nummer, self.zeitstempel, temperatur in DATENSATZ.iter_unpack(sicht[:ganze]):
+                    self.set_temperature(temperatur)
+                anzahl += ganze // DATENSATZ.size
+                # Angefangenen Datensatz an den Anfang des Puffers schieben
+                rest = gueltig - ganze
+                sicht[:rest] = sicht[ganze:gueltig]
+        self._socket.close()
+        return anzahl
+
+
+# Beobachter im Verbraucher-Prozess: misst die Zeit vom Senden bis zum update()-Aufruf
+class LatenzObserver(Observer):
+    def __init__(self, sensor, stichprobe=100):
+        self.sensor = sensor
+        self.stichprobe = stichprobe
+        self.latenzen = []
+        self.aufrufe = 0
+
+    def update(self, temperature):
+        self.aufrufe += 1
+        # Nur jeden stichprobe-ten Wert messen, damit die Messung selbst kaum Zeit kostet
+        if self.aufrufe % self.stichprobe == 0:
+            self.latenzen.append(time.monotonic_ns() - self.sensor.zeitstempel)
+
+
+# Verbraucher-Prozess für den Benchmark
+def verbraucher(pfad, ergebnisse):
+    sensor = RemoteTemperatureSensor(pfad)
+    messung = LatenzObserver(sensor)
+    sensor.add_observer(messung)
+    start = time.perf_counter()
+    anzahl = sensor.empfangen()
+    ergebnisse.put((anzahl, time.perf_counter() - start, messung.latenzen))
+
+
+# Verbraucher-Prozess für das Beispiel: eine Heizung wie in dp_Observer.py
+def heizungs_prozess(pfad):
+    sensor = RemoteTemperatureSensor(pfad)
+    sensor.add_observer(Heater())
+    sensor.empfangen()
+
+
+def main():
+    print("=== Sensor und Heizung in getrennten Prozessen ===")
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        pfad = os.path.join(verzeichnis, "sensor.sock")
+        sensor = TemperatureSensor()
+        with SocketVerteiler(pfad, batch=1) as verteiler:
+            sensor.add_observer(verteiler)
+            heizung = multiprocessing.Process(target=heizungs_prozess, args=(pfad,))
+            heizung.start()
+            verteiler.warten_auf_abonnenten(1)
+            sensor.set_temperature(16)
+            sensor.set_temperature(28)
+        heizung.join()
+
+        print("\n=== Benchmark ===")
+        ergebnisse = multiprocessing.Queue()
+
+        # Benchmark: anzahl Messwerte an mehrere Verbraucher-Prozesse, verschiedene Batch-Größen
+        anzahl = 500_000
+        anzahl_verbraucher = 2
+        for batch in (1, 16, 256, 4096):
+            sensor = TemperatureSensor()
+            with SocketVerteiler(pfad, batch=batch) as verteiler:
+                sensor.add_observer(verteiler)
+                prozesse = [multiprocessing.Process(target=verbraucher, args=(pfad, ergebnisse))
+                            for _ in range(anzahl_verbraucher)]
+                for prozess in prozesse:
+                    prozess.start()
+                verteiler.warten_auf_abonnenten(anzahl_verbraucher)
+                start = time.perf_counter()
+                for i in range(anzahl):
+                    sensor.set_temperature(20 + (i % 100) / 10)
+                verteiler.flush()
+                sender = time.perf_counter() - start
+            messungen = [ergebnisse.get() for _ in prozesse]
+            for prozess in prozesse:
+                prozess.join()
+            assert all(empfangen == anzahl for empfangen, _, _ in messungen)
+            latenzen = sorted(latenz for _, _, liste in messungen for latenz in liste)
+            dauer = max(dauer for _, dauer, _ in messungen)
+            print(f"Batch {batch:>5}: {anzahl / sender:>12,.0f} Werte/s gesendet, "
+                  f"{anzahl / dauer:>12,.0f} Werte/s je Verbraucher, Latenz Median "
+                  f"{statistics.median(latenzen) / 1000:9.1f} µs, "
+                  f"99% {latenzen[int(len(latenzen) * 0.99)] / 1000:9.1f} µs")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Problemstellung:
+Der TemperatureSensor aus dp_Observer.py hat seine Beobachter früher in einer Liste geführt. Melden sich bei
+vielen Beobachtern ständig welche an und ab (z.B. Browser-Sitzungen, die eine Live-Anzeige abonnieren), muss
+remove_observer() die Liste jedes Mal durchsuchen und den Rest verschieben - O(n) pro Abmeldung.
+
+Beispiele:
+Ein Server mit zehntausenden Verbindungen, die kommen und gehen; kurzlebige Beobachter in Tests oder
+Dialogfenstern, die sich beim Schließen abmelden.
+
+Kurze Erklärung:
+Der TemperatureSensor führt ein dict (Schlüssel id(observer)) als Verzeichnis: Anmelden und Abmelden sind O(1),
+die Anmelde-Reihenfolge bleibt erhalten. notify_observers() läuft über ein Tupel der Werte, das nur nach einer
+Änderung neu erstellt wird. Mit add_observer(observer, weak=True) hält der Sensor nur eine schwache Referenz.
+Dieses Modul vergleicht das Verzeichnis mit der bisherigen Liste (ListenTemperatureSensor).
+
+Nachteile:
+- Nach jeder An-/Abmeldung wird beim nächsten Messwert das Tupel neu erstellt (O(n) einmal pro Änderung,
+  nicht pro Beobachter).
+"""
+
+import time
+
+from dp_Observer import Observer, TemperatureSensor
+
+
+# Bisherige Variante mit Liste - nur noch als Vergleich für den Benchmark
+class ListenTemperatureSensor(TemperatureSensor):
+    def __init__(self):
+        super().__init__()
+        self._liste = []
+
+    # Wie früher die Liste selbst (beim TemperatureSensor eine Sicht auf das Verzeichnis)
+    @property
+    def observers(self):
+        return self._liste
+
+    def add_observer(self, observer, weak=False):
+        self._liste.append(observer)
+
+    def remove_observer(self, observer):
+        # O(n): Liste muss durchsucht und danach verschoben werden
+        self._liste.remove(observer)
+
+    def notify_observers(self):
+        for observer in self._liste:
+            observer.update(self.temperature)
+
+
+# Benchmark: viele Beobachter, die sich ständig an- und abmelden
+def churn_benchmark(anzahl_beobachter=10_000, wechsel=100_000, werte=100):
+    print(f"=== Benchmark: {anzahl_beobachter} Beobachter, {wechsel} An-/Abmeldungen, {werte} Werte ===")
+    for name, sensor, weak in (("Liste (bisher)", ListenTemperatureSensor(), False),
+                               ("dict", TemperatureSensor(), False),
+                               ("dict, weak=True", TemperatureSensor(), True)):
+        beobachter = [Observer() for _ in range(anzahl_beobachter)]
+        for observer in beobachter:
+            sensor.add_observer(observer, weak=weak)
+        start = time.perf_counter()
+        for i in range(wechsel):
+            # Einen Beobachter aus der Mitte abmelden und einen neuen anmelden
+            position = (i * 7919) % anzahl_beobachter
+            sensor.remove_observer(beobachter[position])
+            beobachter[position] = Observer()
+            sensor.add_observer(beobachter[position], weak=weak)
+        an_ab = time.perf_counter() - start
+        start = time.perf_counter()
+        for wert in range(werte):
+            sensor.set_temperature(wert)
+        benachrichtigen = time.perf_counter() - start
+        assert len(sensor.observers) == anzahl_beobachter
+        print(f"{name:<18} An-/Abmelden {an_ab * 1000:9.2f} ms, Benachrichtigen {benachrichtigen * 1000:9.2f} ms")
+
+
+# Programm-Einstiegspunkt
+if __name__ == "__main__":
+    churn_benchmark()
@@ -24,55 +24,92 @@ SCHLEIFENVARIABLEN:
   -> Bereich wird mit jedem Durchlauf kleiner (bereits sortierte Elemente überspringen)
 
 ZWEI IMPLEMENTIERUNGEN:
-1. Mit pop()/insert() - anschaulich, aber langsamer (Listenoperationen)
-2. Mit "Drei-Wege-Tausch" - klassische Variante, effizienter (direkter Zugriff)
+1. bubble_sort_pop_insert: Mit pop()/insert() - anschaulich, aber langsamer (Listenoperationen)
+2. bubble_sort_tausch: Mit "Drei-Wege-Tausch" - klassische Variante, effizienter (direkter Zugriff)
+   -> optionaler Parameter protokoll zum Zählen/Aufzeichnen der Operationen (siehe instrumentierung.py)
 """
 
 # TODO: Zeitmessung mittels Zeitstempel implementieren (z.B. mit time.time() vor/nach Sortierung)
 
-# Ausgangsliste mit Umsortieren Wortern definieren
-#input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
+from instrumentierung import DURCHLAUF, TAUSCH, VERGLEICH
 
-# Ausgangsliste mit Umsortieren Ganzzahlen definieren
-input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
 
-# Zusätzliche eindeutige Werte ergänzen
-input_list += [17, 23, 1, 99, 7, 56]
-input_list += [34, 65, 12, 88, 3, 77]
+# Erste Variante: Tausch über pop()/insert()
+def bubble_sort_pop_insert(input_list):
+    # Äußere Schleife: Durchläufe für jeden zu platzierenden Wert (-1, da letzter Wert automatisch sortiert ist)
+    for i in range (len(input_list) - 1):
+        # Innere Schleife: Vergleiche benachbarte Elemente (Ende verkürzt sich mit jedem Durchlauf um bereits sortierte Elemente)
+        for j in range(len(input_list) - (1 + i)):
+            # Prüfen, ob das aktuelle Element größer als Nächstes ist (aufsteigende Sortierung)
+            if input_list[j] > input_list[j + 1]:
+                # Größeres Element aus Liste entfernen und temporär speichern
+                temp = input_list.pop(j)
+                # Entferntes Element an nächster Position einfügen (Tausch abgeschlossen)
+                input_list.insert(j + 1, temp)
+    return input_list
 
-# Unsortierte Liste zur Kontrolle ausgeben
-print("Unsortierte Liste:", input_list)
 
-# Äußere Schleife: Durchläufe für jeden zu platzierenden Wert (-1, da letzter Wert automatisch sortiert ist)
-for i in range (len(input_list) - 1):
-    # Innere Schleife: Vergleiche benachbarte Elemente (Ende verkürzt sich mit jedem Durchlauf um bereits sortierte Elemente)
-    for j in range(len(input_list) - (1 + i)):
-        # Prüfen, ob das aktuelle Element größer als Nächstes ist (aufsteigende Sortierung)
-        if input_list[j] > input_list[j + 1]:
-            # Größeres Element aus Liste entfernen und temporär speichern
-            temp = input_list.pop(j)
-            # Entferntes Element an nächster Position einfügen (Tausch abgeschlossen)
-            input_list.insert(j + 1, temp)
+# Alternative Implementierung mit klassischem Variablen-Tausch (effizienter als pop/insert)
+# protokoll: optionales SortierProtokoll aus instrumentierung.py (zählt bzw. zeichnet die Operationen auf)
+def bubble_sort_tausch(input_list, protokoll=None):
+    if protokoll is not None:
+        return _bubble_sort_tausch_protokoll(input_list, protokoll)
+    # Äußere Schleife: Anzahl der Durchläufe
+    for i in range(len(input_list) - 1):
+        # Innere Schleife: Paarweiser Vergleich benachbarter Elemente
+        for j in range(len(input_list) - (1 + i)):
+            # Wenn aktuelles Element größer als Nachfolger, dann tauschen
+            if input_list[j] > input_list[j + 1]:
+                # Nachfolger-Element in temporäre Variable speichern
+                temp = input_list[j +1]
+                # Aktuelles (größeres) Element nach rechts verschieben
+                input_list[j + 1] = input_list[j]
+                # Gespeichertes (kleineres) Element an aktuelle Position setzen
+                input_list[j] = temp
+    return input_list
 
-# Sortierte Liste ausgeben
-print("Sortierte Liste:", input_list)
 
+# Gleiche Schleife mit Protokoll - eigene Funktion, damit die Variante ohne Protokoll unverändert schnell bleibt
+def _bubble_sort_tausch_protokoll(input_list, protokoll):
+    aufzeichnen = protokoll.aufzeichnen
+    notiere = protokoll.notiere
+    vergleiche = tausche = 0
+    for i in range(len(input_list) - 1):
+        for j in range(len(input_list) - (1 + i)):
+            vergleiche += 1
+            if aufzeichnen:
+                notiere(VERGLEICH, j, j + 1)
+            if input_list[j] > input_list[j + 1]:
+                input_list[j], input_list[j + 1] = input_list[j + 1], input_list[j]
+                tausche += 1
+                if aufzeichnen:
+                    notiere(TAUSCH, j, j + 1)
+        if aufzeichnen:
+            notiere(DURCHLAUF, i + 1)
+    protokoll.zaehle(vergleiche, tausche, durchlaeufe=max(0, len(input_list) - 1))
+    return input_list
 
-# Alternative Implementierung mit klassischem Variablen-Tausch (effizienter als pop/insert)
-input_list = [10, 2, 5, 4, 80, 43]
-print("Unsortierte Liste:", input_list)
-
-# Äußere Schleife: Anzahl der Durchläufe
-for i in range(len(input_list) - 1):
-    # Innere Schleife: Paarweiser Vergleich benachbarter Elemente
-    for j in range(len(input_list) - (1 + i)):
-        # Wenn aktuelles Element größer als Nachfolger, dann tauschen
-        if input_list[j] > input_list[j + 1]:
-            # Nachfolger-Element in temporäre Variable speichern
-            temp = input_list[j +1]
-            # Aktuelles (größeres) Element nach rechts verschieben
-            input_list[j + 1] = input_list[j]
-            # Gespeichertes (kleineres) Element an aktuelle Position setzen
-            input_list[j] = temp
-# Sortiertes Ergebnis ausgeben
-print("Sortierte Liste:", input_list)
+
+if __name__ == "__main__":
+    # Ausgangsliste mit Umsortieren Wortern definieren
+    #input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
+
+    # Ausgangsliste mit Umsortieren Ganzzahlen definieren
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+
+    # Zusätzliche eindeutige Werte ergänzen
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+
+    # Unsortierte Liste zur Kontrolle ausgeben
+    print("Unsortierte Liste:", input_list)
+    bubble_sort_pop_insert(input_list)
+    # Sortierte Liste ausgeben
+    print("Sortierte Liste:", input_list)
+
+    # Alternative Implementierung mit klassischem Variablen-Tausch
+    input_list = [10, 2, 5, 4, 80, 43]
+    print("Unsortierte Liste:", input_list)
+    bubble_sort_tausch(input_list)
+    # Sortiertes Ergebnis ausgeben
+    print("Sortierte Liste:", input_list)
@@ -0,0 +1,126 @@
+"""
+Optimierte Bubble Sort Varianten
+================================
+
+Dieser Code demonstriert Verbesserungen des Bubble-Sort-Algorithmus aus bubble_sort.py.
+
+PROBLEME DER EINFACHEN VARIANTEN:
+- Es werden immer alle n-1 Durchläufe ausgeführt, auch wenn die Liste schon früher sortiert ist
+- pop(j)/insert(j+1) verschiebt bei jedem Tausch den gesamten Rest der Liste (O(n) pro Tausch)
+
+OPTIMIERUNGEN:
+1. Vorzeitiger Abbruch + letzte Tauschposition
+   -> Gibt es in einem Durchlauf keinen Tausch, ist die Liste sortiert -> Abbruch
+   -> Hinter der Position des letzten Tauschs ist bereits alles sortiert
+      -> die innere Schleife endet beim nächsten Durchlauf genau dort (statt nur um 1 kürzer)
+2. Cocktail-Shaker-Sort (bidirektionaler Bubble Sort)
+   -> Abwechselnd ein Durchlauf nach rechts (großes Element nach hinten) und nach links (kleines nach vorne)
+   -> Behebt das "Schildkröten"-Problem: kleine Werte am Ende wandern sonst nur einen Platz pro Durchlauf
+3. Comb Sort (Kamm-Sortierung)
+   -> Vergleicht zuerst weit entfernte Elemente (Abstand "gap"), der Abstand schrumpft jeweils um Faktor 1,3
+   -> Schildkröten wandern so in großen Sprüngen nach vorne, zum Schluss läuft ein normaler Bubble Sort (gap=1)
+
+LAUFZEIT:
+- Bubble Sort / Cocktail-Shaker: Bestfall O(n) (bereits sortiert), sonst O(n²)
+- Comb Sort: in der Praxis nahe O(n log n)
+"""
+
+import time
+
+# Die beiden Varianten aus bubble_sort.py dienen als Vergleichsbasis
+from bubble_sort import bubble_sort_pop_insert, bubble_sort_tausch
+
+
+def bubble_sort_adaptiv(input_list):
+    # Bubble Sort mit vorzeitigem Abbruch und Verkürzung auf die letzte Tauschposition
+    # Grenze: bis hierhin (exklusive) ist der Bereich noch unsortiert
+    grenze = len(input_list) - 1
+    while grenze > 0:
+        # Position des letzten Tauschs in diesem Durchlauf (0 = kein Tausch)
+        letzter_tausch = 0
+        for j in range(grenze):
+            if input_list[j] > input_list[j + 1]:
+                input_list[j], input_list[j + 1] = input_list[j + 1], input_list[j]
+                letzter_tausch = j
+        # Ab letzter_tausch + 1 ist alles sortiert; ohne Tausch wird grenze 0 -> Abbruch
+        grenze = letzter_tausch
+    return input_list
+
+
+def cocktail_shaker_sort(input_list):
+    # Bidirektionaler Bubble Sort: abwechselnd nach rechts und nach links
+    links = 0
+    rechts = len(input_list) - 1
+    while links < rechts:
+        # Durchlauf nach rechts: größtes Element wandert ans Ende des unsortierten Bereichs
+        letzter_tausch = links
+        for j in range(links, rechts):
+            if input_list[j] > input_list[j + 1]:
+                input_list[j], input_list[j + 1] = input_list[j + 1], input_list[j]
+                letzter_tausch = j
+        rechts = letzter_tausch
+        # Durchlauf nach links: kleinstes Element wandert an den Anfang des unsortierten Bereichs
+        letzter_tausch = rechts
+        for j in range(rechts, links, -1):
+            if input_list[j - 1] > input_list[j]:
+                input_list[j - 1], input_list[j] = input_list[j], input_list[j - 1]
+                letzter_tausch = j
+        links = letzter_tausch
+    return input_list
+
+
+def comb_sort(input_list, schrumpf_faktor=1.3):
+    # Comb Sort: Bubble Sort mit schrumpfendem Vergleichsabstand
+    n = len(input_list)
+    gap = n
+    sortiert = False
+    while not sortiert:
+        # Abstand verkleinern (mindestens 1 = normaler Bubble-Sort-Durchlauf)
+        gap = max(1, int(gap / schrumpf_faktor))
+        # Sortiert erst, wenn ein Durchlauf mit gap=1 ohne Tausch endet
+        sortiert = gap == 1
+        for j in range(n - gap):
+            if input_list[j] > input_list[j + gap]:
+                input_list[j], input_list[j + gap] = input_list[j + gap], input_list[j]
+                sortiert = False
+    return input_list
+
+
+if __name__ == "__main__":
+    import random
+
+    # Kurzes Beispiel mit der Ausgangsliste aus bubble_sort.py
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+    print("Unsortierte Liste:", input_list)
+    print("Sortierte Liste:", cocktail_shaker_sort(list(input_list)))
+
+    # Benchmark mit verschiedenen Ausgangslagen
+    n = 2_000
+    zufall = [random.randint(0, 10_000) for _ in range(n)]
+    fast_sortiert = sorted(zufall)
+    for _ in range(n // 100):
+        i, j = random.randrange(n), random.randrange(n)
+        fast_sortiert[i], fast_sortiert[j] = fast_sortiert[j], fast_sortiert[i]
+    schildkroete = sorted(zufall)[1:] + [-1]  # Kleinster Wert ganz am Ende
+
+    varianten = [
+        ("pop/insert (bubble_sort.py)", bubble_sort_pop_insert),
+        ("Drei-Wege-Tausch (bubble_sort.py)", bubble_sort_tausch),
+        ("Adaptiv (Abbruch + letzte Tauschpos.)", bubble_sort_adaptiv),
+        ("Cocktail-Shaker", cocktail_shaker_sort),
+        ("Comb Sort", comb_sort),
+    ]
+    for beschreibung, daten in (("zufällig", zufall), ("bereits sortiert", sorted(zufall)),
+                                ("fast sortiert", fast_sortiert), ("Schildkröte am Ende", schildkroete)):
+        print(f"\n=== {n} Elemente, {beschreibung} ===")
+        basis = None
+        for name, funktion in varianten:
+            kopie = list(daten)
+            start = time.perf_counter()
+            funktion(kopie)
+            dauer = time.perf_counter() - start
+            assert kopie == sorted(daten), name
+            basis = basis or dauer
+            print(f"{name:<40} {dauer * 1000:9.2f} ms  (Faktor {basis / dauer:6.1f}x)")
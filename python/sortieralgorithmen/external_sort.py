@@ -0,0 +1,239 @@
+"""
+Externe Merge-Sortierung (parallel, mehrere Kerne)
+==================================================
+
+Dieser Code demonstriert das Sortieren von Dateien, die größer als der Arbeitsspeicher sind.
+
+FUNKTIONSWEISE:
+- Die Eingabedatei enthält einen Datensatz pro Zeile (Ganzzahlen oder Text)
+  -> Leere Zeilen sind keine Datensätze: sie werden in beiden Modi übersprungen und nicht mitgezählt
+  -> Zeilen nur aus Leerzeichen sind im Text-Modus normale Datensätze, im Zahlen-Modus (keine Zahl) werden
+     sie wie leere Zeilen übersprungen
+- Phase 1 (Aufteilen): Die Datei wird in Blöcke zerlegt, deren Verarbeitung das Speicherbudget einhält
+  -> Das Budget zählt Arbeitsspeicher, nicht Dateibytes: jede Zeile wird zu einem eigenen Objekt
+     (bytes/str mit ca. 33-49 Bytes Kopf), bei kurzen Zeilen braucht ein Block das 10-20-fache seiner Dateigröße
+  -> Dieser Faktor wird vorab an einer Stichprobe vom Dateianfang mit tracemalloc gemessen,
+     die Blockgröße ist Speicherbudget / Faktor
+  -> Es werden nur Byte-Bereiche (Start, Ende) an die Worker übergeben, keine Daten (kein Pickling)
+  -> Jeder Worker-Prozess liest seinen Bereich selbst, sortiert ihn und schreibt einen "Lauf" in eine Temp-Datei
+  -> Zahlen werden als array.array über numpy_sort.sortiere_zahlen sortiert (Radix/Counting Sort)
+- Phase 2 (Mischen): Höchstens max_laeufe sortierte Läufe werden gleichzeitig gepuffert gelesen
+  -> Ein Heap (heapq.merge) liefert jeweils den kleinsten Kopf-Datensatz aller Läufe (k-Wege-Mischen)
+  -> Gibt es mehr Läufe, werden sie in Zwischendurchgängen gruppenweise (parallel auf dem Pool) zu
+     längeren Läufen gemischt, bis höchstens max_laeufe übrig sind
+  -> Der letzte Durchgang schreibt das Ergebnis in die Ausgabedatei
+
+SPEICHERBEDARF:
+- Phase 1: höchstens (Anzahl Worker) x (Speicherbudget pro Block)
+  -> Geschätzt aus der Stichprobe: sind die Zeilen später in der Datei deutlich kürzer, wird es mehr
+- Phase 2: ein Lesepuffer pro geöffnetem Lauf + der Heap mit k Einträgen (k <= max_laeufe, auch bei
+  den Dateideskriptoren)
+
+VORTEILE:
+- Dateigröße ist nur durch den Plattenplatz begrenzt
+- Das Sortieren der Blöcke skaliert mit der Anzahl der CPU-Kerne
+
+NACHTEILE:
+- Die Daten werden zweimal gelesen und geschrieben (Plattenzugriffe dominieren die Laufzeit)
+- Das Mischen in Phase 2 läuft auf einem einzigen Kern (nur die Zwischendurchgänge sind parallel)
+- Jeder Zwischendurchgang liest und schreibt alle Daten ein weiteres Mal
+"""
+
+import heapq
+import os
+import tempfile
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from numpy_sort import sortiere_zahlen
+
+# Standard-Speicherbudget pro Block in Bytes (64 MB)
+SPEICHER_BUDGET = 64 * 1024 * 1024
+
+# Puffergröße für das Lesen und Schreiben der Läufe in Bytes (1 MB)
+PUFFER_GROESSE = 1024 * 1024
+
+# Höchstzahl gleichzeitig gemischter Läufe (Dateideskriptoren und Lesepuffer in Phase 2)
+MAX_LAEUFE = 64
+
+# Größe der Stichprobe, an der der Speicherbedarf pro Dateibyte gemessen wird (1 MB)
+PROBE_GROESSE = 1024 * 1024
+
+
+def _block_grenzen(pfad, block_groesse):
+    # Zerlegt die Datei in Byte-Bereiche von ca. block_groesse, jeweils am Zeilenende ausgerichtet
+    grenzen = []
+    datei_groesse = os.path.getsize(pfad)
+    with open(pfad, "rb") as datei:
+        start = 0
+        while start < datei_groesse:
+            # Zur ungefähren Blockgrenze springen und bis zum nächsten Zeilenende weiterlesen
+            datei.seek(min(start + block_groesse, datei_groesse))
+            datei.readline()
+            ende = min(datei.tell(), datei_groesse)
+            grenzen.append((start, ende))
+            start = ende
+    return grenzen
+
+
+def _sortiere_block(daten, numerisch):
+    # Sortiert die Zeilen eines Blocks und gibt (Inhalt des Laufs, Anzahl Datensätze) zurück
+    zeilen = daten.splitlines()
+    # Leere Zeilen überspringen (z.B. eine Leerzeile am Dateiende): int(b"") würde scheitern, und ein Lauf
+    # aus lauter Leerzeilen ließe sich beim Mischen nicht von einem leeren Lauf unterscheiden
+    # Zeilen nur aus Leerzeichen sind im Text-Modus gültige Datensätze, im Zahlen-Modus keine Zahl
+    zeilen = [zeile for zeile in zeilen if zeile.strip()] if numerisch else list(filter(None, zeilen))
+
+    if numerisch:
+        # Zahlen kompakt als array.array sortieren (kein int-Objekt pro Element im Ergebnis)
+        werte = array("q", map(int, zeilen))
+        sortiere_zahlen(werte)
+        inhalt = "\n".join(map(str, werte)).encode()
+    else:
+        zeilen.sort()
+        inhalt = b"\n".join(zeilen)
+    return inhalt, len(zeilen)
+
+
+def _speicher_faktor(pfad, numerisch):
+    # Misst an einer Stichprobe, wie viele Bytes Arbeitsspeicher ein Byte der Datei beim Sortieren belegt
+    with open(pfad, "rb") as datei:
+        probe = datei.read(PROBE_GROESSE)
+    # Nur vollständige Zeilen (außer die ganze Stichprobe ist eine einzige Zeile)
+    probe = probe[:probe.rfind(b"\n") + 1] or probe
+    if not probe:
+        return 1.0
+    # Läuft tracemalloc bereits (z.B. beim Aufrufer), wird nur die Spitze zurückgesetzt statt neu gestartet
+    lief_schon = tracemalloc.is_tracing()
+    if lief_schon:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    try:
+        vorher = tracemalloc.get_traced_memory()[0]
+        _sortiere_block(probe, numerisch)
+        spitze = tracemalloc.get_traced_memory()[1] - vorher
+    finally:
+        if not lief_schon:
+            tracemalloc.stop()
+    # Der gelesene Block selbst liegt ebenfalls im Speicher (hier vor der Messung angelegt)
+    return max(1.0, (spitze + len(probe)) / len(probe))
+
+
+def _sortiere_lauf(pfad, start, ende, numerisch, temp_verzeichnis):
+    # Worker: liest einen Byte-Bereich, sortiert ihn und schreibt ihn als Lauf in eine Temp-Datei
+    with open(pfad, "rb") as datei:
+        datei.seek(start)
+        inhalt, anzahl = _sortiere_block(datei.read(ende - start), numerisch)
+
+    # Lauf in eine eigene Temp-Datei schreiben
+    deskriptor, lauf_pfad = tempfile.mkstemp(suffix=".lauf", dir=temp_verzeichnis)
+    with os.fdopen(deskriptor, "wb", buffering=PUFFER_GROESSE) as lauf:
+        lauf.write(inhalt)
+        if inhalt:
+            lauf.write(b"\n")
+    return lauf_pfad, anzahl
+
+
+def _lies_lauf(lauf, numerisch):
+    # Liefert die Datensätze eines Laufs nacheinander (gepuffertes Lesen, konstanter Speicher)
+    for zeile in lauf:
+        zeile = zeile.rstrip(b"\n")
+        yield (int(zeile), zeile) if numerisch else (zeile, zeile)
+
+
+def _mische(laeufe, ziel_pfad, numerisch):
+    # Mischt sortierte Läufe in eine Datei und löscht die Läufe danach
+    dateien = [open(lauf, "rb", buffering=PUFFER_GROESSE) for lauf in laeufe]
+    try:
+        with open(ziel_pfad, "wb", buffering=PUFFER_GROESSE) as ausgabe:
+            # heapq.merge hält pro Lauf nur den aktuellen Kopf-Datensatz im Heap
+            for _, zeile in heapq.merge(*(_lies_lauf(datei, numerisch) for datei in dateien)):
+                ausgabe.write(zeile)
+                ausgabe.write(b"\n")
+    finally:
+        for datei in dateien:
+            datei.close()
+    for lauf in laeufe:
+        os.remove(lauf)
+
+
+def externe_sortierung(eingabe_pfad, ausgabe_pfad, speicher_budget=SPEICHER_BUDGET,
+                       numerisch=True, worker=None, temp_verzeichnis=None, max_laeufe=MAX_LAEUFE):
+    # Sortiert eine Datei mit einem Datensatz pro Zeile und gibt die Statistik zurück
+    # speicher_budget ist der Arbeitsspeicher pro Worker, nicht die Größe eines Blocks in der Datei
+    if max_laeufe < 2:
+        raise ValueError(f"max_laeufe muss mindestens 2 sein, nicht {max_laeufe}")
+    start_zeit = time.perf_counter()
+    worker = worker or os.cpu_count() or 1
+    faktor = _speicher_faktor(eingabe_pfad, numerisch)
+
+    with tempfile.TemporaryDirectory(dir=temp_verzeichnis) as verzeichnis:
+        # === Phase 1: Blöcke parallel sortieren und als Läufe ablegen ===
+        grenzen = _block_grenzen(eingabe_pfad, max(1, int(speicher_budget / faktor)))
+        laeufe = []
+        anzahl = 0
+        with ProcessPoolExecutor(max_workers=worker) as pool:
+            auftraege = [pool.submit(_sortiere_lauf, eingabe_pfad, start, ende, numerisch, verzeichnis)
+                         for start, ende in grenzen]
+            for auftrag in auftraege:
+                lauf_pfad, lauf_anzahl = auftrag.result()
+                laeufe.append(lauf_pfad)
+                anzahl += lauf_anzahl
+            anzahl_laeufe = len(laeufe)
+            phase1_zeit = time.perf_counter()
+
+            # === Phase 2: k-Wege-Mischen über einen Heap, höchstens max_laeufe Läufe gleichzeitig ===
+            durchgaenge = 1
+            while len(laeufe) > max_laeufe:
+                # Zwischendurchgang: je max_laeufe Läufe zu einem längeren Lauf mischen (Gruppen parallel)
+                gruppen = [laeufe[i:i + max_laeufe] for i in range(0, len(laeufe), max_laeufe)]
+                laeufe = [os.path.join(verzeichnis, f"durchgang{durchgaenge}_{nummer}.lauf")
+                          for nummer in range(len(gruppen))]
+                for auftrag in [pool.submit(_mische, gruppe, ziel, numerisch)
+                                for gruppe, ziel in zip(gruppen, laeufe)]:
+                    auftrag.result()
+                durchgaenge += 1
+        _mische(laeufe, ausgabe_pfad, numerisch)
+
+    ende_zeit = time.perf_counter()
+    gesamt = ende_zeit - start_zeit
+    return {
+        "datensaetze": anzahl,
+        "laeufe": anzahl_laeufe,
+        "mischdurchgaenge": durchgaenge,
+        "speicher_faktor": faktor,
+        "phase1_sekunden": phase1_zeit - start_zeit,
+        "phase2_sekunden": ende_zeit - phase1_zeit,
+        "datensaetze_pro_sekunde": anzahl / gesamt if gesamt > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import random
+
+    # Testdatei mit zufälligen Ganzzahlen erzeugen (ein Datensatz pro Zeile)
+    anzahl_datensaetze = 2_000_000
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        eingabe = os.path.join(verzeichnis, "eingabe.txt")
+        ausgabe = os.path.join(verzeichnis, "ausgabe.txt")
+        with open(eingabe, "w") as datei:
+            datei.write("\n".join(str(random.randint(-10**9, 10**9)) for _ in range(anzahl_datensaetze)))
+            datei.write("\n")
+        print(f"Eingabedatei: {os.path.getsize(eingabe) / 1024 / 1024:.1f} MB, {anzahl_datensaetze} Datensätze")
+
+        # Mit kleinem Budget sortieren, damit mehrere Läufe entstehen
+        statistik = externe_sortierung(eingabe, ausgabe, speicher_budget=2 * 1024 * 1024)
+        print(f"Speicherbedarf pro Dateibyte: {statistik['speicher_faktor']:.1f} Bytes")
+        print(f"Läufe: {statistik['laeufe']} (Mischdurchgänge: {statistik['mischdurchgaenge']})")
+        print(f"Phase 1 (Blöcke sortieren): {statistik['phase1_sekunden']:.2f} s")
+        print(f"Phase 2 (k-Wege-Mischen):   {statistik['phase2_sekunden']:.2f} s")
+        print(f"Durchsatz: {statistik['datensaetze_pro_sekunde']:,.0f} Datensätze/s")
+
+        # Ergebnis kontrollieren
+        with open(ausgabe) as datei:
+            werte = [int(zeile) for zeile in datei]
+        print("Korrekt sortiert:", len(werte) == anzahl_datensaetze
+              and all(werte[i] <= werte[i + 1] for i in range(len(werte) - 1)))
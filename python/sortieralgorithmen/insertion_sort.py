@@ -23,30 +23,77 @@ NACHTEILE:
 
 # TODO: Zeitmessung mittels Zeitstempel implementieren (z.B. mit time.time() vor/nach Sortierung)
 
-# Ausgangsliste mit Umsortieren Wortern definieren
-#input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
-
-# Ausgangsliste mit Umsortieren Ganzzahlen definieren
-input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
-
-# Zusätzliche eindeutige Werte ergänzen
-input_list += [17, 23, 1, 99, 7, 56]
-input_list += [34, 65, 12, 88, 3, 77]
-
-# Unsortierte Liste zur Kontrolle ausgeben
-print("Unsortierte Liste:", input_list)
-
-# Äußere Schleife: Durchläufe für jedes Element ab dem zweiten (Index 1)
-for i in range(1, len(input_list)):
-    # Aktuelles Element, das einsortiert werden soll
-    key = input_list[i]
-    # Innere Schleife: Vergleiche mit den vorherigen Elementen im sortierten Bereich
-    j = i - 1
-    # Verschiebe Elemente nach rechts, bis die richtige Position für 'key' gefunden ist
-    while j >= 0 and input_list[j] > key:
-        input_list[j + 1] = input_list[j]
-        j -= 1
-    # Füge 'key' an der richtigen Position ein
-    input_list[j + 1] = key
-    # Bisher sortierten Teil der Liste und den unsortierten Teil ausgeben
-    print(f"Durchlauf {i}: {input_list[:i + 1]} | {input_list[i + 1:]}")
\ No newline at end of file
+from instrumentierung import DURCHLAUF, KOPIERE, MERKE, SCHREIBE, VERGLEICH
+
+
+# protokoll: optionales SortierProtokoll aus instrumentierung.py (zählt bzw. zeichnet die Operationen auf)
+def insertion_sort(input_list, protokoll=None):
+    if protokoll is not None:
+        return _insertion_sort_protokoll(input_list, protokoll)
+    # Äußere Schleife: Durchläufe für jedes Element ab dem zweiten (Index 1)
+    for i in range(1, len(input_list)):
+        # Aktuelles Element, das einsortiert werden soll
+        key = input_list[i]
+        # Innere Schleife: Vergleiche mit den vorherigen Elementen im sortierten Bereich
+        j = i - 1
+        # Verschiebe Elemente nach rechts, bis die richtige Position für 'key' gefunden ist
+        while j >= 0 and input_list[j] > key:
+            input_list[j + 1] = input_list[j]
+            j -= 1
+        # Füge 'key' an der richtigen Position ein
+        input_list[j + 1] = key
+    return input_list
+
+
+# Gleiche Schleife mit Protokoll - eigene Funktion, damit die Variante ohne Protokoll unverändert schnell bleibt
+def _insertion_sort_protokoll(input_list, protokoll):
+    aufzeichnen = protokoll.aufzeichnen
+    notiere = protokoll.notiere
+    vergleiche = verschiebungen = 0
+    for i in range(1, len(input_list)):
+        key = input_list[i]
+        if aufzeichnen:
+            notiere(MERKE, i)
+        j = i - 1
+        while j >= 0:
+            vergleiche += 1
+            if aufzeichnen:
+                notiere(VERGLEICH, j, i)
+            if not input_list[j] > key:
+                break
+            input_list[j + 1] = input_list[j]
+            verschiebungen += 1
+            if aufzeichnen:
+                notiere(KOPIERE, j, j + 1)
+            j -= 1
+        input_list[j + 1] = key
+        verschiebungen += 1
+        if aufzeichnen:
+            notiere(SCHREIBE, j + 1)
+            notiere(DURCHLAUF, i)
+    protokoll.zaehle(vergleiche, verschiebungen=verschiebungen, durchlaeufe=max(0, len(input_list) - 1))
+    return input_list
+
+
+if __name__ == "__main__":
+    from instrumentierung import SortierProtokoll, abspielen
+
+    # Ausgangsliste mit Umsortieren Wortern definieren
+    #input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
+
+    # Ausgangsliste mit Umsortieren Ganzzahlen definieren
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+
+    # Zusätzliche eindeutige Werte ergänzen
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+
+    # Unsortierte Liste zur Kontrolle ausgeben
+    print("Unsortierte Liste:", input_list)
+
+    # Sortieren und dabei die Operationen aufzeichnen (während der Sortierung wird nichts formatiert)
+    protokoll = SortierProtokoll(aufzeichnen=True)
+    insertion_sort(list(input_list), protokoll)
+    # Bisher sortierten Teil der Liste und den unsortierten Teil nach jedem Durchlauf ausgeben
+    for i, liste in abspielen(input_list, protokoll):
+        print(f"Durchlauf {i}: {liste[:i + 1]} | {liste[i + 1:]}")
@@ -0,0 +1,139 @@
+"""
+Optimierte Insertion Sort Varianten
+===================================
+
+Dieser Code demonstriert Verbesserungen des Insertion-Sort-Algorithmus aus insertion_sort.py.
+
+PROBLEME DER EINFACHEN VARIANTE:
+- Die Einfügeposition wird linear gesucht (while j >= 0 ...) -> bis zu i Vergleiche pro Element
+- Jedes größere Element wird einzeln um eine Position nach rechts verschoben
+- Die Ausgabe von input_list[:i + 1] in jedem Durchlauf kostet selbst schon O(n²)
+
+OPTIMIERUNGEN:
+1. Binary Insertion Sort
+   -> Die Einfügeposition im bereits sortierten Bereich wird per Bisektion gesucht (O(log i) Vergleiche)
+   -> Der Block rechts davon wird mit EINER Slice-Zuweisung verschoben (intern ein schnelles memmove)
+   -> bisect_right hält gleiche Werte in ihrer ursprünglichen Reihenfolge (stabil)
+2. Shell Sort
+   -> Insertion Sort über Elemente mit Abstand "gap" (Gap-Folge von Ciura: 701, 301, 132, 57, 23, 10, 4, 1)
+   -> Elemente legen zuerst große Strecken zurück, der letzte Durchlauf (gap=1) ist ein normaler Insertion Sort
+      auf einer fast sortierten Liste
+
+KEY-PARAMETER (Decorate-Sort-Undecorate):
+- Wie bei sorted(..., key=...) kann nach einem berechneten Schlüssel sortiert werden (z.B. key=str.lower)
+- Der Schlüssel wird nur EINMAL pro Element berechnet und in einer parallelen Liste mitgeführt
+- Alle Verschiebungen werden in beiden Listen gleich ausgeführt
+
+LAUFZEIT:
+- Binary Insertion Sort: O(n log n) Vergleiche, O(n²) Verschiebungen (aber als Block-Kopie sehr schnell)
+- Shell Sort (Ciura): in der Praxis etwa O(n^1.3)
+"""
+
+import time
+from bisect import bisect_right
+
+# Variante aus insertion_sort.py als Vergleichsbasis
+from insertion_sort import insertion_sort
+
+# Gap-Folge nach Ciura, für größere Listen mit Faktor 2,25 fortgesetzt
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701]
+
+
+def _ciura_gaps(n):
+    # Liefert die Gap-Folge absteigend, nur mit Abständen kleiner als n
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < n] or [1]
+
+
+def binary_insertion_sort(input_list, key=None):
+    # Insertion Sort mit Bisektion und Block-Verschiebung per Slice-Zuweisung
+    if key is not None:
+        return _binary_insertion_sort_key(input_list, key)
+
+    for i in range(1, len(input_list)):
+        # Aktuelles Element, das einsortiert werden soll
+        wert = input_list[i]
+        # Einfügeposition im sortierten Bereich [0, i) per Bisektion suchen
+        position = bisect_right(input_list, wert, 0, i)
+        if position < i:
+            # Block [position, i) um eine Stelle nach rechts schieben (eine einzige Operation)
+            input_list[position + 1:i + 1] = input_list[position:i]
+            input_list[position] = wert
+    return input_list
+
+
+def _binary_insertion_sort_key(input_list, key):
+    # Variante mit Schlüsselfunktion: Schlüssel einmal berechnen und parallel mitführen
+    schluessel = [key(wert) for wert in input_list]
+    for i in range(1, len(input_list)):
+        k = schluessel[i]
+        # Bisektion nur über die vorberechneten Schlüssel
+        position = bisect_right(schluessel, k, 0, i)
+        if position < i:
+            wert = input_list[i]
+            # Schlüssel und Werte mit identischer Block-Verschiebung umsortieren
+            schluessel[position + 1:i + 1] = schluessel[position:i]
+            schluessel[position] = k
+            input_list[position + 1:i + 1] = input_list[position:i]
+            input_list[position] = wert
+    return input_list
+
+
+def shell_sort(input_list, key=None, gaps=None):
+    # Shell Sort: Insertion Sort über schrumpfende Abstände (nicht stabil)
+    n = len(input_list)
+    # Schlüssel einmal berechnen; ohne key sind die Werte selbst die Schlüssel
+    schluessel = input_list if key is None else [key(wert) for wert in input_list]
+    gaps = gaps or _ciura_gaps(n)
+
+    for gap in gaps:
+        for i in range(gap, n):
+            k = schluessel[i]
+            wert = input_list[i]
+            j = i
+            # Größere Elemente im Abstand gap nach rechts verschieben
+            while j >= gap and schluessel[j - gap] > k:
+                schluessel[j] = schluessel[j - gap]
+                if schluessel is not input_list:
+                    input_list[j] = input_list[j - gap]
+                j -= gap
+            schluessel[j] = k
+            input_list[j] = wert
+    return input_list
+
+
+if __name__ == "__main__":
+    import random
+
+    # Ausgangsliste mit Wörtern, sortiert ohne Beachtung der Groß-/Kleinschreibung
+    woerter = ["Banane", "apfel", "Orange", "mango", "Birne", "kirsche"]
+    print("Unsortierte Liste:", woerter)
+    print("Sortierte Liste (key=str.lower):", binary_insertion_sort(list(woerter), key=str.lower))
+
+    # Benchmark: einfache Variante gegen Bisektion/Block-Verschiebung und Shell Sort
+    for n in (1_000, 5_000):
+        zahlen = [random.randint(0, 100_000) for _ in range(n)]
+        print(f"\n=== Benchmark mit {n} Elementen ===")
+        for name, funktion in (("Insertion Sort (insertion_sort.py)", insertion_sort),
+                               ("Binary Insertion Sort", binary_insertion_sort),
+                               ("Shell Sort (Ciura)", shell_sort)):
+            kopie = list(zahlen)
+            start = time.perf_counter()
+            funktion(kopie)
+            dauer = time.perf_counter() - start
+            assert kopie == sorted(zahlen), name
+            print(f"{name:<38} {dauer * 1000:9.2f} ms")
+
+        # Schlüsselfunktion: zählen, wie oft sie aufgerufen wird
+        aufrufe = [0]
+
+        def zaehlender_key(wert):
+            aufrufe[0] += 1
+            return -wert
+
+        start = time.perf_counter()
+        binary_insertion_sort(list(zahlen), key=zaehlender_key)
+        dauer = time.perf_counter() - start
+        print(f"{'Binary Insertion Sort (key=...)':<38} {dauer * 1000:9.2f} ms  ({aufrufe[0]} key-Aufrufe)")
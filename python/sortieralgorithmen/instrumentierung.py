@@ -0,0 +1,228 @@
+"""
+Instrumentierte Sortierung mit Operationszählern und Trace-Export
+=================================================================
+
+Dieser Code demonstriert, wie Sortieralgorithmen beobachtet werden können, ohne sie dabei auszubremsen.
+
+PROBLEM DER BISHERIGEN SKRIPTE:
+- In jedem Durchlauf wird die ganze Liste zerschnitten und formatiert (print(f"Durchlauf {i}: ...")
+- Diese Ausgabe kostet mehr Zeit als das Sortieren selbst und verfälscht jede Zeitmessung
+
+LÖSUNG:
+- Die Sortierfunktionen der Skripte (bubble_sort_tausch, insertion_sort, selection_sort) haben einen optionalen
+  Parameter `protokoll`
+  -> protokoll=None (Standard): die unveränderte, schnelle Schleife ohne jede Zusatzarbeit läuft
+  -> protokoll=SortierProtokoll(): eine zweite Schleife zählt Vergleiche, Tausche, Verschiebungen und Durchläufe
+- Dieses Modul stellt nur das Protokoll, die Operationscodes und abspielen bereit
+- Optional zeichnet das Protokoll jede Operation als drei Ganzzahlen auf (Operation, Index a, Index b)
+  -> gespeichert in array.array (kompakt, keine Objekte pro Operation, keine Formatierung während der Sortierung)
+- Der Trace kann als Binärdatei oder JSON-Lines exportiert und später abgespielt werden (abspielen)
+  -> erst beim Abspielen entstehen wieder die Zwischenstände "Durchlauf i: sortiert | unsortiert"
+
+OPERATIONEN:
+- VERGLEICH (a, b):   liste[a] wird mit liste[b] verglichen
+- TAUSCH (a, b):      liste[a] und liste[b] werden getauscht
+- MERKE (a, -):       liste[a] wird in eine temporäre Variable gelegt (Insertion Sort: key)
+- KOPIERE (a, b):     liste[b] = liste[a] (Verschiebung nach rechts)
+- SCHREIBE (a, -):    liste[a] = temporäre Variable
+- DURCHLAUF (i, -):   Ende von Durchlauf i
+"""
+
+import json
+import struct
+import sys
+import time
+from array import array
+
+# Operationscodes (ein Byte pro Operation)
+VERGLEICH = 0
+TAUSCH = 1
+MERKE = 2
+KOPIERE = 3
+SCHREIBE = 4
+DURCHLAUF = 5
+
+# Namen der Operationen für den JSON-Lines-Export
+OPERATIONEN = ["vergleich", "tausch", "merke", "kopiere", "schreibe", "durchlauf"]
+
+# Kennung am Anfang einer binären Trace-Datei
+TRACE_MAGIC = b"STRC"
+
+
+def _little_endian(spalte):
+    # Spalte in little-endian-Bytefolge (auf big-endian-Rechnern als umgedrehte Kopie)
+    if sys.byteorder == "big" and spalte.itemsize > 1:
+        spalte = array(spalte.typecode, spalte)
+        spalte.byteswap()
+    return spalte
+
+
+class SortierProtokoll:
+    """
+    Zählt die Operationen einer Sortierung und zeichnet sie optional als Trace auf.
+
+    Attributes:
+        vergleiche (int): Anzahl der Vergleiche zweier Elemente
+        tausche (int): Anzahl der Tausch-Operationen
+        verschiebungen (int): Anzahl der Kopier-/Schreiboperationen (Insertion Sort)
+        durchlaeufe (int): Anzahl der abgeschlossenen Durchläufe der äußeren Schleife
+    """
+
+    def __init__(self, aufzeichnen=False):
+        """
+        Args:
+            aufzeichnen (bool): Wenn True, wird jede Operation im Trace gespeichert.
+                                Wenn False, werden nur die Zähler erhöht.
+        """
+        self.aufzeichnen = aufzeichnen
+        self.vergleiche = 0
+        self.tausche = 0
+        self.verschiebungen = 0
+        self.durchlaeufe = 0
+        # Trace spaltenweise: Operationscodes und beide Argumente in getrennten kompakten Arrays
+        self.operationen = array("B")
+        self.argumente_a = array("q")
+        self.argumente_b = array("q")
+
+    def notiere(self, operation, a, b=-1):
+        # Hängt eine Operation an den Trace an (Aufrufer prüft vorher self.aufzeichnen)
+        self.operationen.append(operation)
+        self.argumente_a.append(a)
+        self.argumente_b.append(b)
+
+    def zaehle(self, vergleiche=0, tausche=0, verschiebungen=0, durchlaeufe=0):
+        # Übernimmt lokal gezählte Werte (die Sortierschleifen zählen in lokalen Variablen,
+        # weil ein Methodenaufruf pro Vergleich teurer wäre als der Vergleich selbst)
+        self.vergleiche += vergleiche
+        self.tausche += tausche
+        self.verschiebungen += verschiebungen
+        self.durchlaeufe += durchlaeufe
+
+    def zusammenfassung(self):
+        """Gibt die Zählerstände als Dictionary zurück."""
+        return {
+            "vergleiche": self.vergleiche,
+            "tausche": self.tausche,
+            "verschiebungen": self.verschiebungen,
+            "durchlaeufe": self.durchlaeufe,
+        }
+
+    def __iter__(self):
+        """Liefert den Trace als Tupel (operation, a, b)."""
+        return zip(self.operationen, self.argumente_a, self.argumente_b)
+
+    def __len__(self):
+        return len(self.operationen)
+
+    def export_binaer(self, dateiname):
+        """
+        Schreibt den Trace als Binärdatei.
+
+        Format: Kennung (4 Bytes), Anzahl Operationen (8 Bytes), danach die drei Spalten
+        als rohe Bytes (1 + 8 + 8 Bytes pro Operation), alles little-endian.
+        """
+        with open(dateiname, "wb") as datei:
+            datei.write(TRACE_MAGIC)
+            datei.write(struct.pack("<Q", len(self.operationen)))
+            for spalte in (self.operationen, self.argumente_a, self.argumente_b):
+                datei.write(_little_endian(spalte).tobytes())
+
+    def export_jsonl(self, dateiname):
+        """Schreibt den Trace als JSON-Lines (eine Operation pro Zeile)."""
+        with open(dateiname, "w") as datei:
+            for operation, a, b in self:
+                datei.write(json.dumps({"op": OPERATIONEN[operation], "a": a, "b": b}) + "\n")
+
+    @classmethod
+    def import_binaer(cls, dateiname):
+        """Liest einen mit export_binaer geschriebenen Trace wieder ein."""
+        protokoll = cls(aufzeichnen=True)
+        with open(dateiname, "rb") as datei:
+            if datei.read(4) != TRACE_MAGIC:
+                raise ValueError(f"{dateiname} ist keine Trace-Datei")
+            (anzahl,) = struct.unpack("<Q", datei.read(8))
+            for spalte in (protokoll.operationen, protokoll.argumente_a, protokoll.argumente_b):
+                daten = datei.read(anzahl * spalte.itemsize)
+                # Abgeschnittene Datei: sonst entstünden Spalten unterschiedlicher Länge
+                if len(daten) != anzahl * spalte.itemsize:
+                    raise ValueError(f"{dateiname} ist unvollständig: {anzahl} Operationen angekündigt")
+                spalte.frombytes(daten)
+                if sys.byteorder == "big":
+                    spalte.byteswap()
+        return protokoll
+
+    @classmethod
+    def import_jsonl(cls, dateiname):
+        """Liest einen mit export_jsonl geschriebenen Trace wieder ein."""
+        protokoll = cls(aufzeichnen=True)
+        with open(dateiname) as datei:
+            for zeile in datei:
+                eintrag = json.loads(zeile)
+                protokoll.notiere(OPERATIONEN.index(eintrag["op"]), eintrag["a"], eintrag["b"])
+        return protokoll
+
+
+def abspielen(start_liste, protokoll):
+    """
+    Spielt einen Trace auf einer Kopie der Ausgangsliste ab.
+
+    Liefert nach jedem Durchlauf (i, liste) - daraus lassen sich die Zwischenstände
+    im Nachhinein ausgeben, ohne die Sortierung selbst zu verlangsamen.
+    """
+    liste = list(start_liste)
+    temp = None
+    for operation, a, b in protokoll:
+        if operation == TAUSCH:
+            liste[a], liste[b] = liste[b], liste[a]
+        elif operation == MERKE:
+            temp = liste[a]
+        elif operation == KOPIERE:
+            liste[b] = liste[a]
+        elif operation == SCHREIBE:
+            liste[a] = temp
+        elif operation == DURCHLAUF:
+            yield a, liste
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    from bubble_sort import bubble_sort_tausch
+    from insertion_sort import insertion_sort
+    from selection_sort import selection_sort
+
+    # Ausgangsliste wie in den anderen Sortier-Skripten
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+    print("Unsortierte Liste:", input_list)
+
+    # Sortieren mit Aufzeichnung - während der Sortierung wird nichts formatiert
+    protokoll = SortierProtokoll(aufzeichnen=True)
+    insertion_sort(list(input_list), protokoll)
+    print("Zähler:", protokoll.zusammenfassung(), f"({len(protokoll)} Operationen im Trace)")
+
+    # Trace exportieren, wieder einlesen und die Zwischenstände nachträglich ausgeben
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        pfad = os.path.join(verzeichnis, "insertion.trace")
+        protokoll.export_binaer(pfad)
+        print(f"Binärer Trace: {os.path.getsize(pfad)} Bytes")
+        for i, liste in abspielen(input_list, SortierProtokoll.import_binaer(pfad)):
+            print(f"Durchlauf {i}: {liste[:i + 1]} | {liste[i + 1:]}")
+
+    # Benchmark: ohne Protokoll, nur Zähler, vollständiger Trace
+    n = 2_000
+    zahlen = [random.randint(0, 100_000) for _ in range(n)]
+    for name, funktion in (("Bubble Sort", bubble_sort_tausch), ("Insertion Sort", insertion_sort),
+                           ("Selection Sort", selection_sort)):
+        print(f"\n=== {name}, {n} Elemente ===")
+        for modus, erzeuge in (("ohne Protokoll", lambda: None),
+                               ("nur Zähler", lambda: SortierProtokoll()),
+                               ("mit Trace", lambda: SortierProtokoll(aufzeichnen=True))):
+            aktuelles = erzeuge()
+            start = time.perf_counter()
+            funktion(list(zahlen), aktuelles)
+            dauer = time.perf_counter() - start
+            print(f"{modus:<16} {dauer * 1000:9.2f} ms")
@@ -0,0 +1,285 @@
+"""
+Vektorisierte Sortierung für numerische Arrays
+==============================================
+
+Dieser Code demonstriert, wie große Zahlenmengen ohne Python-Schleifen pro Element sortiert werden können.
+
+FUNKTIONSWEISE:
+- Die Daten werden als zusammenhängender Speicherbereich (array.array, NumPy-Array, memoryview) übergeben
+- Über das Buffer-Protokoll greift NumPy direkt auf diesen Speicher zu (keine Kopie, kein int-Objekt pro Element)
+- Statt einzelne Elemente zu vergleichen, arbeiten die Kernel auf ganzen Array-Ausschnitten auf einmal
+
+DREI KERNEL:
+1. Odd-Even-Transposition-Sort - Bubble Sort als vektorisierte Vergleichs-und-Tausch-Schritte
+   -> Gerade Phase: vergleicht alle Paare (0,1), (2,3), (4,5), ... gleichzeitig
+   -> Ungerade Phase: vergleicht alle Paare (1,2), (3,4), (5,6), ... gleichzeitig
+   -> Nach spätestens n Phasen ist das Array sortiert (wie n Durchläufe beim Bubble Sort)
+2. Counting Sort - für Ganzzahlen mit kleinem Wertebereich (z.B. 0 bis 100)
+   -> Zählt jedes Vorkommen und schreibt die Werte anschließend in Reihenfolge zurück (O(n + k))
+3. Radix Sort (LSD) - für beliebige 64-Bit-Ganzzahlen
+   -> Sortiert stabil nach 16-Bit-Ziffern, von der niedrigsten zur höchsten (4 Durchläufe, O(n))
+
+VORTEILE:
+- Puffer (array.array, NumPy-Array) werden direkt an Ort und Stelle sortiert
+- Counting/Radix Sort sind lineare Verfahren und schlagen bei großen Mengen jede O(n²)-Variante deutlich
+
+NACHTEILE:
+- Nur für Zahlen geeignet (keine Wörter wie "Banane", "Apfel", ...)
+- Ohne installiertes NumPy wird auf langsamere reine Python-Schleifen zurückgefallen
+"""
+
+import time
+from array import array
+
+# NumPy ist optional - ohne NumPy laufen die gleichen Funktionen als reine Python-Schleifen
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Typcodes von array.array, die ganze Zahlen enthalten (für Counting/Radix Sort nötig)
+GANZZAHL_TYPECODES = "bBhHiIlLqQ"
+
+# Maximale Größe des Wertebereichs im Verhältnis zur Länge, bis zu der Counting Sort gewählt wird
+COUNTING_FAKTOR = 4
+
+
+def _als_numpy(daten):
+    # Liefert eine NumPy-Sicht auf die Daten (bei Puffern ohne Kopie) und ob zurückgeschrieben werden muss
+    if isinstance(daten, np.ndarray):
+        return daten, False
+    if isinstance(daten, array):
+        # Sicht auf den Speicher des array.array - Änderungen landen direkt im Original
+        return np.frombuffer(daten, dtype=daten.typecode), False
+    if isinstance(daten, memoryview):
+        return np.asarray(daten), False
+    # Python-Liste: einmalig in ein NumPy-Array umwandeln, Ergebnis wird später zurückgeschrieben
+    return np.array(daten), True
+
+
+def _zurueckschreiben(daten, werte, kopiert):
+    # Schreibt das sortierte Ergebnis in den ursprünglichen Container zurück
+    if kopiert:
+        daten[:] = werte.tolist()
+    else:
+        _als_numpy(daten)[0][:] = werte
+    return daten
+
+
+def odd_even_sort(daten):
+    # Odd-Even-Transposition-Sort: Bubble Sort mit ganzen Array-Ausschnitten statt einzelnen Elementen
+    if np is None:
+        return _odd_even_sort_python(daten)
+
+    werte, kopiert = _als_numpy(daten)
+    n = len(werte)
+    # Anzahl Phasen in Folge, in denen nichts getauscht wurde (2 in Folge = sortiert)
+    ruhige_phasen = 0
+
+    for phase in range(n):
+        # Startindex abwechselnd 0 (gerade Phase) und 1 (ungerade Phase)
+        start = phase % 2
+        # Linke und rechte Partner aller Paare als Sichten (keine Kopie)
+        links = werte[start:n - 1:2]
+        rechts = werte[start + 1:n:2]
+        # Alle Paare auf einmal vergleichen
+        falsch = links > rechts
+        if not falsch.any():
+            ruhige_phasen += 1
+            # Gerade UND ungerade Phase ohne Tausch -> Liste ist sortiert (vorzeitiger Abbruch)
+            if ruhige_phasen == 2:
+                break
+            continue
+        ruhige_phasen = 0
+        # Kleineres Element nach links, größeres nach rechts (Tausch für alle Paare gleichzeitig)
+        kleiner = np.minimum(links, rechts)
+        groesser = np.maximum(links, rechts)
+        links[:] = kleiner
+        rechts[:] = groesser
+
+    if kopiert:
+        return _zurueckschreiben(daten, werte, kopiert)
+    return daten
+
+
+def _odd_even_sort_python(daten):
+    # Fallback ohne NumPy: gleiche Phasen, aber mit einer Python-Schleife pro Paar
+    n = len(daten)
+    ruhige_phasen = 0
+    for phase in range(n):
+        getauscht = False
+        for j in range(phase % 2, n - 1, 2):
+            if daten[j] > daten[j + 1]:
+                daten[j], daten[j + 1] = daten[j + 1], daten[j]
+                getauscht = True
+        ruhige_phasen = 0 if getauscht else ruhige_phasen + 1
+        if ruhige_phasen == 2:
+            break
+    return daten
+
+
+def counting_sort(daten):
+    # Counting Sort für Ganzzahlen mit kleinem Wertebereich
+    if len(daten) == 0:
+        return daten
+    if np is None:
+        return _counting_sort_python(daten)
+
+    werte, kopiert = _als_numpy(daten)
+    minimum = int(werte.min())
+    # Abstand zum Minimum: vorzeichenlose Typen können dabei nicht überlaufen, vorzeichenbehaftete schon
+    # (int8: 127 - (-128) = 255) - daher vorher in int64 umwandeln
+    if np.issubdtype(werte.dtype, np.unsignedinteger):
+        abstand = werte - werte.min()
+    else:
+        abstand = werte.astype(np.int64) - minimum
+    # Häufigkeit jedes Wertes zählen (Index 0 entspricht dem Minimum)
+    anzahl = np.bincount(abstand.astype(np.intp))
+    # Jeden Wert so oft wiederholen, wie er vorkommt -> sortierte Folge
+    sortiert = np.repeat(np.arange(minimum, minimum + len(anzahl), dtype=werte.dtype), anzahl)
+    return _zurueckschreiben(daten, sortiert, kopiert)
+
+
+def _counting_sort_python(daten):
+    # Fallback ohne NumPy: Zählliste über den Wertebereich
+    minimum = min(daten)
+    anzahl = [0] * (max(daten) - minimum + 1)
+    for wert in daten:
+        anzahl[wert - minimum] += 1
+    position = 0
+    for offset, haeufigkeit in enumerate(anzahl):
+        for _ in range(haeufigkeit):
+            daten[position] = offset + minimum
+            position += 1
+    return daten
+
+
+def radix_sort(daten):
+    # LSD Radix Sort für 64-Bit-Ganzzahlen mit 16-Bit-Ziffern
+    if len(daten) == 0:
+        return daten
+    if np is None:
+        return _radix_sort_python(daten)
+
+    werte, kopiert = _als_numpy(daten)
+    vorzeichenlos = np.issubdtype(werte.dtype, np.unsignedinteger)
+    if vorzeichenlos:
+        # Vorzeichenlose Werte sind bereits gültige Schlüssel (Werte ab 2**63 dürfen nicht umgedreht werden)
+        schluessel = werte.astype(np.uint64)
+    else:
+        # Vorzeichenbit umdrehen, damit negative Zahlen als vorzeichenlose Schlüssel vorne landen
+        schluessel = werte.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+
+    for verschiebung in range(0, 64, 16):
+        # Aktuelle 16-Bit-Ziffer aller Schlüssel auf einmal bestimmen
+        ziffer = (schluessel >> np.uint64(verschiebung)) & np.uint64(0xFFFF)
+        # Durchlauf überspringen, wenn alle Ziffern gleich sind (z.B. obere Bits bei kleinen Zahlen)
+        if ziffer.min() == ziffer.max():
+            continue
+        # Stabile Sortierung nach der Ziffer (NumPy nutzt hierfür selbst einen Radix-Kernel)
+        reihenfolge = np.argsort(ziffer.astype(np.uint16), kind="stable")
+        schluessel = schluessel[reihenfolge]
+
+    # Vorzeichenbit zurückdrehen und in den ursprünglichen Datentyp umwandeln
+    if vorzeichenlos:
+        sortiert = schluessel.astype(werte.dtype)
+    else:
+        sortiert = (schluessel ^ np.uint64(1 << 63)).view(np.int64).astype(werte.dtype)
+    return _zurueckschreiben(daten, sortiert, kopiert)
+
+
+def _radix_sort_python(daten):
+    # Fallback ohne NumPy: LSD Radix Sort mit Eimerlisten
+    versatz = -min(daten)
+    werte = [wert + versatz for wert in daten]
+    verschiebung = 0
+    hoechster = max(werte)
+    while (hoechster >> verschiebung) > 0:
+        eimer = [[] for _ in range(1 << 16)]
+        for wert in werte:
+            eimer[(wert >> verschiebung) & 0xFFFF].append(wert)
+        werte = [wert for inhalt in eimer for wert in inhalt]
+        verschiebung += 16
+    for i, wert in enumerate(werte):
+        daten[i] = wert - versatz
+    return daten
+
+
+def sortiere_zahlen(daten):
+    # Wählt anhand der Daten den passenden Kernel aus
+    if len(daten) < 2:
+        return daten
+
+    # Typcode bzw. Datentyp bestimmen, um Ganzzahlen von Kommazahlen zu unterscheiden
+    if isinstance(daten, array):
+        ganzzahlig = daten.typecode in GANZZAHL_TYPECODES
+    elif np is not None and isinstance(daten, np.ndarray):
+        ganzzahlig = np.issubdtype(daten.dtype, np.integer)
+    else:
+        ganzzahlig = all(isinstance(wert, int) for wert in daten)
+
+    if not ganzzahlig:
+        # Kommazahlen: vektorisiert über NumPy, sonst Odd-Even-Sort
+        if np is not None:
+            werte, kopiert = _als_numpy(daten)
+            return _zurueckschreiben(daten, np.sort(werte, kind="stable"), kopiert)
+        return _odd_even_sort_python(daten)
+
+    # Kleiner Wertebereich -> Counting Sort, sonst Radix Sort
+    if np is not None:
+        # min()/max() der NumPy-Sicht laufen in C - max(daten) würde für jedes Element ein int-Objekt anlegen
+        werte, _ = _als_numpy(daten)
+        wertebereich = int(werte.max()) - int(werte.min()) + 1
+    else:
+        wertebereich = max(daten) - min(daten) + 1
+    if wertebereich <= COUNTING_FAKTOR * len(daten):
+        return counting_sort(daten)
+    return radix_sort(daten)
+
+
+def _messen(name, funktion, daten):
+    # Misst die Laufzeit einer Sortierfunktion und prüft das Ergebnis
+    start = time.perf_counter()
+    ergebnis = funktion(daten)
+    dauer = time.perf_counter() - start
+    werte = list(ergebnis)
+    assert all(werte[i] <= werte[i + 1] for i in range(len(werte) - 1)), name
+    print(f"{name:<38} {dauer * 1000:10.2f} ms")
+    return dauer
+
+
+if __name__ == "__main__":
+    import random
+
+    # Klassische Varianten aus bubble_sort.py und insertion_sort.py als Vergleichsbasis
+    from bubble_sort import bubble_sort_tausch
+    from insertion_sort import insertion_sort
+
+    # Kleines Beispiel mit den bekannten Werten aus den anderen Sortier-Skripten
+    input_list = array("q", [10, 2, 5, 4, 80, 43, 17, 23, 1, 99, 7, 56, 34, 65, 12, 88, 3, 77])
+    print("Unsortierte Liste:", input_list.tolist())
+    sortiere_zahlen(input_list)
+    print("Sortierte Liste:  ", input_list.tolist())
+    print("NumPy verfügbar:", np is not None)
+
+    # Randfälle: kleine Ganzzahltypen (Überlauf beim Abstand zum Minimum) und uint64-Werte ab 2**63
+    for typecode, werte in (("b", [-128, 127, -1, 0] * 40), ("h", [-32768, 32767, 0, -1] * 40),
+                            ("Q", [2**63 + 5, 1, 2**64 - 1, 7]), ("q", [-2**63, 2**63 - 1, 0, -5])):
+        # Counting Sort nur bei kleinem Wertebereich (bei uint64/int64 bräuchte die Zählliste 2**64 Einträge)
+        for funktion in ((counting_sort,) if typecode in "bh" else ()) + (radix_sort, sortiere_zahlen):
+            assert funktion(array(typecode, werte)).tolist() == sorted(werte), (funktion.__name__, typecode)
+    print("Randfälle (int8, int16, uint64, int64) korrekt sortiert")
+
+    # Benchmark: reine Python-Schleifen gegen die vektorisierten Kernel
+    for n in (2_000, 1_000_000):
+        zahlen = [random.randint(-1_000_000, 1_000_000) for _ in range(n)]
+        kleine_zahlen = [random.randint(0, 100) for _ in range(n)]
+        print(f"\n=== Benchmark mit {n} Elementen ===")
+        if n <= 2_000:
+            _messen("Bubble Sort (Python-Liste)", bubble_sort_tausch, list(zahlen))
+            _messen("Insertion Sort (Python-Liste)", insertion_sort, list(zahlen))
+            _messen("Odd-Even-Sort (array.array)", odd_even_sort, array("q", zahlen))
+        _messen("Radix Sort (array.array)", radix_sort, array("q", zahlen))
+        _messen("Counting Sort (array.array, 0..100)", counting_sort, array("q", kleine_zahlen))
+        _messen("sortiere_zahlen (array.array)", sortiere_zahlen, array("q", zahlen))
+        _messen("sorted() (Python-Liste)", sorted, list(zahlen))
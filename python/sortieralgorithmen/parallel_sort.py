@@ -0,0 +1,185 @@
+"""
+Parallele Sample-Sortierung über mehrere Prozesse
+=================================================
+
+Dieser Code demonstriert das Sortieren großer Zahlenlisten im Arbeitsspeicher mit mehreren CPU-Kernen.
+
+FUNKTIONSWEISE:
+- Die Zahlen liegen einmalig in einem Shared-Memory-Block (multiprocessing.shared_memory)
+  -> Worker-Prozesse bekommen nur den Namen des Blocks und Indizes übergeben, niemals die Daten selbst
+- Phase 1 (lokal sortieren): Jeder der p Worker sortiert einen zusammenhängenden Abschnitt an Ort und Stelle
+- Splitter wählen: Aus einer Stichprobe der Daten werden p-1 Trennwerte (Splitter) bestimmt
+  -> Sie teilen den Wertebereich in p Eimer (Buckets) mit ungefähr gleich vielen Elementen
+  -> In jedem sortierten Abschnitt liegen die Eimergrenzen per Bisektion in O(p log n) fest
+- Phase 2 (Eimer mischen): Worker b sammelt Eimer b aus allen Abschnitten, sortiert ihn und schreibt ihn
+  an seine Endposition im Ausgabe-Block (Position = Summe der Größen aller vorherigen Eimer)
+- Die Eimer liegen damit bereits in der richtigen Reihenfolge hintereinander - kein abschließendes Mischen nötig
+
+VORTEILE:
+- Beide Phasen laufen vollständig parallel, nur kleine Index-Tupel werden zwischen Prozessen verschickt
+
+NACHTEILE:
+- Nur für Zahlen (array.array mit festem Typcode), nicht für beliebige Python-Objekte
+- Prozessstart und Kopie in den Shared Memory lohnen sich erst ab mehreren Millionen Elementen
+"""
+
+import os
+import random
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# NumPy ist optional - beschleunigt das Sortieren in den Workern, ist aber nicht erforderlich
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Stichprobengröße pro Eimer für die Wahl der Splitter
+UEBERABTASTUNG = 64
+
+# Darunter wird nicht parallelisiert (Prozessstart wäre teurer als die Sortierung)
+MINDEST_GROESSE = 100_000
+
+
+def _sicht(block, typecode, start, ende):
+    # Liefert eine typisierte memoryview auf einen Bereich eines Shared-Memory-Blocks (keine Kopie)
+    return block.buf.cast(typecode)[start:ende]
+
+
+def _sortiere_abschnitt(name, typecode, start, ende, splitter):
+    # Phase 1 (Worker): Abschnitt an Ort und Stelle sortieren und Eimergrenzen bestimmen
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # Alle Sichten auf den Block leben nur in der Hilfsfunktion (sonst schlägt close() fehl)
+        return _sortiere_sicht(_sicht(block, typecode, start, ende), typecode, start, splitter)
+    finally:
+        block.close()
+
+
+def _sortiere_sicht(sicht, typecode, start, splitter):
+    if np is not None:
+        sortiert = np.frombuffer(sicht, dtype=typecode)
+        sortiert.sort()
+        # Eimergrenzen per Bisektion: gleiche Werte landen immer im selben Eimer
+        grenzen = (start + np.searchsorted(sortiert, splitter, side="right")).tolist()
+    else:
+        sortiert = array(typecode, sorted(sicht))
+        sicht[:] = sortiert
+        grenzen = [start + bisect_right(sortiert, trennwert) for trennwert in splitter]
+    return [start] + grenzen + [start + len(sicht)]
+
+
+def _mische_eimer(name_ein, name_aus, typecode, bereiche, ziel):
+    # Phase 2 (Worker): Stücke eines Eimers aus allen Abschnitten sammeln, sortieren, an Zielposition schreiben
+    ein = shared_memory.SharedMemory(name=name_ein)
+    aus = shared_memory.SharedMemory(name=name_aus)
+    try:
+        eimer = array(typecode)
+        for start, ende in bereiche:
+            eimer.frombytes(_sicht(ein, typecode, start, ende).cast("B"))
+        if np is not None:
+            np.frombuffer(eimer, dtype=typecode).sort()
+        else:
+            # Timsort erkennt die bereits sortierten Stücke und mischt sie nur noch
+            eimer = array(typecode, sorted(eimer))
+        _sicht(aus, typecode, ziel, ziel + len(eimer))[:] = eimer
+        return len(eimer)
+    finally:
+        ein.close()
+        aus.close()
+
+
+def _waehle_splitter(daten, anzahl_eimer):
+    # Wählt anzahl_eimer - 1 Trennwerte aus einer sortierten Stichprobe
+    stichprobe = sorted(random.choices(daten, k=anzahl_eimer * UEBERABTASTUNG))
+    return [stichprobe[i * UEBERABTASTUNG] for i in range(1, anzahl_eimer)]
+
+
+def parallel_sort(daten, worker=None, typecode=None, pool=None):
+    """
+    Sortiert eine Zahlenfolge mit mehreren Prozessen und gibt ein array.array zurück.
+
+    Args:
+        daten: array.array oder Liste mit Zahlen
+        worker (int): Anzahl der Prozesse (Standard: Anzahl CPU-Kerne)
+        typecode (str): Typcode für Listen (Standard: "q" für ganze Zahlen, "d" sonst)
+        pool: Optional ein bestehender ProcessPoolExecutor (spart den Prozessstart)
+    """
+    worker = worker or os.cpu_count() or 1
+    if not isinstance(daten, array):
+        if typecode is None:
+            typecode = "q" if all(isinstance(wert, int) for wert in daten) else "d"
+        daten = array(typecode, daten)
+    typecode = daten.typecode
+    n = len(daten)
+
+    # Kleine Eingaben oder nur ein Kern: einfach sortieren
+    if worker == 1 or n < MINDEST_GROESSE:
+        return array(typecode, sorted(daten))
+
+    splitter = _waehle_splitter(daten, worker)
+    ein = shared_memory.SharedMemory(create=True, size=n * daten.itemsize)
+    aus = shared_memory.SharedMemory(create=True, size=n * daten.itemsize)
+    eigener_pool = pool is None
+    pool = pool or ProcessPoolExecutor(max_workers=worker)
+    try:
+        # Daten einmalig in den Shared Memory kopieren
+        _sicht(ein, typecode, 0, n)[:] = daten
+
+        # Phase 1: Abschnitte parallel sortieren
+        abschnitt = -(-n // worker)
+        auftraege = [pool.submit(_sortiere_abschnitt, ein.name, typecode, start, min(start + abschnitt, n), splitter)
+                     for start in range(0, n, abschnitt)]
+        grenzen = [auftrag.result() for auftrag in auftraege]
+
+        # Zielposition jedes Eimers = Summe der Größen aller vorherigen Eimer
+        auftraege = []
+        ziel = 0
+        for b in range(worker):
+            bereiche = [(g[b], g[b + 1]) for g in grenzen if g[b] < g[b + 1]]
+            auftraege.append(pool.submit(_mische_eimer, ein.name, aus.name, typecode, bereiche, ziel))
+            ziel += sum(ende - start for start, ende in bereiche)
+        for auftrag in auftraege:
+            auftrag.result()
+
+        # Ergebnis aus dem Shared Memory zurückkopieren
+        ergebnis = array(typecode)
+        ergebnis.frombytes(aus.buf[:n * daten.itemsize])
+        return ergebnis
+    finally:
+        if eigener_pool:
+            pool.shutdown()
+        for block in (ein, aus):
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    # Kurzes Beispiel mit der Ausgangsliste aus den anderen Sortier-Skripten
+    input_list = [10, 2, 5, 4, 80, 43, 17, 23, 1, 99, 7, 56, 34, 65, 12, 88, 3, 77]
+    print("Unsortierte Liste:", input_list)
+    print("Sortierte Liste:", parallel_sort(input_list).tolist())
+
+    # Skalierung von 1 bis N Kernen
+    n = 5_000_000
+    zahlen = array("q", (random.randint(-10**12, 10**12) for _ in range(n)))
+    print(f"\n=== Benchmark mit {n} Elementen, NumPy verfügbar: {np is not None} ===")
+    start = time.perf_counter()
+    erwartet = array("q", sorted(zahlen))
+    basis = time.perf_counter() - start
+    print(f"{'sorted() (1 Kern)':<24} {basis:7.2f} s")
+
+    kerne = os.cpu_count() or 1
+    stufen = sorted({1, 2, 4, 8, 16, 32, kerne} & set(range(1, kerne + 1))) or [1]
+    for anzahl in stufen:
+        with ProcessPoolExecutor(max_workers=anzahl) as pool:
+            # Prozesse vorab starten, damit nur die Sortierung gemessen wird
+            list(pool.map(abs, range(anzahl)))
+            start = time.perf_counter()
+            ergebnis = parallel_sort(zahlen, worker=anzahl, pool=pool)
+            dauer = time.perf_counter() - start
+        assert ergebnis == erwartet
+        print(f"{f'parallel_sort, {anzahl} Kern(e)':<24} {dauer:7.2f} s  (Faktor {basis / dauer:5.1f}x)")
@@ -0,0 +1,157 @@
+"""
+Partielle Sortierung / Top-k-Auswahl
+====================================
+
+Dieser Code demonstriert, wie nur die k kleinsten Elemente bestimmt werden, ohne die ganze Liste zu sortieren.
+
+IDEE (aus selection_sort.py):
+- Selection Sort sucht in jedem Durchlauf das Minimum des unsortierten Rests
+- Nach k Durchläufen stehen die k kleinsten Elemente bereits sortiert vorne
+- Bricht man dort ab, erhält man eine partielle Sortierung - allerdings mit O(n * k) Vergleichen
+
+BESSERE VERFAHREN:
+1. Heap-basiertes Top-k (partial_sort)
+   -> Ein Max-Heap mit k Elementen enthält die k kleinsten bisher gesehenen Werte
+   -> Jedes neue Element muss nur mit der Heap-Spitze (größtes der k) verglichen werden
+   -> O(n log k) Zeit, O(k) Speicher - funktioniert auch mit Iteratoren/Streams (streaming_top_k)
+2. Quickselect (select_k)
+   -> Wie Quicksort, aber es wird nur in der Hälfte weitergesucht, in der das k-te Element liegt
+   -> Durchschnittlich O(n); entartet die Pivot-Wahl, wird auf Median-of-Medians umgeschaltet
+      (Introselect, garantiert O(n))
+
+WANN WAS:
+- Kleines k (z.B. die 10 kleinsten von Millionen): partial_sort / streaming_top_k
+- Großes k: partial_sort sortiert vollständig (Timsort in C ist dann schneller als ein Python-Heap)
+- Nur das k-te Element (z.B. Median): select_k - benötigt keine sortierte Kopie, aber in reinem Python
+  ist der konstante Faktor hoch; der Vorteil zeigt sich erst bei teuren Vergleichen
+"""
+
+import heapq
+import random
+import time
+
+# Bis zu k = n / HEAP_FAKTOR lohnt sich der Heap gegenüber vollständigem Sortieren
+HEAP_FAKTOR = 64
+
+
+def selection_sort_partiell(input_list, k):
+    # Selection Sort aus selection_sort.py, nach k Durchläufen abgebrochen (O(n * k)) - Vergleichsbasis
+    laenge = len(input_list)
+    for i in range(min(k, laenge - 1)):
+        min_index = i
+        for j in range(i + 1, laenge):
+            if input_list[j] < input_list[min_index]:
+                min_index = j
+        if min_index != i:
+            input_list[i], input_list[min_index] = input_list[min_index], input_list[i]
+    return input_list[:k]
+
+
+def streaming_top_k(iterable, k, key=None):
+    # Liefert die k kleinsten Elemente eines beliebigen Iterables sortiert (O(k) Speicher)
+    # heapq.nsmallest hält intern einen Max-Heap mit k Einträgen und vergleicht jedes neue Element
+    # nur mit dessen Spitze - der Iterator wird dabei nie vollständig in den Speicher geladen
+    if k <= 0:
+        return []
+    return heapq.nsmallest(k, iterable, key=key)
+
+
+def partial_sort(seq, k, key=None):
+    # Liefert die k kleinsten Elemente von seq aufsteigend sortiert
+    if k <= 0:
+        return []
+    if k >= len(seq):
+        return sorted(seq, key=key)
+    # Für kleines k: Heap-basiertes Top-k in O(n log k)
+    if k * HEAP_FAKTOR <= len(seq):
+        return heapq.nsmallest(k, seq, key=key)
+    # Für großes k ist Timsort (in C) schneller als jede Auswahl in reinem Python
+    return sorted(seq, key=key)[:k]
+
+
+def select_k(seq, k):
+    # Liefert das k-kleinste Element (k = 0 ist das Minimum) in durchschnittlich O(n)
+    if not 0 <= k < len(seq):
+        raise IndexError("k liegt außerhalb der Sequenz")
+    kopie = list(seq)
+    _introselect(kopie, k)
+    return kopie[k]
+
+
+def _introselect(liste, k):
+    # Ordnet liste so um, dass liste[k] an seiner sortierten Position steht,
+    # links davon nur kleinere/gleiche und rechts nur größere/gleiche Elemente
+    links, rechts = 0, len(liste) - 1
+    # Budget für schlechte Pivots: danach Umschalten auf Median-of-Medians
+    budget = 2 * max(1, (rechts + 1).bit_length())
+    while links < rechts:
+        if budget > 0:
+            pivot = liste[random.randint(links, rechts)]
+        else:
+            pivot = _median_of_medians(liste, links, rechts)
+        # Drei-Wege-Partitionierung (kleiner | gleich | größer), robust bei vielen Duplikaten
+        anfang, ende = _partitioniere(liste, links, rechts, pivot)
+        # Schrumpft der Bereich um weniger als ein Viertel, war der Pivot schlecht
+        alte_groesse = rechts - links + 1
+        if k < anfang:
+            rechts = anfang - 1
+        elif k > ende:
+            links = ende + 1
+        else:
+            return
+        if (rechts - links + 1) * 4 > alte_groesse * 3:
+            budget -= 1
+
+
+def _partitioniere(liste, links, rechts, pivot):
+    # Dutch-National-Flag-Partitionierung: liefert Anfang und Ende des Gleich-Bereichs
+    kleiner, i, groesser = links, links, rechts
+    while i <= groesser:
+        if liste[i] < pivot:
+            liste[kleiner], liste[i] = liste[i], liste[kleiner]
+            kleiner += 1
+            i += 1
+        elif pivot < liste[i]:
+            liste[groesser], liste[i] = liste[i], liste[groesser]
+            groesser -= 1
+        else:
+            i += 1
+    return kleiner, groesser
+
+
+def _median_of_medians(liste, links, rechts):
+    # Garantiert guter Pivot: Median der Mediane von Fünfergruppen
+    mediane = [sorted(liste[i:min(i + 5, rechts + 1)])[(min(5, rechts + 1 - i) - 1) // 2]
+               for i in range(links, rechts + 1, 5)]
+    if len(mediane) <= 5:
+        return sorted(mediane)[(len(mediane) - 1) // 2]
+    return select_k(mediane, (len(mediane) - 1) // 2)
+
+
+if __name__ == "__main__":
+    # Kurzes Beispiel mit der Ausgangsliste aus selection_sort.py
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+    print("Unsortierte Liste:", input_list)
+    print("Die 5 kleinsten:", partial_sort(input_list, 5))
+    print("Median:", select_k(input_list, len(input_list) // 2))
+
+    # Benchmark gegen vollständiges Sortieren
+    n = 1_000_000
+    zahlen = [random.random() for _ in range(n)]
+    print(f"\n=== Benchmark mit {n} Elementen ===")
+    for k in (10, 1_000, 100_000):
+        messungen = [
+            ("sorted(seq)[:k]", lambda: sorted(zahlen)[:k]),
+            ("partial_sort", lambda: partial_sort(zahlen, k)),
+            ("streaming_top_k (Iterator)", lambda: streaming_top_k(iter(zahlen), k)),
+            ("select_k (nur k-tes Element)", lambda: select_k(zahlen, k - 1)),
+        ]
+        if k <= 10:
+            messungen.append(("Selection Sort, k Durchläufe", lambda: selection_sort_partiell(list(zahlen), k)))
+        print(f"\n--- k = {k} ---")
+        for name, funktion in messungen:
+            start = time.perf_counter()
+            funktion()
+            print(f"{name:<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
@@ -23,37 +23,80 @@ NACHTEILE:
 
 # TODO: Zeitmessung mittels Zeitstempel implementieren (z.B. mit time.time() vor/nach Sortierung)
 
-# Ausgangsliste mit Umsortieren Wortern definieren
-#input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
-
-# Ausgangsliste mit Umsortieren Ganzzahlen definieren
-input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
-
-# Zusätzliche eindeutige Werte ergänzen
-input_list += [17, 23, 1, 99, 7, 56]
-input_list += [34, 65, 12, 88, 3, 77]
-
-# Unsortierte Liste zur Kontrolle ausgeben
-print("Unsortierte Liste:", input_list)
-
-# Länge des "Arrays" bestimmen
-laenge = len(input_list)
-
-# Äußere Schleife: Durchläufe für jeden zu platzierenden Wert (-1, da letzter Wert automatisch sortiert ist)
-for i in range(laenge - 1):
-    # Index des aktuell kleinsten Elements annehmen
-    min_index = i
-    # Innere Schleife: Vergleiche benachbarte Elemente (Ende verkürzt sich mit jedem Durchlauf um bereits sortierte Elemente)
-    for j in range(i + 1, laenge):
-        # Prüfen, ob das aktuelle Element kleiner als das bisher kleinste gefundene ist
-        if input_list[j] < input_list[min_index]:
-            # Index des neuen kleinsten Elements merken
-            min_index = j
-    # Wenn ein neues Minimum gefunden wurde, tauschen wir es mit dem aktuellen Element an Position i
-    if min_index != i:
-        input_list[i], input_list[min_index] = input_list[min_index], input_list[i]
-    # Bisher sortierten Teil der Liste und den unsortierten Teil ausgeben
-    print(f"Durchlauf {i + 1}: {input_list[:i + 1]} | {input_list[i + 1:]}")
-
-# Sortierte Liste ausgeben
-print("Sortierte Liste:", input_list)
\ No newline at end of file
+from instrumentierung import DURCHLAUF, TAUSCH, VERGLEICH
+
+
+# protokoll: optionales SortierProtokoll aus instrumentierung.py (zählt bzw. zeichnet die Operationen auf)
+def selection_sort(input_list, protokoll=None):
+    if protokoll is not None:
+        return _selection_sort_protokoll(input_list, protokoll)
+    # Länge des "Arrays" bestimmen
+    laenge = len(input_list)
+
+    # Äußere Schleife: Durchläufe für jeden zu platzierenden Wert (-1, da letzter Wert automatisch sortiert ist)
+    for i in range(laenge - 1):
+        # Index des aktuell kleinsten Elements annehmen
+        min_index = i
+        # Innere Schleife: Vergleiche benachbarte Elemente (Ende verkürzt sich mit jedem Durchlauf um bereits sortierte Elemente)
+        for j in range(i + 1, laenge):
+            # Prüfen, ob das aktuelle Element kleiner als das bisher kleinste gefundene ist
+            if input_list[j] < input_list[min_index]:
+                # Index des neuen kleinsten Elements merken
+                min_index = j
+        # Wenn ein neues Minimum gefunden wurde, tauschen wir es mit dem aktuellen Element an Position i
+        if min_index != i:
+            input_list[i], input_list[min_index] = input_list[min_index], input_list[i]
+    return input_list
+
+
+# Gleiche Schleife mit Protokoll - eigene Funktion, damit die Variante ohne Protokoll unverändert schnell bleibt
+def _selection_sort_protokoll(input_list, protokoll):
+    laenge = len(input_list)
+    aufzeichnen = protokoll.aufzeichnen
+    notiere = protokoll.notiere
+    vergleiche = tausche = 0
+    for i in range(laenge - 1):
+        min_index = i
+        for j in range(i + 1, laenge):
+            vergleiche += 1
+            if aufzeichnen:
+                notiere(VERGLEICH, j, min_index)
+            if input_list[j] < input_list[min_index]:
+                min_index = j
+        if min_index != i:
+            input_list[i], input_list[min_index] = input_list[min_index], input_list[i]
+            tausche += 1
+            if aufzeichnen:
+                notiere(TAUSCH, i, min_index)
+        if aufzeichnen:
+            notiere(DURCHLAUF, i + 1)
+    protokoll.zaehle(vergleiche, tausche, durchlaeufe=max(0, laenge - 1))
+    return input_list
+
+
+if __name__ == "__main__":
+    from instrumentierung import SortierProtokoll, abspielen
+
+    # Ausgangsliste mit Umsortieren Wortern definieren
+    #input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
+
+    # Ausgangsliste mit Umsortieren Ganzzahlen definieren
+    input_list = [10, 2, 5, 4, 80, 43, 10, 2, 5, 4, 80, 43]
+
+    # Zusätzliche eindeutige Werte ergänzen
+    input_list += [17, 23, 1, 99, 7, 56]
+    input_list += [34, 65, 12, 88, 3, 77]
+
+    # Unsortierte Liste zur Kontrolle ausgeben
+    print("Unsortierte Liste:", input_list)
+
+    # Sortieren und dabei die Operationen aufzeichnen (während der Sortierung wird nichts formatiert)
+    protokoll = SortierProtokoll(aufzeichnen=True)
+    sortiert = selection_sort(list(input_list), protokoll)
+    # Bisher sortierten Teil der Liste und den unsortierten Teil nach jedem Durchlauf ausgeben
+    # (Durchlauf i hat die ersten i Positionen festgelegt)
+    for i, liste in abspielen(input_list, protokoll):
+        print(f"Durchlauf {i}: {liste[:i]} | {liste[i:]}")
+
+    # Sortierte Liste ausgeben
+    print("Sortierte Liste:", sortiert)
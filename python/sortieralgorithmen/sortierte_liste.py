@@ -0,0 +1,281 @@
+"""
+Inkrementell sortierte Liste (Online-Sortierung)
+================================================
+
+Dieser Code demonstriert einen Container, der seine Elemente beim Einfügen sofort sortiert hält.
+
+AUSGANGSLAGE:
+- Treffen Werte nacheinander ein (z.B. Ereignisse), wurde bisher nach jedem Einfügen die ganze Liste neu sortiert
+- Insertion Sort zeigt schon die bessere Idee: ein neues Element wird nur an die richtige Stelle des bereits
+  sortierten Bereichs eingefügt
+- Bei einer einzigen großen Liste kostet aber schon das Verschieben beim Einfügen O(n)
+
+FUNKTIONSWEISE (Liste aus sortierten Teillisten):
+- Die Elemente liegen in mehreren kurzen, sortierten Teillisten (je höchstens 2 * LAST Elemente)
+- `maxima` enthält das größte Element jeder Teilliste
+  -> Bisektion über `maxima` findet die richtige Teilliste, Bisektion in der Teilliste die Position
+  -> Einfügen/Entfernen verschiebt nur Elemente innerhalb einer kurzen Teilliste
+- Wird eine Teilliste zu lang, wird sie halbiert; wird sie leer, wird sie entfernt
+- Ein Fenwick-Baum (Binary Indexed Tree) über die Teillisten-Längen beantwortet
+  "Wie viele Elemente liegen vor Teilliste k?" in O(log m) -> Rang-Abfragen und Zugriff per Index
+
+LAUFZEIT (n Elemente, m = n / LAST Teillisten):
+- hinzufuegen / entfernen / rang / liste[i]: O(log n) (plus kurzes Verschieben innerhalb einer Teilliste)
+- bereich(von, bis): O(log n + Anzahl Treffer)
+- aus_sortierten(...): O(n) für bereits sortierte Eingaben
+"""
+
+import time
+from bisect import bisect_left, bisect_right, insort
+
+# Ziel-Länge einer Teilliste (maximal 2 * LAST, dann wird geteilt)
+LAST = 1000
+
+
+class SortierteListe:
+    """
+    Sortierte Liste mit O(log n) Einfügen, Entfernen und Rang-Abfragen.
+
+    Verwendung:
+        liste = SortierteListe([5, 1, 3])
+        liste.hinzufuegen(2)
+        liste.rang(3)          # -> 2 (Anzahl Elemente kleiner als 3)
+        list(liste.bereich(2, 4))  # -> [2, 3]
+    """
+
+    def __init__(self, werte=()):
+        # Teillisten und ihre Maxima (maxima[k] == listen[k][-1])
+        self.listen = []
+        self.maxima = []
+        self.laenge = 0
+        # Fenwick-Baum über die Längen der Teillisten (1-basiert)
+        self._baum = [0]
+        self.aktualisieren(werte)
+
+    @classmethod
+    def aus_sortierten(cls, werte):
+        """Erzeugt die Liste aus bereits aufsteigend sortierten Werten in O(n) (ohne Vergleiche)."""
+        liste = cls()
+        werte = list(werte)
+        liste.listen = [werte[i:i + LAST] for i in range(0, len(werte), LAST)]
+        liste.maxima = [teil[-1] for teil in liste.listen]
+        liste.laenge = len(werte)
+        liste._baue_baum()
+        return liste
+
+    def aktualisieren(self, werte):
+        """Fügt viele Werte auf einmal ein (einmal sortieren statt n-mal einzeln einfügen)."""
+        werte = list(werte)
+        if not werte:
+            return
+        # Bei großen Mengen ist komplettes Neuaufbauen günstiger als einzelnes Einfügen
+        if len(werte) * 4 >= self.laenge:
+            alle = [wert for teil in self.listen for wert in teil] + werte
+            alle.sort()
+            neu = SortierteListe.aus_sortierten(alle)
+            self.listen, self.maxima, self.laenge, self._baum = neu.listen, neu.maxima, neu.laenge, neu._baum
+        else:
+            for wert in werte:
+                self.hinzufuegen(wert)
+
+    # === Fenwick-Baum über die Teillisten-Längen ===
+
+    def _baue_baum(self):
+        # Baut den Fenwick-Baum in O(m) neu auf (nur nach Teilen/Entfernen von Teillisten)
+        baum = [0] + [len(teil) for teil in self.listen]
+        for i in range(1, len(baum)):
+            eltern = i + (i & -i)
+            if eltern < len(baum):
+                baum[eltern] += baum[i]
+        self._baum = baum
+
+    def _baum_addieren(self, k, delta):
+        # Länge der Teilliste k um delta ändern (O(log m))
+        i = k + 1
+        while i < len(self._baum):
+            self._baum[i] += delta
+            i += i & -i
+
+    def _vorher(self, k):
+        # Anzahl der Elemente in den Teillisten 0 .. k-1 (O(log m))
+        summe = 0
+        i = k
+        while i > 0:
+            summe += self._baum[i]
+            i -= i & -i
+        return summe
+
+    def _finde_position(self, index):
+        # Wandelt einen globalen Index in (Teilliste, Index in der Teilliste) um (Abstieg im Fenwick-Baum)
+        k = 0
+        schritt = 1 << (len(self._baum) - 1).bit_length()
+        while schritt:
+            naechster = k + schritt
+            if naechster < len(self._baum) and self._baum[naechster] <= index:
+                k = naechster
+                index -= self._baum[naechster]
+            schritt >>= 1
+        return k, index
+
+    # === Einfügen und Entfernen ===
+
+    def hinzufuegen(self, wert):
+        """Fügt einen Wert an der sortierten Position ein (hinter gleichen Werten)."""
+        if not self.listen:
+            self.listen.append([wert])
+            self.maxima.append(wert)
+            self.laenge = 1
+            self._baue_baum()
+            return
+        # Teilliste suchen, deren Maximum >= wert ist (sonst die letzte)
+        k = bisect_right(self.maxima, wert)
+        if k == len(self.maxima):
+            k -= 1
+            self.listen[k].append(wert)
+            self.maxima[k] = wert
+        else:
+            insort(self.listen[k], wert)
+        self.laenge += 1
+        self._baum_addieren(k, 1)
+        # Zu lange Teilliste halbieren
+        if len(self.listen[k]) > 2 * LAST:
+            teil = self.listen[k]
+            self.listen[k:k + 1] = [teil[:LAST], teil[LAST:]]
+            self.maxima[k:k + 1] = [teil[LAST - 1], teil[-1]]
+            self._baue_baum()
+
+    def entfernen(self, wert):
+        """Entfernt ein Vorkommen von wert; ValueError, wenn er nicht enthalten ist."""
+        k = bisect_left(self.maxima, wert)
+        if k == len(self.maxima):
+            raise ValueError(f"{wert!r} ist nicht in der Liste")
+        teil = self.listen[k]
+        i = bisect_left(teil, wert)
+        if teil[i] != wert:
+            raise ValueError(f"{wert!r} ist nicht in der Liste")
+        self._entferne_an(k, i)
+
+    def _entferne_an(self, k, i):
+        # Entfernt Element i aus Teilliste k und hält maxima/Fenwick-Baum aktuell
+        teil = self.listen[k]
+        del teil[i]
+        self.laenge -= 1
+        if teil:
+            self.maxima[k] = teil[-1]
+            self._baum_addieren(k, -1)
+        else:
+            # Leere Teilliste entfernen
+            del self.listen[k]
+            del self.maxima[k]
+            self._baue_baum()
+
+    def pop(self, index=-1):
+        """Entfernt das Element an Position index und gibt es zurück."""
+        k, i = self._finde_position(self._normalisiere(index))
+        wert = self.listen[k][i]
+        self._entferne_an(k, i)
+        return wert
+
+    # === Abfragen ===
+
+    def rang(self, wert):
+        """Anzahl der Elemente, die kleiner als wert sind (Position, an der wert stehen würde)."""
+        k = bisect_left(self.maxima, wert)
+        if k == len(self.maxima):
+            return self.laenge
+        return self._vorher(k) + bisect_left(self.listen[k], wert)
+
+    def bereich(self, von=None, bis=None):
+        """Liefert alle Werte mit von <= wert <= bis in sortierter Reihenfolge (ohne Kopie der Liste)."""
+        k = 0 if von is None else bisect_left(self.maxima, von)
+        i = 0 if von is None or k == len(self.listen) else bisect_left(self.listen[k], von)
+        while k < len(self.listen):
+            teil = self.listen[k]
+            # Ende innerhalb dieser Teilliste?
+            if bis is not None and teil[-1] > bis:
+                yield from teil[i:bisect_right(teil, bis)]
+                return
+            yield from teil[i:]
+            k += 1
+            i = 0
+
+    def _normalisiere(self, index):
+        # Negative Indizes umrechnen und Bereich prüfen
+        if index < 0:
+            index += self.laenge
+        if not 0 <= index < self.laenge:
+            raise IndexError("Index außerhalb der Liste")
+        return index
+
+    def __getitem__(self, index):
+        k, i = self._finde_position(self._normalisiere(index))
+        return self.listen[k][i]
+
+    def __len__(self):
+        return self.laenge
+
+    def __iter__(self):
+        for teil in self.listen:
+            yield from teil
+
+    def __contains__(self, wert):
+        k = bisect_left(self.maxima, wert)
+        if k == len(self.maxima):
+            return False
+        teil = self.listen[k]
+        i = bisect_left(teil, wert)
+        return teil[i] == wert
+
+    def __repr__(self):
+        return f"SortierteListe({list(self)})"
+
+
+if __name__ == "__main__":
+    import random
+
+    # Werte aus den Sortier-Skripten treffen nacheinander ein
+    input_list = [10, 2, 5, 4, 80, 43, 17, 23, 1, 99, 7, 56, 34, 65, 12, 88, 3, 77]
+    liste = SortierteListe()
+    for wert in input_list:
+        liste.hinzufuegen(wert)
+    print("Sortierte Liste:", liste)
+    print("Rang von 43:", liste.rang(43), "| Element an Index 5:", liste[5])
+    print("Bereich 10 bis 60:", list(liste.bereich(10, 60)))
+
+    # Benchmark: n Ereignisse nacheinander einfügen, nach jedem Einfügen ist die Liste sortiert
+    for n in (5_000, 200_000):
+        werte = [random.random() for _ in range(n)]
+        print(f"\n=== {n} Einfügungen ===")
+        if n <= 5_000:
+            start = time.perf_counter()
+            naiv = []
+            for wert in werte:
+                naiv.append(wert)
+                naiv.sort()
+            print(f"{'append + sort() pro Einfügen':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        start = time.perf_counter()
+        einfach = []
+        for wert in werte:
+            insort(einfach, wert)
+        print(f"{'insort in eine Liste':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        start = time.perf_counter()
+        liste = SortierteListe()
+        for wert in werte:
+            liste.hinzufuegen(wert)
+        print(f"{'SortierteListe.hinzufuegen':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        assert list(liste) == sorted(werte)
+
+        # Rang-Abfragen und Entfernen
+        start = time.perf_counter()
+        for wert in werte[:10_000]:
+            liste.rang(wert)
+        print(f"{'10.000 x rang()':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        start = time.perf_counter()
+        for wert in werte[:n // 2]:
+            liste.entfernen(wert)
+        print(f"{f'{n // 2} x entfernen()':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        # Bulk-Load aus vorsortierten Daten
+        start = time.perf_counter()
+        SortierteListe.aus_sortierten(sorted(werte))
+        print(f"{'aus_sortierten (inkl. sorted)':<32} {(time.perf_counter() - start) * 1000:9.2f} ms")
@@ -0,0 +1,260 @@
+"""
+Sortierung von Wörtern (Strings) mit Sortierschlüssel-Cache
+===========================================================
+
+Dieser Code demonstriert, wie deutsche Wörter korrekt UND schnell sortiert werden.
+
+PROBLEM MIT input_list = ["Banane", "Apfel", ...] UND `>`:
+- `>` vergleicht Unicode-Codepunkte: "Zebra" < "apfel" (Großbuchstaben vor Kleinbuchstaben)
+  und "Äpfel" landet hinter "Zucker" (Ä hat einen höheren Codepunkt als Z)
+- Eine korrekte Vergleichsfunktion (locale.strcoll) ist teuer und wird bei O(n log n) Vergleichen
+  für jedes Wort viele Male aufgerufen
+
+LÖSUNG:
+1. Sortierschlüssel einmal pro Wort berechnen und zwischenspeichern (SchluesselCache)
+   -> locale.strxfrm liefert einen Schlüssel, dessen einfacher Vergleich der Kollation entspricht
+      (nur wenn vorher ausdrücklich aktiviere_deutsche_locale() aufgerufen wurde - setlocale gilt für den
+      ganzen Prozess und wird daher nie nebenbei geändert)
+   -> Sonst wird ein Schlüssel nach DIN 5007 gebildet: Akzente und Umlaute werden entfernt
+      (ä -> a, é -> e, ß -> ss), Groß-/Kleinschreibung und Akzente nur als Nebenkriterium
+   -> Gleiche Wörter (häufig bei großen Datenmengen) teilen sich denselben Schlüssel
+2. Für große Mengen: String-spezifische Verfahren, die Zeichen statt ganzer Strings vergleichen
+   -> MSD Radix Sort: verteilt nach dem i-ten Zeichen in Eimer und sortiert jeden Eimer nach Zeichen i+1
+   -> Multikey Quicksort (Bentley/Sedgewick): Drei-Wege-Quicksort auf dem i-ten Zeichen
+   -> Gemeinsame Präfixe werden nur einmal betrachtet statt bei jedem Vergleich erneut
+
+STABILITÄT:
+- sortiere_woerter und msd_radix_sort sind stabil, multikey_quicksort nicht
+
+HINWEIS ZUR LAUFZEIT:
+- In reinem Python ist Timsort (in C) mit gecachten Schlüsseln meist schneller als Radix Sort/Multikey Quicksort,
+  weil dort jedes Zeichen in einer Python-Schleife angefasst wird
+- Die String-Verfahren lohnen sich bei sehr langen gemeinsamen Präfixen oder als Vorlage für C#/kompilierte Sprachen
+"""
+
+import locale
+import random
+import time
+import unicodedata
+from functools import cmp_to_key
+
+# Deutsche Locales, die der Reihe nach versucht werden
+DEUTSCHE_LOCALES = ("de_DE.UTF-8", "de_DE.utf8", "de_DE", "German_Germany.1252")
+
+# Eimer mit weniger Elementen werden per Insertion Sort statt weiter per Radix Sort sortiert
+RADIX_GRENZE = 32
+
+
+def aktiviere_deutsche_locale():
+    # Versucht, eine deutsche Kollation zu aktivieren (ACHTUNG: gilt für den ganzen Prozess)
+    # Gibt die bisherige Einstellung zurück (für locale.setlocale(locale.LC_COLLATE, bisher)),
+    # oder None, wenn keine deutsche Locale installiert ist
+    bisher = locale.setlocale(locale.LC_COLLATE)
+    for name in DEUTSCHE_LOCALES:
+        try:
+            locale.setlocale(locale.LC_COLLATE, name)
+            return bisher
+        except locale.Error:
+            continue
+    return None
+
+
+def _deutsche_locale_aktiv():
+    # Fragt die aktive Kollation nur ab (setlocale ohne zweiten Parameter ändert nichts)
+    return locale.setlocale(locale.LC_COLLATE).startswith(("de_", "German"))
+
+
+def din_5007_schluessel(wort):
+    # Sortierschlüssel ohne Locale (DIN 5007 Variante 1): zuerst nach Grundbuchstaben, bei Gleichstand
+    # nach Schreibweise. NFD zerlegt "ä"/"é" in Grundbuchstabe + Akzent, die Akzente werden entfernt;
+    # casefold() macht aus "ß" "ss"
+    zerlegt = unicodedata.normalize("NFD", wort)
+    basis = "".join(zeichen for zeichen in zerlegt if not unicodedata.combining(zeichen)).casefold()
+    # Trennzeichen \x00 stellt sicher, dass "ab" vor "abc" sortiert
+    return basis + "\x00" + wort
+
+
+class SchluesselCache:
+    """
+    Berechnet Sortierschlüssel einmal pro unterschiedlichem Wort und speichert sie.
+
+    Verwendung:
+        cache = SchluesselCache()
+        sorted(woerter, key=cache)
+    """
+
+    def __init__(self, schluessel_funktion=None):
+        # Standard: Kollation der Locale, falls eine deutsche aktiviert wurde, sonst DIN 5007
+        if schluessel_funktion is None:
+            schluessel_funktion = locale.strxfrm if _deutsche_locale_aktiv() else din_5007_schluessel
+        self.schluessel_funktion = schluessel_funktion
+        self.cache = {}
+
+    def __call__(self, wort):
+        # Schlüssel aus dem Cache holen oder einmalig berechnen
+        schluessel = self.cache.get(wort)
+        if schluessel is None:
+            schluessel = self.cache[wort] = self.schluessel_funktion(wort)
+        return schluessel
+
+
+def sortiere_woerter(woerter, cache=None, verfahren="timsort"):
+    """
+    Sortiert Wörter stabil nach ihrer Kollation.
+
+    Args:
+        woerter: Liste von Strings
+        cache (SchluesselCache): wird über mehrere Aufrufe wiederverwendet, wenn übergeben
+        verfahren (str): "timsort", "radix" oder "multikey"
+    """
+    cache = cache or SchluesselCache()
+    if verfahren == "timsort":
+        return sorted(woerter, key=cache)
+    # Decorate: Paare (Schlüssel, Wort) - die String-Verfahren vergleichen nur den Schlüssel
+    paare = [(cache(wort), wort) for wort in woerter]
+    if verfahren == "radix":
+        msd_radix_sort(paare)
+    elif verfahren == "multikey":
+        multikey_quicksort(paare)
+    else:
+        raise ValueError(f"Unbekanntes Verfahren: {verfahren}")
+    # Undecorate
+    return [wort for _, wort in paare]
+
+
+def _zeichen(paar, tiefe):
+    # Zeichencode an Position tiefe, -1 hinter dem Ende (kürzere Strings zuerst)
+    schluessel = paar[0]
+    return ord(schluessel[tiefe]) if tiefe < len(schluessel) else -1
+
+
+def _insertion_sort_ab(paare, start, ende, tiefe):
+    # Insertion Sort für kleine Bereiche, vergleicht erst ab Position tiefe (Präfix ist gleich)
+    for i in range(start + 1, ende):
+        paar = paare[i]
+        rest = paar[0][tiefe:]
+        j = i - 1
+        while j >= start and paare[j][0][tiefe:] > rest:
+            paare[j + 1] = paare[j]
+            j -= 1
+        paare[j + 1] = paar
+
+
+def msd_radix_sort(paare):
+    """Sortiert eine Liste von (schluessel, wert)-Paaren stabil nach dem Schlüssel-String."""
+    # Expliziter Stapel statt Rekursion: (start, ende, tiefe)
+    stapel = [(0, len(paare), 0)]
+    while stapel:
+        start, ende, tiefe = stapel.pop()
+        if ende - start < RADIX_GRENZE:
+            _insertion_sort_ab(paare, start, ende, tiefe)
+            continue
+        # Elemente nach dem Zeichen an Position tiefe auf Eimer verteilen (stabil)
+        eimer = {}
+        for i in range(start, ende):
+            eimer.setdefault(_zeichen(paare[i], tiefe), []).append(paare[i])
+        # Eimer in Zeichenreihenfolge zurückschreiben
+        position = start
+        for zeichen in sorted(eimer):
+            inhalt = eimer[zeichen]
+            paare[position:position + len(inhalt)] = inhalt
+            # Eimer ab dem nächsten Zeichen weitersortieren (außer: String zu Ende -> alle gleich)
+            if zeichen != -1 and len(inhalt) > 1:
+                stapel.append((position, position + len(inhalt), tiefe + 1))
+            position += len(inhalt)
+    return paare
+
+
+def multikey_quicksort(paare):
+    """Sortiert eine Liste von (schluessel, wert)-Paaren nach dem Schlüssel-String (nicht stabil)."""
+    stapel = [(0, len(paare), 0)]
+    while stapel:
+        start, ende, tiefe = stapel.pop()
+        if ende - start < RADIX_GRENZE:
+            _insertion_sort_ab(paare, start, ende, tiefe)
+            continue
+        # Pivot-Zeichen eines zufälligen Elements
+        pivot = _zeichen(paare[random.randrange(start, ende)], tiefe)
+        # Drei-Wege-Partitionierung nach dem Zeichen an Position tiefe
+        kleiner, i, groesser = start, start, ende - 1
+        while i <= groesser:
+            zeichen = _zeichen(paare[i], tiefe)
+            if zeichen < pivot:
+                paare[kleiner], paare[i] = paare[i], paare[kleiner]
+                kleiner += 1
+                i += 1
+            elif zeichen > pivot:
+                paare[groesser], paare[i] = paare[i], paare[groesser]
+                groesser -= 1
+            else:
+                i += 1
+        # Kleiner- und Größer-Bereich auf gleicher Tiefe, Gleich-Bereich ein Zeichen tiefer
+        stapel.append((start, kleiner, tiefe))
+        stapel.append((groesser + 1, ende, tiefe))
+        if pivot != -1:
+            stapel.append((kleiner, groesser + 1, tiefe + 1))
+    return paare
+
+
+def insertion_sort(input_list, key=None):
+    # Insertion Sort aus insertion_sort.py, optional mit Vergleichsfunktion - Vergleichsbasis
+    for i in range(1, len(input_list)):
+        wert = input_list[i]
+        j = i - 1
+        while j >= 0 and (input_list[j] > wert if key is None else key(input_list[j]) > key(wert)):
+            input_list[j + 1] = input_list[j]
+            j -= 1
+        input_list[j + 1] = wert
+    return input_list
+
+
+if __name__ == "__main__":
+    # Ausgangsliste aus den Sortier-Skripten, ergänzt um Umlaute und Kleinschreibung
+    input_list = ["Banane", "Apfel", "Orange", "Mango", "Birne", "Kirsche"]
+    input_list += ["Äpfel", "Zucker", "apfel", "Öl", "Übung", "Straße", "Strasse", "Éclair", "Zebra"]
+    print("Unsortierte Liste:", input_list)
+    print("Mit `>`:          ", insertion_sort(list(input_list)))
+    print("DIN 5007:         ", sortiere_woerter(input_list, SchluesselCache(din_5007_schluessel)))
+    # Die Locale wird nur hier im Skript ausdrücklich umgestellt, nicht beim Import oder in SchluesselCache
+    bisherige_locale = aktiviere_deutsche_locale()
+    cache = SchluesselCache()
+    print("Mit Kollation:    ", sortiere_woerter(input_list, cache))
+    print("Schlüssel:", "locale.strxfrm" if cache.schluessel_funktion is locale.strxfrm else "DIN 5007")
+
+    # Benchmark: 200.000 Wörter aus einem Vokabular von 20.000 Wörtern mit gemeinsamen Präfixen
+    buchstaben = "abcdefghijklmnopqrstuvwxyzäöüß"
+    praefixe = ["Sonnen", "Wasser", "Haus", "Straßen", "Über", "Äpfel"]
+    vokabular = [random.choice(praefixe) + "".join(random.choices(buchstaben, k=random.randint(3, 10)))
+                 for _ in range(20_000)]
+    woerter = random.choices(vokabular, k=200_000)
+    # Vergleich ohne Schlüssel: locale.strcoll bzw. DIN-5007-Schlüssel bei jedem Vergleich neu berechnet
+    if cache.schluessel_funktion is locale.strxfrm:
+        vergleich = cmp_to_key(locale.strcoll)
+    else:
+        vergleich = cmp_to_key(lambda a, b: (din_5007_schluessel(a) > din_5007_schluessel(b))
+                               - (din_5007_schluessel(a) < din_5007_schluessel(b)))
+    erwartet = sorted(woerter, key=SchluesselCache(cache.schluessel_funktion))
+
+    print(f"\n=== Benchmark mit {len(woerter)} Wörtern ===")
+    messungen = [
+        ("sorted() mit `>` (falsche Reihenfolge)", lambda: sorted(woerter), False),
+        # Nur ein Zehntel der Wörter, sonst dauert diese Messung allein über eine halbe Minute
+        ("Vergleichsfunktion pro Vergleich (1/10)", lambda: sorted(woerter[:len(woerter) // 10], key=vergleich),
+         False),
+        ("Schlüssel ohne Cache", lambda: sorted(woerter, key=cache.schluessel_funktion), True),
+        ("Schlüssel-Cache (neu)", lambda: sortiere_woerter(woerter), True),
+        ("Schlüssel-Cache (wiederverwendet)", lambda: sortiere_woerter(woerter, cache), True),
+        ("MSD Radix Sort", lambda: sortiere_woerter(woerter, cache, "radix"), True),
+        ("Multikey Quicksort", lambda: sortiere_woerter(woerter, cache, "multikey"), False),
+    ]
+    for name, funktion, stabil_pruefen in messungen:
+        start = time.perf_counter()
+        ergebnis = funktion()
+        dauer = time.perf_counter() - start
+        if stabil_pruefen:
+            assert ergebnis == erwartet, name
+        print(f"{name:<42} {dauer * 1000:9.2f} ms")
+
+    # Ursprüngliche Kollation wiederherstellen
+    if bisherige_locale is not None:
+        locale.setlocale(locale.LC_COLLATE, bisherige_locale)